@@ -0,0 +1,120 @@
+"""Bytes on the wire for the web dashboard, with and without compression.
+
+Serves the real aiohttp app from create_web_app() against a scratch Postgres
+and counts response body bytes exactly as sent (no client-side
+decompression) for:
+
+    first visit   /stats plus every /static asset it references
+    repeat visit  /stats again; the immutable assets come from the browser cache
+    poll cycle    the three /api endpoints the page polls, conditional on the
+                  ETags it already holds (304 when nothing changed)
+    changed poll  the same after a roll, so /api/stats and /api/users change
+
+    BENCH_DATABASE_URL=postgresql://localhost/bench python benchmarks/bench_dashboard_bytes.py --users 30
+
+The target database is modified; do not point this at production.
+"""
+
+import argparse
+import asyncio
+import base64
+import os
+import re
+import sys
+
+from aiohttp.test_utils import TestClient, TestServer
+
+from fakes import import_bot
+
+DATABASE_URL = os.getenv('BENCH_DATABASE_URL')
+if not DATABASE_URL:
+    sys.exit("Set BENCH_DATABASE_URL to a scratch Postgres database")
+
+main = import_bot(DATABASE_URL)
+BASE_USER_ID = 9_300_000_000
+API_PATHS = ('/api/stats', '/api/users', '/api/rarity')
+ASSET_URL = re.compile(r'(?:href|src)="(/static/[^"]+)"')
+
+
+def reset():
+    conn = main.get_db_connection()
+    cur = conn.cursor()
+    for table in ('user_fruit_counts', 'user_rarity_counts', 'rolls', 'command_usage', 'users'):
+        cur.execute(f'DELETE FROM {table} WHERE user_id BETWEEN %s AND %s', (BASE_USER_ID, BASE_USER_ID + 10_000_000))
+    conn.commit()
+    cur.close()
+    main.return_db_connection(conn)
+    main.user_cache = main.UserCache()
+    main.invalidate_page_snapshots()
+
+
+async def fetch(client, path, headers):
+    response = await client.get(path, headers=headers)
+    body = await response.read()
+    return response, len(body)
+
+
+async def measure(client, auth, encoding, roller):
+    headers = {**auth, 'Accept-Encoding': encoding}
+    page, _ = await fetch(client, '/stats', {**auth, 'Accept-Encoding': 'identity'})
+    asset_urls = ASSET_URL.findall(await page.text())
+
+    _, page_bytes = await fetch(client, '/stats', headers)
+    asset_bytes = 0
+    for url in asset_urls:
+        asset_bytes += (await fetch(client, url, headers))[1]
+
+    etags = {}
+    for path in API_PATHS:
+        response, _ = await fetch(client, path, headers)
+        etags[path] = response.headers['ETag']
+
+    async def poll():
+        total = 0
+        for path in API_PATHS:
+            response, size = await fetch(client, path, {**headers, 'If-None-Match': etags[path]})
+            etags[path] = response.headers.get('ETag', etags[path])
+            total += size
+        return total
+
+    unchanged = await poll()
+    main.log_roll(roller, f"bench-{roller}", main.FRUITS[0])
+    main.invalidate_page_snapshots()
+    changed = await poll()
+    return {
+        'first visit': page_bytes + asset_bytes,
+        'repeat visit': page_bytes,
+        'poll cycle': unchanged,
+        'changed poll': changed,
+    }
+
+
+async def run(args):
+    main.init_database()
+    main.command_usage_buffer.start()
+    reset()
+    try:
+        for i in range(args.users):
+            main.log_roll(BASE_USER_ID + i, f"bench-{i}", main.FRUITS[i % len(main.FRUITS)])
+        main.event_broadcaster.start()
+        credentials = base64.b64encode(f"{main.STATS_USER}:{main.STATS_PASS}".encode()).decode()
+        auth = {'Authorization': f'Basic {credentials}'}
+
+        encodings = ['identity', 'gzip'] + (['br'] if main.brotli is not None else [])
+        async with TestClient(TestServer(main.create_web_app()), auto_decompress=False) as client:
+            # Each encoding's changed poll rolls as a new user so the cooldown never blocks it
+            results = {encoding: await measure(client, auth, encoding, BASE_USER_ID + args.users + n)
+                       for n, encoding in enumerate(encodings)}
+
+        print(f"{'':>14}" + ''.join(f"{encoding:>12}" for encoding in encodings))
+        for row in results['identity']:
+            print(f"{row:>14}" + ''.join(f"{results[encoding][row]:>11}B" for encoding in encodings))
+    finally:
+        await main.command_usage_buffer.close()
+        reset()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--users', type=int, default=30, help='users shown on the dashboard')
+    asyncio.run(run(parser.parse_args()))
@@ -0,0 +1,69 @@
+"""Interactions per second with injected database latency.
+
+Drives the real ``/sleep`` command callback (three DB round trips plus two
+commits) concurrently, once with the helpers run inline on the event loop
+(the old behaviour) and once through ``run_db``. A probe coroutine records
+how long the loop was unable to run, which is what starves the gateway
+heartbeat.
+
+    python benchmarks/bench_db_event_loop.py --latency 0.05 --interactions 200
+"""
+
+import argparse
+import asyncio
+import time
+
+from fakes import FakeInteraction, FakeLatencyPool, import_bot
+
+main = import_bot()
+
+
+async def run_inline(func, *args, **kwargs):
+    return func(*args, **kwargs)
+
+
+async def loop_probe(stop: asyncio.Event, gaps: list, interval: float = 0.01):
+    last = time.perf_counter()
+    while not stop.is_set():
+        await asyncio.sleep(interval)
+        now = time.perf_counter()
+        gaps.append(now - last - interval)
+        last = now
+
+
+async def run_case(mode: str, interactions: int, concurrency: int):
+    main.run_db = run_inline if mode == 'inline' else original_run_db
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(i):
+        async with semaphore:
+            await main.sleep_mode.callback(FakeInteraction(i))
+
+    stop = asyncio.Event()
+    gaps = []
+    probe = asyncio.create_task(loop_probe(stop, gaps))
+    start = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(interactions)))
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await probe
+    return interactions / elapsed, max(gaps, default=0.0)
+
+
+async def run(args):
+    main.db_pool = FakeLatencyPool(args.latency)
+    print(f"latency={args.latency * 1000:.0f}ms interactions={args.interactions} "
+          f"concurrency={args.concurrency} workers={main.DB_EXECUTOR_WORKERS}")
+    for mode in ('inline', 'executor'):
+        rate, worst_gap = await run_case(mode, args.interactions, args.concurrency)
+        print(f"{mode:>8}: {rate:8.1f} interactions/s | worst event loop stall {worst_gap * 1000:8.1f}ms")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--latency', type=float, default=0.05, help='seconds added to every query and commit')
+    parser.add_argument('--interactions', type=int, default=200)
+    parser.add_argument('--concurrency', type=int, default=50)
+    args = parser.parse_args()
+    original_run_db = main.run_db
+    asyncio.run(run(args))
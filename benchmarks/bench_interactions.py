@@ -0,0 +1,239 @@
+"""Latency and throughput of the bot's interaction paths, without Discord.
+
+Drives the real /fruit-roll, /fruits and /sleep callbacks, a FruitSelectionView
+button and notification_checker through the stub objects in fakes.py against a
+scratch Postgres, and reports p50/p95/p99 latency and throughput per path.
+Results are compared with benchmarks/baseline.json so regressions stand out;
+--save-baseline rewrites it after an intentional change.
+
+    BENCH_DATABASE_URL=postgresql://localhost/bench python benchmarks/bench_interactions.py
+
+The target database is modified; do not point this at production.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+
+from psycopg2.extras import execute_values
+
+from fakes import FakeChannel, FakeInteraction, import_bot
+
+DATABASE_URL = os.getenv('BENCH_DATABASE_URL')
+if not DATABASE_URL:
+    sys.exit("Set BENCH_DATABASE_URL to a scratch Postgres database")
+
+main = import_bot(DATABASE_URL)
+BASE_USER_ID = 9_100_000_000
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+HISTORY_ROLLS_PER_USER = 100
+REMINDERS_PER_CYCLE = 10
+
+
+def execute(sql, params=None, rows=None):
+    conn = main.get_db_connection()
+    cur = conn.cursor()
+    if rows is not None:
+        execute_values(cur, sql, rows)
+    else:
+        cur.execute(sql, params)
+    conn.commit()
+    cur.close()
+    main.return_db_connection(conn)
+
+
+def reset():
+    low, high = BASE_USER_ID, BASE_USER_ID + 10_000_000
+    for table in ('user_fruit_counts', 'user_rarity_counts', 'rolls', 'command_usage', 'users'):
+        execute(f'DELETE FROM {table} WHERE user_id BETWEEN %s AND %s', (low, high))
+    main.user_cache = main.UserCache()
+    main.reminder_scheduler = main.ReminderScheduler()
+
+
+def seed_users(user_ids, next_roll_time=None):
+    execute('INSERT INTO users (user_id, username, next_roll_time) VALUES %s',
+            rows=[(user_id, f"bench-{user_id}", next_roll_time) for user_id in user_ids])
+
+
+def seed_history(user_ids):
+    now = datetime.now(timezone.utc)
+    fruits = main.FRUITS
+    rows = [(user_id, fruits[i % len(fruits)], main.FRUITS_DATA[fruits[i % len(fruits)]]['rarity'],
+             now - timedelta(hours=2 * i))
+            for user_id in user_ids for i in range(HISTORY_ROLLS_PER_USER)]
+    execute('INSERT INTO rolls (user_id, fruit_name, fruit_rarity, rolled_at) VALUES %s', rows=rows)
+    conn = main.get_db_connection()
+    cur = conn.cursor()
+    main._rebuild_roll_counters(cur)
+    conn.commit()
+    cur.close()
+    main.return_db_connection(conn)
+
+
+def percentile(sorted_ms, q):
+    return sorted_ms[min(len(sorted_ms) - 1, int(q * len(sorted_ms)))]
+
+
+async def measure(op, args_list, concurrency):
+    """Run ``op(*args)`` for every entry with bounded concurrency; time each call"""
+    semaphore = asyncio.Semaphore(concurrency)
+    timings = []
+
+    async def one(args):
+        async with semaphore:
+            start = time.perf_counter()
+            await op(*args)
+            timings.append((time.perf_counter() - start) * 1000)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one(args) for args in args_list))
+    elapsed = time.perf_counter() - start
+    timings.sort()
+    return {
+        'p50_ms': round(percentile(timings, 0.50), 3),
+        'p95_ms': round(percentile(timings, 0.95), 3),
+        'p99_ms': round(percentile(timings, 0.99), 3),
+        'throughput_per_s': round(len(timings) / elapsed, 1),
+    }
+
+
+async def bench_fruit_roll(samples, concurrency, next_id):
+    user_ids = [next_id() for _ in range(samples)]
+    seed_users(user_ids)
+    return await measure(lambda uid: main.fruit_roll.callback(FakeInteraction(uid)),
+                         [(uid,) for uid in user_ids], concurrency)
+
+
+async def bench_fruit_button(samples, concurrency, next_id):
+    user_ids = [next_id() for _ in range(samples)]
+    seed_users(user_ids)
+    channel = FakeChannel()
+
+    async def click(uid):
+        view = main.FruitSelectionView(uid, main.FRUITS[:20], 'bench', 1, 1)
+        await view.children[0].callback(FakeInteraction(uid, channel=channel))
+
+    return await measure(click, [(uid,) for uid in user_ids], concurrency)
+
+
+async def bench_fruits(samples, concurrency, next_id):
+    user_ids = [next_id() for _ in range(min(samples, 50))]
+    seed_users(user_ids)
+    seed_history(user_ids)
+    return await measure(lambda uid: main.fruits.callback(FakeInteraction(uid)),
+                         [(user_ids[i % len(user_ids)],) for i in range(samples)], concurrency)
+
+
+async def bench_sleep(samples, concurrency, next_id):
+    user_ids = [next_id() for _ in range(samples)]
+    seed_users(user_ids)
+    return await measure(lambda uid: main.sleep_mode.callback(FakeInteraction(uid)),
+                         [(uid,) for uid in user_ids], concurrency)
+
+
+async def bench_notification_cycle(samples, concurrency, next_id):
+    # Claim anything already due in the scratch database so it doesn't land in the first cycle
+    main.claim_due_reminders(datetime.now(timezone.utc))
+    cycles = max(1, samples // REMINDERS_PER_CYCLE)
+    due = datetime.now(timezone.utc) - timedelta(minutes=1)
+    batches = [[next_id() for _ in range(REMINDERS_PER_CYCLE)] for _ in range(cycles)]
+    seed_users([uid for batch in batches for uid in batch], next_roll_time=due)
+    channel = FakeChannel()
+    main.bot.get_channel = lambda channel_id: channel
+
+    async def cycle(batch):
+        for uid in batch:
+            main.reminder_scheduler.schedule(uid, due)
+        await main.notification_checker.coro()
+        await main.reminder_workers.join()
+
+    # Cycles share the scheduler and claim query, so they run one at a time
+    result = await measure(cycle, [(batch,) for batch in batches], 1)
+    # Reminders due together share a message, so count mentions rather than sends
+    sent = sum((content or '').count('<@') for content, _ in channel.sent)
+    if sent != cycles * REMINDERS_PER_CYCLE:
+        print(f"warning: expected {cycles * REMINDERS_PER_CYCLE} reminders, sent {sent}", file=sys.stderr)
+    return result
+
+
+PATHS = {
+    'fruit-roll': bench_fruit_roll,
+    'fruit-button': bench_fruit_button,
+    'fruits': bench_fruits,
+    'sleep': bench_sleep,
+    f'notification-cycle ({REMINDERS_PER_CYCLE} reminders)': bench_notification_cycle,
+}
+
+
+def compare(results, baseline, tolerance):
+    """Paths whose p95 or throughput moved past ``tolerance`` in the wrong direction"""
+    regressions = []
+    for path, result in results.items():
+        before = baseline.get('results', {}).get(path)
+        if not before:
+            continue
+        if result['p95_ms'] > before['p95_ms'] * (1 + tolerance):
+            regressions.append(f"{path}: p95 {before['p95_ms']}ms -> {result['p95_ms']}ms")
+        if result['throughput_per_s'] < before['throughput_per_s'] * (1 - tolerance):
+            regressions.append(f"{path}: throughput {before['throughput_per_s']}/s -> {result['throughput_per_s']}/s")
+    return regressions
+
+
+async def run(args):
+    main.init_database()
+    main.command_usage_buffer.start()
+    main.reminder_workers.start()
+    counter = iter(range(BASE_USER_ID, BASE_USER_ID + 10_000_000))
+    results = {}
+    try:
+        for path, bench in PATHS.items():
+            reset()
+            results[path] = await bench(args.samples, args.concurrency, lambda: next(counter))
+            r = results[path]
+            print(f"{path:>36}: p50 {r['p50_ms']:7.2f}ms | p95 {r['p95_ms']:7.2f}ms | "
+                  f"p99 {r['p99_ms']:7.2f}ms | {r['throughput_per_s']:8.1f}/s")
+    finally:
+        await main.reminder_workers.close()
+        await main.command_usage_buffer.close()
+        reset()
+    return results
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--samples', type=int, default=200, help='operations per path')
+    parser.add_argument('--concurrency', type=int, default=10)
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help='allowed p95/throughput change vs the baseline before it counts as a regression')
+    parser.add_argument('--save-baseline', action='store_true', help=f'write results to {BASELINE_PATH}')
+    parser.add_argument('--check', action='store_true', help='exit non-zero if any path regressed')
+    args = parser.parse_args()
+
+    print(f"samples={args.samples} concurrency={args.concurrency} workers={main.DB_EXECUTOR_WORKERS}")
+    results = asyncio.run(run(args))
+
+    if args.save_baseline:
+        with open(BASELINE_PATH, 'w') as f:
+            json.dump({
+                'recorded_at': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+                'python': platform.python_version(),
+                'samples': args.samples,
+                'concurrency': args.concurrency,
+                'results': results,
+            }, f, indent=2)
+            f.write('\n')
+        print(f"baseline written to {BASELINE_PATH}")
+    elif os.path.exists(BASELINE_PATH):
+        with open(BASELINE_PATH) as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if not regressions:
+            print(f"no regressions vs baseline (tolerance {args.tolerance:.0%})")
+        if regressions and args.check:
+            sys.exit(1)
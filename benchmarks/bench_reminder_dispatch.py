@@ -0,0 +1,91 @@
+"""Reminder delivery delay and checker cycle time when many cooldowns expire at once.
+
+Hands N due reminders to the real ReminderDispatcher and ReminderWorkerPool
+and sends them to channels that enforce Discord's per-channel message limit
+(5 messages per 5 seconds), once with one message per user (the old
+behaviour) and once batched. Reports messages sent, how long the checker
+spent queueing them, and how late each reminder was delivered. No database
+or Discord connection is needed.
+
+    python benchmarks/bench_reminder_dispatch.py --users 10,50,200 --channels 1,4
+
+--scale shrinks the rate-limit window (and so the delays) to keep runs short;
+delays are reported scaled back up to real seconds. The checker time is the
+wall-clock time spent queueing, which stays flat until the delivery queue fills
+and backpressure makes the checker wait.
+"""
+
+import argparse
+import asyncio
+import time
+from datetime import datetime, timezone
+
+from fakes import RateLimitedChannel, import_bot
+
+main = import_bot()
+BASE_USER_ID = 9_400_000_000
+
+
+class TimedChannel(RateLimitedChannel):
+    """Records when each mentioned user's reminder was accepted"""
+
+    def __init__(self, delivered: list, **kwargs):
+        super().__init__(**kwargs)
+        self.delivered = delivered
+
+    async def send(self, content=None, **kwargs):
+        await super().send(content, **kwargs)
+        self.delivered.extend([datetime.now(timezone.utc)] * (content or '').count('<@'))
+
+
+def percentile(sorted_values, q):
+    return sorted_values[min(len(sorted_values) - 1, int(q * len(sorted_values)))] if sorted_values else 0.0
+
+
+async def run_case(users: int, channels: int, max_mentions: int, args):
+    delivered = []
+    destinations = [TimedChannel(delivered, channel_id=i, per=5.0 * args.scale, latency=args.latency * args.scale)
+                    for i in range(channels)]
+    due = datetime.now(timezone.utc)
+    reminders = [{'user_id': BASE_USER_ID + i, 'username': f"bench-{i}", 'next_roll_time': due}
+                 for i in range(users)]
+    dispatcher = main.ReminderDispatcher(max_mentions)
+    pool = main.ReminderWorkerPool(dispatcher, workers=args.workers)
+    pool.start()
+
+    # What notification_checker does after claiming: build messages and queue them
+    start = time.perf_counter()
+    per_channel = (users + channels - 1) // channels
+    messages = 0
+    for n, channel in enumerate(destinations):
+        for message in dispatcher.build_messages(reminders[n * per_channel:(n + 1) * per_channel]):
+            await pool.enqueue(channel, message)
+            messages += 1
+    cycle = time.perf_counter() - start
+
+    await pool.join()
+    await pool.close()
+    delays = sorted((at - due).total_seconds() / args.scale for at in delivered)
+    return messages, cycle, delays
+
+
+async def run(args):
+    for channels in args.channels:
+        for users in args.users:
+            for label, max_mentions in (('per-user', 1), ('batched', main.REMINDER_MAX_MENTIONS)):
+                messages, cycle, delays = await run_case(users, channels, max_mentions, args)
+                print(f"channels={channels} users={users:>5} {label:>8}: {messages:>4} messages | "
+                      f"checker {cycle * 1000:7.1f}ms | delay p50 {percentile(delays, 0.50):7.2f}s "
+                      f"p95 {percentile(delays, 0.95):7.2f}s max {delays[-1] if delays else 0.0:7.2f}s")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--users', type=lambda value: [int(n) for n in value.split(',')],
+                        default=[10, 50, 200], help='comma-separated counts of reminders due at once')
+    parser.add_argument('--channels', type=lambda value: [int(n) for n in value.split(',')],
+                        default=[1], help='comma-separated destination counts the reminders are spread over')
+    parser.add_argument('--workers', type=int, default=main.REMINDER_WORKERS)
+    parser.add_argument('--latency', type=float, default=0.15, help='seconds per send, before scaling')
+    parser.add_argument('--scale', type=float, default=0.05, help='time compression for the rate-limit window')
+    asyncio.run(run(parser.parse_args()))
@@ -0,0 +1,135 @@
+"""Latency of logging a roll: the old multi-round-trip sequence vs log_roll.
+
+The old sequence is reproduced statement for statement: get_user, then for
+a new user create_or_update_user (SELECT + INSERT + COMMIT) and get_user
+again, then UPDATE users + INSERT rolls + counter upserts + COMMIT. The new
+path is the single log_roll statement. Each sample uses its own user, with
+the cooldown cleared beforehand so it is allowed to roll.
+
+    BENCH_DATABASE_URL=postgresql://localhost/bench python benchmarks/bench_roll_logging.py
+
+The target database is modified; do not point this at production.
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+
+from psycopg2.extras import RealDictCursor
+
+from fakes import QueryCounter, import_bot
+
+DATABASE_URL = os.getenv('BENCH_DATABASE_URL')
+if not DATABASE_URL:
+    sys.exit("Set BENCH_DATABASE_URL to a scratch Postgres database")
+
+main = import_bot(DATABASE_URL)
+BASE_USER_ID = 9_000_000_000
+
+
+def fetch_user(user_id):
+    conn = main.get_db_connection()
+    cur = conn.cursor(cursor_factory=RealDictCursor)
+    cur.execute('SELECT * FROM users WHERE user_id = %s', (user_id,))
+    row = cur.fetchone()
+    cur.close()
+    main.return_db_connection(conn)
+    return row
+
+
+def legacy_log_roll(user_id, username, fruit_name):
+    now = datetime.now(timezone.utc)
+    next_roll = now + timedelta(hours=main.ROLL_COOLDOWN_HOURS)
+    fruit_rarity = main.FRUITS_DATA[fruit_name]['rarity']
+
+    if not fetch_user(user_id):
+        conn = main.get_db_connection()
+        cur = conn.cursor()
+        cur.execute('SELECT total_rolls, notifications_enabled FROM users WHERE user_id = %s', (user_id,))
+        cur.fetchone()
+        cur.execute('''INSERT INTO users (user_id, username, total_rolls, notifications_enabled)
+                       VALUES (%s, %s, 0, TRUE)''', (user_id, username))
+        conn.commit()
+        cur.close()
+        main.return_db_connection(conn)
+        fetch_user(user_id)
+
+    conn = main.get_db_connection()
+    cur = conn.cursor()
+    cur.execute('''UPDATE users
+                   SET total_rolls = total_rolls + 1, last_roll_time = %s, next_roll_time = %s, username = %s
+                   WHERE user_id = %s
+                   RETURNING *''', (now, next_roll, username, user_id))
+    cur.execute('INSERT INTO rolls (user_id, fruit_name, fruit_rarity, rolled_at) VALUES (%s, %s, %s, %s)',
+                (user_id, fruit_name, fruit_rarity, now))
+    cur.execute('''INSERT INTO rarity_roll_counts (fruit_rarity, roll_count) VALUES (%s, 1)
+                   ON CONFLICT (fruit_rarity) DO UPDATE SET roll_count = rarity_roll_counts.roll_count + 1''',
+                (fruit_rarity,))
+    cur.execute('''INSERT INTO user_rarity_counts (user_id, fruit_rarity, roll_count) VALUES (%s, %s, 1)
+                   ON CONFLICT (user_id, fruit_rarity) DO UPDATE SET roll_count = user_rarity_counts.roll_count + 1''',
+                (user_id, fruit_rarity))
+    cur.execute('''INSERT INTO user_fruit_counts (user_id, fruit_name, roll_count) VALUES (%s, %s, 1)
+                   ON CONFLICT (user_id, fruit_name) DO UPDATE SET roll_count = user_fruit_counts.roll_count + 1''',
+                (user_id, fruit_name))
+    conn.commit()
+    cur.close()
+    main.return_db_connection(conn)
+
+
+def reset(user_ids):
+    conn = main.get_db_connection()
+    cur = conn.cursor()
+    cur.execute('DELETE FROM user_fruit_counts WHERE user_id = ANY(%s)', (user_ids,))
+    cur.execute('DELETE FROM user_rarity_counts WHERE user_id = ANY(%s)', (user_ids,))
+    cur.execute('DELETE FROM rolls WHERE user_id = ANY(%s)', (user_ids,))
+    cur.execute('DELETE FROM users WHERE user_id = ANY(%s)', (user_ids,))
+    conn.commit()
+    cur.close()
+    main.return_db_connection(conn)
+
+
+def clear_cooldowns(user_ids):
+    conn = main.get_db_connection()
+    cur = conn.cursor()
+    cur.execute('UPDATE users SET next_roll_time = NULL WHERE user_id = ANY(%s)', (user_ids,))
+    conn.commit()
+    cur.close()
+    main.return_db_connection(conn)
+
+
+def sample(fn, user_ids):
+    timings = []
+    with QueryCounter(main) as counter:
+        for user_id in user_ids:
+            start = time.perf_counter()
+            fn(user_id, f"bench-{user_id}", 'Dragon')
+            timings.append((time.perf_counter() - start) * 1000)
+    return timings, counter.round_trips / len(user_ids)
+
+
+def report(label, timings, round_trips):
+    timings.sort()
+    p95 = timings[int(len(timings) * 0.95) - 1]
+    print(f"{label:>32}: p50 {statistics.median(timings):6.2f}ms | p95 {p95:6.2f}ms | {round_trips:4.1f} round trips/roll")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--samples', type=int, default=500)
+    args = parser.parse_args()
+
+    main.init_database()
+    user_ids = list(range(BASE_USER_ID, BASE_USER_ID + args.samples))
+
+    for label, fn in (('before', legacy_log_roll), ('after (log_roll)', main.log_roll)):
+        reset(user_ids)
+        main.user_cache = main.UserCache()
+        timings, round_trips = sample(fn, user_ids)
+        report(f"{label}, new user", timings, round_trips)
+        clear_cooldowns(user_ids)
+        timings, round_trips = sample(fn, user_ids)
+        report(f"{label}, returning user", timings, round_trips)
+    reset(user_ids)
@@ -0,0 +1,131 @@
+"""Query cost of building the /stats dashboard against a seeded Postgres.
+
+Seeds USERS users and ROLLS rolls into the database given by
+BENCH_DATABASE_URL (tables are created with init_database, existing bench
+rows are replaced), then times the old per-user lookup against the current
+three-query build. The old lookup's queries live here now that the bot no
+longer uses them.
+
+    BENCH_DATABASE_URL=postgresql://localhost/bench python benchmarks/bench_stats_queries.py
+
+The target database is modified; do not point this at production.
+"""
+
+import argparse
+import asyncio
+import base64
+import os
+import sys
+import time
+from types import SimpleNamespace
+
+from psycopg2.extras import RealDictCursor
+
+from fakes import QueryCounter, import_bot
+
+DATABASE_URL = os.getenv('BENCH_DATABASE_URL')
+if not DATABASE_URL:
+    sys.exit("Set BENCH_DATABASE_URL to a scratch Postgres database")
+
+main = import_bot(DATABASE_URL)
+
+
+def seed(users: int, rolls: int, pending: float):
+    conn = main.get_db_connection()
+    cur = conn.cursor()
+    cur.execute('TRUNCATE rolls, command_usage, rarity_roll_counts, users RESTART IDENTITY CASCADE')
+    cur.execute('''INSERT INTO users (user_id, username, total_rolls, last_roll_time, next_roll_time)
+                   SELECT g, 'bench-' || g, 0, now() - interval '1 hour',
+                          CASE WHEN random() < %s THEN now() + (random() * interval '2 hours') END
+                   FROM generate_series(1, %s) g''', (pending, users))
+    fruits = list(main.FRUITS_DATA.items())
+    cur.execute('''CREATE TEMP TABLE bench_fruits (idx INT, fruit_name TEXT, fruit_rarity TEXT)''')
+    cur.executemany('INSERT INTO bench_fruits VALUES (%s, %s, %s)',
+                    [(i, name, data['rarity']) for i, (name, data) in enumerate(fruits)])
+    cur.execute('''INSERT INTO rolls (user_id, fruit_name, fruit_rarity, rolled_at)
+                   SELECT 1 + (g %% %s), f.fruit_name, f.fruit_rarity,
+                          now() - (g * interval '1 second')
+                   FROM generate_series(1, %s) g
+                   JOIN bench_fruits f ON f.idx = g %% %s''', (users, rolls, len(fruits)))
+    main._rebuild_roll_counters(cur)
+    cur.execute('''UPDATE users u SET total_rolls = c.n
+                   FROM (SELECT user_id, COUNT(*) n FROM rolls GROUP BY user_id) c
+                   WHERE u.user_id = c.user_id''')
+    conn.commit()
+    cur.execute('ANALYZE')
+    cur.close()
+    main.return_db_connection(conn)
+
+
+def measure(fn):
+    with QueryCounter(main) as counter:
+        start = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - start
+    return elapsed, counter.queries
+
+
+def fetch_all(query: str, params=None):
+    conn = main.get_db_connection()
+    cur = conn.cursor(cursor_factory=RealDictCursor)
+    cur.execute(query, params)
+    rows = cur.fetchall()
+    cur.close()
+    main.return_db_connection(conn)
+    return rows
+
+
+def get_all_users():
+    """Every user row, as the old dashboard loaded them"""
+    return fetch_all('''SELECT user_id, username, total_rolls, last_roll_time, next_roll_time, notifications_enabled
+                        FROM users''')
+
+
+def get_user_rolls(user_id: int):
+    """All of a user's rolls, most recent first, as the old dashboard loaded them"""
+    rows = fetch_all('SELECT fruit_name, rolled_at FROM rolls WHERE user_id = %s ORDER BY rolled_at DESC',
+                     (user_id,))
+    return [{'fruit': row['fruit_name'], 'time': row['rolled_at']} for row in rows]
+
+
+def old_dashboard():
+    users = get_all_users()
+    for user in sorted([u for u in users if u['next_roll_time']], key=lambda x: x['next_roll_time']):
+        rolls = get_user_rolls(user['user_id'])
+        rolls[0]['fruit'] if rolls else None
+    main.get_rarity_distribution()
+
+
+def new_dashboard():
+    main.count_users()
+    main.get_upcoming_rolls()
+    main.get_rarity_distribution()
+
+
+async def render_page():
+    token = base64.b64encode(f"{main.STATS_USER}:{main.STATS_PASS}".encode()).decode()
+    request = SimpleNamespace(headers={'Authorization': f"Basic {token}"})
+    return await main.handle_stats(request)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--users', type=int, default=10_000)
+    parser.add_argument('--rolls', type=int, default=1_000_000)
+    parser.add_argument('--pending', type=float, default=0.1, help='fraction of users with an upcoming roll')
+    parser.add_argument('--skip-seed', action='store_true')
+    args = parser.parse_args()
+
+    main.init_database()
+    if not args.skip_seed:
+        start = time.perf_counter()
+        seed(args.users, args.rolls, args.pending)
+        print(f"seeded {args.users} users / {args.rolls} rolls in {time.perf_counter() - start:.1f}s")
+
+    for name, fn in (('per-user lookups', old_dashboard), ('fixed queries', new_dashboard)):
+        elapsed, queries = measure(fn)
+        print(f"{name:>17}: {elapsed * 1000:9.1f}ms | {queries:6d} queries")
+
+    start = time.perf_counter()
+    asyncio.run(render_page())
+    print(f"full /stats render: {(time.perf_counter() - start) * 1000:.1f}ms")
@@ -0,0 +1,224 @@
+"""Stand-ins for Discord and Supabase used by the benchmark scripts.
+
+Nothing here talks to Discord. The fake pool simulates a slow database by
+sleeping inside ``execute`` so the cost of blocking the event loop shows up
+without needing a live Supabase project.
+"""
+
+import asyncio
+import os
+import sys
+import time
+from collections import deque
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def import_bot(database_url: str = None):
+    """Import main.py with quiet logging, pointing it at ``database_url`` if given"""
+    if database_url:
+        os.environ['SUPABASE_URL'] = database_url
+    os.environ.setdefault('SUPABASE_URL', 'postgresql://benchmark@localhost/benchmark')
+    # main.py logs its whole startup banner at import time; keep it off the report
+    os.environ.setdefault('LOG_LEVEL', 'WARNING')
+    os.environ.setdefault('LOG_LEVEL_DISCORD', 'WARNING')
+    if REPO_ROOT not in sys.path:
+        sys.path.insert(0, REPO_ROOT)
+    import main
+    return main
+
+
+class _CountingCursor:
+    def __init__(self, cursor, counter):
+        self._cursor = cursor
+        self._counter = counter
+
+    def execute(self, *args, **kwargs):
+        self._counter.queries += 1
+        return self._cursor.execute(*args, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+
+class _CountingConnection:
+    def __init__(self, conn, counter):
+        self.conn = conn
+        self._counter = counter
+
+    def cursor(self, *args, **kwargs):
+        return _CountingCursor(self.conn.cursor(*args, **kwargs), self._counter)
+
+    def commit(self):
+        self._counter.commits += 1
+        return self.conn.commit()
+
+    def __getattr__(self, name):
+        return getattr(self.conn, name)
+
+
+class QueryCounter:
+    """Counts queries issued through main's pool helpers while active
+
+        with QueryCounter(main) as counter:
+            main.count_users()
+        print(counter.queries, counter.round_trips)
+    """
+
+    def __init__(self, main):
+        self.main = main
+        self.queries = 0
+        self.commits = 0
+
+    @property
+    def round_trips(self) -> int:
+        return self.queries + self.commits
+
+    def __enter__(self):
+        self._get = self.main.get_db_connection
+        self._put = self.main.return_db_connection
+        self.main.get_db_connection = lambda: _CountingConnection(self._get(), self)
+        self.main.return_db_connection = lambda conn: self._put(getattr(conn, 'conn', conn))
+        return self
+
+    def __exit__(self, *exc):
+        self.main.get_db_connection = self._get
+        self.main.return_db_connection = self._put
+
+
+class FakeLatencyCursor:
+    """Cursor that sleeps for the injected latency on every query"""
+
+    def __init__(self, pool, cursor_factory=None):
+        self.pool = pool
+        self.dict_rows = cursor_factory is not None
+        self.rowcount = 0
+
+    def execute(self, query, params=None):
+        self.pool.queries += 1
+        time.sleep(self.pool.latency)
+
+    def fetchone(self):
+        if self.dict_rows:
+            return dict(self.pool.user_row)
+        return (self.pool.user_row['username'],)
+
+    def fetchall(self):
+        return []
+
+    def close(self):
+        pass
+
+
+class FakeLatencyConnection:
+    def __init__(self, pool):
+        self.pool = pool
+
+    def cursor(self, cursor_factory=None):
+        return FakeLatencyCursor(self.pool, cursor_factory)
+
+    def commit(self):
+        time.sleep(self.pool.latency)
+
+    def rollback(self):
+        pass
+
+
+class FakeLatencyPool:
+    """Drop-in for ThreadedConnectionPool that injects a fixed round-trip latency"""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.queries = 0
+        self.user_row = {
+            'user_id': 1,
+            'username': 'bench-user',
+            'total_rolls': 0,
+            'last_roll_time': None,
+            'next_roll_time': None,
+            'notifications_enabled': True,
+            'suspended': False,
+            'suspension_reason': None,
+        }
+
+    def getconn(self):
+        return FakeLatencyConnection(self)
+
+    def putconn(self, conn):
+        pass
+
+    def closeall(self):
+        pass
+
+
+class FakeResponse:
+    def __init__(self):
+        self.messages = []
+
+    async def send_message(self, content=None, **kwargs):
+        self.messages.append((content, kwargs))
+
+    async def edit_message(self, content=None, **kwargs):
+        self.messages.append((content, kwargs))
+
+
+class FakeChannel:
+    def __init__(self, channel_id: int = 1, name: str = 'bench-channel'):
+        self.id = channel_id
+        self.name = name
+        self.sent = []
+
+    async def send(self, content=None, **kwargs):
+        self.sent.append((content, kwargs))
+
+
+class RateLimitedChannel(FakeChannel):
+    """A channel that paces sends like Discord's per-channel message limit.
+
+    At most ``limit`` sends go through per ``per`` seconds, each taking
+    ``latency`` seconds, the way discord.py waits out an exhausted bucket.
+    """
+
+    def __init__(self, limit: int = 5, per: float = 5.0, latency: float = 0.05, **kwargs):
+        super().__init__(**kwargs)
+        self.limit = limit
+        self.per = per
+        self.latency = latency
+        self.waited = 0.0
+        self._sent_at = deque()
+        self._lock = asyncio.Lock()
+
+    async def send(self, content=None, **kwargs):
+        async with self._lock:
+            now = time.monotonic()
+            while len(self._sent_at) >= self.limit:
+                wait = self._sent_at[0] + self.per - now
+                if wait <= 0:
+                    self._sent_at.popleft()
+                    continue
+                self.waited += wait
+                await asyncio.sleep(wait)
+                now = time.monotonic()
+            self._sent_at.append(now)
+        await asyncio.sleep(self.latency)
+        await super().send(content, **kwargs)
+
+
+class FakeUser:
+    def __init__(self, user_id: int, name: str):
+        self.id = user_id
+        self.name = name
+
+    def __str__(self):
+        return self.name
+
+
+class FakeInteraction:
+    """Just enough of discord.Interaction for the slash command callbacks"""
+
+    def __init__(self, user_id: int, username: str = None, channel: FakeChannel = None):
+        self.user = FakeUser(user_id, username or f"bench-{user_id}")
+        self.guild = None
+        self.command = None
+        self.channel = channel or FakeChannel()
+        self.response = FakeResponse()
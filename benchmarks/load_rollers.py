@@ -0,0 +1,241 @@
+"""Synthetic load: N users rolling on compressed 2-hour cooldowns.
+
+Seeds N users whose cooldowns end evenly across one cooldown period, then
+runs the real notification_checker, log_roll and scheduler against a scratch
+Postgres with Discord replaced by a recording channel. The 2-hour cooldown is
+compressed to --cooldown seconds so many cycles fit in a short run.
+
+    active    (default 80%)  roll a few seconds after their reminder arrives
+    sleeping  (default 15%)  have reminders off and roll on their own
+    suspended (default 5%)   keep trying to roll and are rejected
+
+For each N it reports how late reminders were relative to next_roll_time,
+database round trips per minute, the startup cost of count_users and
+loading the scheduler, and Python memory (tracemalloc) for the run. tracemalloc
+stays on from startup to the end, which slows Python code, so compare timings
+across N rather than with the other benchmarks.
+
+    BENCH_DATABASE_URL=postgresql://localhost/bench python benchmarks/load_rollers.py --users 100,1000,10000
+
+Compressing the cooldown multiplies the roll and reminder rate by
+7200 / --cooldown, so a short cooldown with many users is a stress test, not
+a forecast. The target database is modified; do not point this at production.
+"""
+
+import argparse
+import asyncio
+import gc
+import heapq
+import os
+import random
+import re
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+
+from psycopg2.extras import execute_values
+
+from fakes import FakeChannel, QueryCounter, import_bot
+
+DATABASE_URL = os.getenv('BENCH_DATABASE_URL')
+if not DATABASE_URL:
+    sys.exit("Set BENCH_DATABASE_URL to a scratch Postgres database")
+
+# Suspended users' rejected rolls log a warning each; keep the report readable
+os.environ.setdefault('LOG_LEVEL', 'ERROR')
+main = import_bot(DATABASE_URL)
+BASE_USER_ID = 9_200_000_000
+MENTION = re.compile(r'<@(\d+)>')
+
+
+class ReminderChannel(FakeChannel):
+    """Records when each user's reminder went out and hands it to the simulation"""
+
+    def __init__(self, on_reminder):
+        super().__init__()
+        self.on_reminder = on_reminder
+
+    async def send(self, content=None, **kwargs):
+        sent_at = datetime.now(timezone.utc)
+        for match in MENTION.finditer(content or ''):
+            self.on_reminder(int(match.group(1)), sent_at)
+
+
+class Simulation:
+    def __init__(self, users: int, args):
+        self.args = args
+        self.cooldown = timedelta(seconds=args.cooldown)
+        self.user_ids = list(range(BASE_USER_ID, BASE_USER_ID + users))
+        rng = random.Random(users)
+        rng.shuffle(self.user_ids)
+        sleeping = int(users * args.sleeping)
+        suspended = int(users * args.suspended)
+        self.sleeping = set(self.user_ids[:sleeping])
+        self.suspended = set(self.user_ids[sleeping:sleeping + suspended])
+        self.rng = rng
+        self.expected_due = {}
+        self.lateness_ms = []
+        self.rolls = 0
+        self.rejected = 0
+        self.tasks = set()
+        self.self_rolls = []  # heap of (when, user_id) for users who roll without a reminder
+
+    def seed(self):
+        now = datetime.now(timezone.utc)
+        rows = []
+        for user_id in self.user_ids:
+            due = now + self.cooldown * self.rng.random()
+            rows.append((user_id, f"load-{user_id}", due, user_id not in self.sleeping, user_id in self.suspended))
+            if user_id in self.sleeping or user_id in self.suspended:
+                heapq.heappush(self.self_rolls, (due + self._think(), user_id))
+            else:
+                self.expected_due[user_id] = due
+        conn = main.get_db_connection()
+        cur = conn.cursor()
+        execute_values(cur, '''INSERT INTO users (user_id, username, next_roll_time, notifications_enabled, suspended)
+                               VALUES %s''', rows, page_size=5000)
+        conn.commit()
+        cur.close()
+        main.return_db_connection(conn)
+
+    def _think(self) -> timedelta:
+        return timedelta(seconds=self.rng.uniform(0, self.args.think))
+
+    def on_reminder(self, user_id: int, sent_at: datetime):
+        due = self.expected_due.pop(user_id, None)
+        if due is not None:
+            self.lateness_ms.append((sent_at - due).total_seconds() * 1000)
+        delay = self._think().total_seconds()
+        self._spawn(self._roll_later(user_id, delay))
+
+    def _spawn(self, coro):
+        task = asyncio.create_task(coro)
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+
+    async def _roll_later(self, user_id: int, delay: float):
+        await asyncio.sleep(delay)
+        await self.roll(user_id)
+
+    async def roll(self, user_id: int):
+        fruit = self.rng.choice(main.FRUITS)
+        row = await main.run_db(main.log_roll, user_id, f"load-{user_id}", fruit)
+        if row is None:
+            self.rejected += 1
+            return
+        self.rolls += 1
+        if user_id in self.sleeping:
+            heapq.heappush(self.self_rolls, (row['next_roll_time'] + self._think(), user_id))
+        else:
+            self.expected_due[user_id] = row['next_roll_time']
+
+    async def drive_self_rolls(self):
+        """Sleeping and suspended users roll on their own schedule"""
+        while True:
+            if not self.self_rolls:
+                await asyncio.sleep(0.5)
+                continue
+            when, user_id = self.self_rolls[0]
+            wait = (when - datetime.now(timezone.utc)).total_seconds()
+            if wait > 0:
+                await asyncio.sleep(min(wait, 0.5))
+                continue
+            heapq.heappop(self.self_rolls)
+            if user_id in self.suspended:
+                # Suspended users retry after another cooldown
+                heapq.heappush(self.self_rolls, (when + self.cooldown, user_id))
+            self._spawn(self.roll(user_id))
+
+    async def run_checker(self):
+        while True:
+            await main.notification_checker.coro()
+
+
+def reset(high: int):
+    conn = main.get_db_connection()
+    cur = conn.cursor()
+    for table in ('user_fruit_counts', 'user_rarity_counts', 'rolls', 'command_usage', 'users'):
+        cur.execute(f'DELETE FROM {table} WHERE user_id BETWEEN %s AND %s', (BASE_USER_ID, high))
+    conn.commit()
+    cur.close()
+    main.return_db_connection(conn)
+    main.user_cache = main.UserCache()
+    main.reminder_scheduler = main.ReminderScheduler()
+
+
+def percentile(sorted_values, q):
+    return sorted_values[min(len(sorted_values) - 1, int(q * len(sorted_values)))] if sorted_values else 0.0
+
+
+async def run_one(users: int, args):
+    reset(BASE_USER_ID + users)
+    # Anything already due in the scratch database would skew the first cycle
+    main.claim_due_reminders(datetime.now(timezone.utc))
+    main.ROLL_COOLDOWN_HOURS = args.cooldown / 3600
+
+    sim = Simulation(users, args)
+    sim.seed()
+    gc.collect()
+    tracemalloc.start()
+
+    # Startup work on_ready does once per process
+    start = time.perf_counter()
+    users_in_db = await main.run_db(main.count_users)
+    count_users_ms = (time.perf_counter() - start) * 1000
+    start = time.perf_counter()
+    main.reminder_scheduler.load(await main.run_db(main.get_pending_reminders))
+    scheduler_load_ms = (time.perf_counter() - start) * 1000
+    startup_mb = tracemalloc.get_traced_memory()[0] / 1e6
+
+    channel = ReminderChannel(sim.on_reminder)
+    main.bot.get_channel = lambda channel_id: channel
+
+    with QueryCounter(main) as counter:
+        background = [asyncio.create_task(sim.run_checker()), asyncio.create_task(sim.drive_self_rolls())]
+        await asyncio.sleep(args.duration)
+        for task in background + list(sim.tasks):
+            task.cancel()
+        await asyncio.gather(*background, *sim.tasks, return_exceptions=True)
+
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    lateness = sorted(sim.lateness_ms)
+    print(f"users={users:>7} | count_users ({users_in_db} rows) {count_users_ms:8.1f}ms | "
+          f"scheduler load {scheduler_load_ms:7.1f}ms | startup mem {startup_mb:6.1f}MB")
+    print(f"{'':>13} reminders {len(lateness):>6} late p50 {percentile(lateness, 0.50):8.1f}ms "
+          f"p95 {percentile(lateness, 0.95):8.1f}ms p99 {percentile(lateness, 0.99):8.1f}ms "
+          f"max {lateness[-1] if lateness else 0.0:8.1f}ms")
+    print(f"{'':>13} rolls {sim.rolls:>6} rejected {sim.rejected:>5} | "
+          f"{counter.round_trips / (args.duration / 60):9.0f} round trips/min | "
+          f"mem now {current / 1e6:6.1f}MB peak {peak / 1e6:6.1f}MB")
+    reset(BASE_USER_ID + users)
+
+
+async def run(args):
+    main.init_database()
+    main.command_usage_buffer.start()
+    main.reminder_workers.start()
+    try:
+        for users in args.users:
+            await run_one(users, args)
+    finally:
+        await main.reminder_workers.close()
+        await main.command_usage_buffer.close()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--users', type=lambda value: [int(n) for n in value.split(',')],
+                        default=[100, 1000, 10000], help='comma-separated user counts, e.g. 100,1000,100000')
+    parser.add_argument('--duration', type=float, default=60, help='seconds to simulate per user count')
+    parser.add_argument('--cooldown', type=float, default=30, help='seconds standing in for the 2-hour cooldown')
+    parser.add_argument('--think', type=float, default=3, help='max seconds between a reminder and the roll')
+    parser.add_argument('--sleeping', type=float, default=0.15, help='fraction of users with reminders off')
+    parser.add_argument('--suspended', type=float, default=0.05, help='fraction of suspended users')
+    args = parser.parse_args()
+
+    print(f"duration={args.duration:.0f}s cooldown={args.cooldown:.0f}s (standing in for 2h) "
+          f"workers={main.DB_EXECUTOR_WORKERS}")
+    asyncio.run(run(args))
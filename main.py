@@ -3,22 +3,48 @@ from discord import app_commands
 from discord.ext import commands, tasks
 import os
 from datetime import datetime, timedelta, timezone
-from aiohttp import web
+from aiohttp import web, TraceConfig
 import asyncio
 from dotenv import load_dotenv
 import json
+import html
+import hashlib
+import gzip
+import mimetypes
+from collections import OrderedDict, deque
+import time
+import heapq
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import psycopg2
-from psycopg2.extras import RealDictCursor
-from psycopg2.pool import SimpleConnectionPool
+from psycopg2.extras import RealDictCursor, execute_values
+from psycopg2.pool import ThreadedConnectionPool
 from typing import Optional, List, Dict
 import logging
+import logging.handlers
+import queue
+import atexit
 import sys
+import traceback
+
+try:
+    import brotli  # optional: adds br alongside gzip for dashboard responses
+except ImportError:
+    brotli = None
 
 # ============================================================================
 # LOGGING CONFIGURATION - VERBOSE MODE
 # ============================================================================
 
+# Environment variables are loaded first so they can configure logging below
+load_dotenv()
+
 # Configure logging with colors and detailed format
+LOG_FORMAT = "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
+LOG_DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+
 class ColoredFormatter(logging.Formatter):
     """Custom formatter with colors for console output"""
     
@@ -31,42 +57,87 @@ class ColoredFormatter(logging.Formatter):
     reset = "\x1b[0m"
     
     FORMATS = {
-        logging.DEBUG: grey + "%(asctime)s [%(levelname)s] %(name)s: %(message)s" + reset,
-        logging.INFO: blue + "%(asctime)s [%(levelname)s] %(name)s: %(message)s" + reset,
-        logging.WARNING: yellow + "%(asctime)s [%(levelname)s] %(name)s: %(message)s" + reset,
-        logging.ERROR: red + "%(asctime)s [%(levelname)s] %(name)s: %(message)s" + reset,
-        logging.CRITICAL: bold_red + "%(asctime)s [%(levelname)s] %(name)s: %(message)s" + reset,
+        logging.DEBUG: grey + LOG_FORMAT + reset,
+        logging.INFO: blue + LOG_FORMAT + reset,
+        logging.WARNING: yellow + LOG_FORMAT + reset,
+        logging.ERROR: red + LOG_FORMAT + reset,
+        logging.CRITICAL: bold_red + LOG_FORMAT + reset,
     }
-    
+
+    def __init__(self):
+        super().__init__(LOG_FORMAT, datefmt=LOG_DATE_FORMAT)
+        # One formatter per level, built once instead of on every record
+        self._formatters = {
+            level: logging.Formatter(fmt, datefmt=LOG_DATE_FORMAT)
+            for level, fmt in self.FORMATS.items()
+        }
+
     def format(self, record):
-        log_fmt = self.FORMATS.get(record.levelno)
-        formatter = logging.Formatter(log_fmt, datefmt='%Y-%m-%d %H:%M:%S')
+        formatter = self._formatters.get(record.levelno)
+        if formatter is None:
+            return super().format(record)
         return formatter.format(record)
 
-# Set up root logger
-logger = logging.getLogger('BloxFruitsBot')
-logger.setLevel(logging.DEBUG)
 
-# Console handler with colors
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line, for log collectors (LOG_FORMAT=json)"""
+
+    def format(self, record):
+        entry = {
+            'time': datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            'level': record.levelname,
+            'logger': record.name,
+            # QueueHandler has already folded any traceback into the message
+            'message': record.getMessage(),
+        }
+        return json.dumps(entry, ensure_ascii=False)
+
+
+def _env_log_level(name: str, default: str) -> int:
+    """Read a level name like 'INFO' from the environment"""
+    level = logging.getLevelName(os.getenv(name, default).upper())
+    return level if isinstance(level, int) else logging.getLevelName(default)
+
+
+# Records are handed to a queue and written by a background thread, so a slow
+# stdout never blocks the event loop
 console_handler = logging.StreamHandler(sys.stdout)
-console_handler.setLevel(logging.DEBUG)
-console_handler.setFormatter(ColoredFormatter())
-logger.addHandler(console_handler)
+if os.getenv('LOG_FORMAT', 'color').lower() == 'json':
+    console_handler.setFormatter(JsonFormatter())
+else:
+    console_handler.setFormatter(ColoredFormatter())
+
+log_queue = queue.SimpleQueue()
+log_queue_handler = logging.handlers.QueueHandler(log_queue)
+log_listener = logging.handlers.QueueListener(log_queue, console_handler, respect_handler_level=True)
+log_listener.start()
+atexit.register(log_listener.stop)
+
+# Set up root logger
+logger = logging.getLogger('BloxFruitsBot')
+logger.setLevel(_env_log_level('LOG_LEVEL', 'DEBUG'))
+logger.addHandler(log_queue_handler)
+
+# Subsystem loggers inherit LOG_LEVEL unless LOG_LEVEL_<NAME> overrides it
+db_logger = logging.getLogger('BloxFruitsBot.db')
+scheduler_logger = logging.getLogger('BloxFruitsBot.scheduler')
+web_logger = logging.getLogger('BloxFruitsBot.web')
+ui_logger = logging.getLogger('BloxFruitsBot.ui')
+for _subsystem_logger in (db_logger, scheduler_logger, web_logger, ui_logger):
+    _env_name = 'LOG_LEVEL_' + _subsystem_logger.name.rsplit('.', 1)[-1].upper()
+    if os.getenv(_env_name):
+        _subsystem_logger.setLevel(_env_log_level(_env_name, 'DEBUG'))
 
 # Discord.py library logging
 discord_logger = logging.getLogger('discord')
-discord_logger.setLevel(logging.INFO)
-discord_handler = logging.StreamHandler(sys.stdout)
-discord_handler.setFormatter(ColoredFormatter())
-discord_logger.addHandler(discord_handler)
+discord_logger.setLevel(_env_log_level('LOG_LEVEL_DISCORD', 'INFO'))
+discord_logger.addHandler(log_queue_handler)
 
 logger.info("=" * 80)
 logger.info("🦈 BLOX FRUITS ROLL TRACKER - STARTING UP")
 logger.info("=" * 80)
 
-# Load environment variables from .env file
-logger.info("📂 Loading environment variables...")
-load_dotenv()
+# Environment variables were loaded above, before logging was configured
 logger.info("✅ Environment variables loaded")
 
 # Bot setup with necessary intents
@@ -77,7 +148,33 @@ intents.guilds = True
 intents.members = True
 logger.info("✅ Bot intents configured: message_content=True, guilds=True, members=True")
 
-bot = commands.Bot(command_prefix='!', intents=intents)
+
+class BloxFruitsBot(commands.Bot):
+    async def close(self):
+        """Let claimed reminders go out while the HTTP session is still open.
+
+        Their users were already claimed (next_roll_time cleared), so a message
+        dropped here would never be sent. The checker finishes any cycle in
+        progress before the delivery workers are closed.
+        """
+        notification_checker.stop()
+        checker = notification_checker.get_task()
+        if checker is not None and not checker.done():
+            # Only cancel it while it sleeps: a cycle that has already claimed
+            # reminders must get to queue them before the workers stop
+            if reminder_scheduler.waiting or not self.is_ready():
+                checker.cancel()
+            done, _ = await asyncio.wait({checker}, timeout=10)
+            if not done:
+                logger.warning("⚠️  Notification checker still running at shutdown, cancelling it")
+                checker.cancel()
+        await reminder_workers.close()
+        await super().close()
+
+
+# Sees every Discord HTTP response; the rate-limit tracker hooks in below
+discord_http_trace = TraceConfig()
+bot = BloxFruitsBot(command_prefix='!', intents=intents, http_trace=discord_http_trace)
 logger.info("✅ Bot instance created with prefix '!'")
 
 # Configuration
@@ -119,6 +216,15 @@ else:
 
 # Connection pool for Supabase
 db_pool = None
+DB_POOL_MIN = 1
+DB_POOL_MAX = 20
+
+# Database helpers are blocking (psycopg2), so async code runs them on this
+# bounded executor instead of the event loop. Keeping the worker count at or
+# below DB_POOL_MAX means a worker never waits on an exhausted pool.
+DB_EXECUTOR_WORKERS = min(int(os.getenv('DB_EXECUTOR_WORKERS', 10)), DB_POOL_MAX)
+db_executor = ThreadPoolExecutor(max_workers=DB_EXECUTOR_WORKERS, thread_name_prefix='db')
+logger.info(f"   - DB Executor Workers: {DB_EXECUTOR_WORKERS}")
 
 # Statistics tracking
 stats = {
@@ -132,6 +238,772 @@ stats = {
 logger.info("📊 Statistics tracking initialized")
 
 
+# ============================================================================
+# REMINDER SCHEDULER
+# ============================================================================
+
+class ReminderScheduler:
+    """In-memory priority queue of upcoming roll reminders.
+
+    Due times sit in a min-heap so the notification checker can sleep until the
+    earliest one instead of scanning the users table. Rescheduling or cancelling
+    only updates ``_due``; superseded heap entries are discarded when they reach
+    the top. Database helpers update it from executor threads, so all state is
+    guarded by a lock and wake-ups are handed to the event loop thread-safely.
+    """
+
+    MAX_SLEEP_SECONDS = 3600
+
+    def __init__(self):
+        self._heap = []
+        self._due = {}
+        self._lock = threading.Lock()
+        self._loop = None
+        self._wakeup = asyncio.Event()
+        self.waiting = False
+
+    def __len__(self):
+        with self._lock:
+            return len(self._due)
+
+    def load(self, reminders: List[Dict]):
+        """Replace the queue with rows of user_id/next_roll_time from the database"""
+        with self._lock:
+            self._due = {r['user_id']: r['next_roll_time'] for r in reminders}
+            self._heap = [(due, user_id) for user_id, due in self._due.items()]
+            heapq.heapify(self._heap)
+        logger.info(f"⏰ Reminder scheduler loaded {len(self._due)} pending reminder(s)")
+        self._notify()
+
+    def schedule(self, user_id: int, due: datetime):
+        """Add or move a user's reminder"""
+        with self._lock:
+            self._due[user_id] = due
+            heapq.heappush(self._heap, (due, user_id))
+        scheduler_logger.debug("⏰ Reminder scheduled for user %s at %s", user_id, due)
+        self._notify()
+
+    def retry(self, user_ids: List[int], due: datetime):
+        """Put popped reminders back for another attempt at ``due``
+
+        Users that were rescheduled meanwhile (they rolled) keep their new time.
+        """
+        with self._lock:
+            for user_id in user_ids:
+                if user_id not in self._due:
+                    self._due[user_id] = due
+                    heapq.heappush(self._heap, (due, user_id))
+        self._notify()
+
+    def cancel(self, user_id: int):
+        """Drop a user's pending reminder, if any"""
+        with self._lock:
+            removed = self._due.pop(user_id, None)
+        if removed:
+            scheduler_logger.debug("⏰ Reminder cancelled for user %s", user_id)
+
+    def next_due(self) -> Optional[datetime]:
+        """Earliest pending due time, or None when nothing is scheduled"""
+        with self._lock:
+            self._discard_stale()
+            return self._heap[0][0] if self._heap else None
+
+    def pop_due(self, now: datetime) -> List[int]:
+        """Remove and return every user whose reminder is due at ``now``"""
+        due_ids = []
+        with self._lock:
+            self._discard_stale()
+            while self._heap and self._heap[0][0] <= now:
+                _, user_id = heapq.heappop(self._heap)
+                del self._due[user_id]
+                due_ids.append(user_id)
+                self._discard_stale()
+        return due_ids
+
+    async def wait_until_due(self):
+        """Sleep until the earliest reminder is due, waking early when the queue changes
+
+        ``waiting`` is True for the duration, so shutdown knows the checker holds
+        no claimed reminders and can be cancelled.
+        """
+        self._loop = asyncio.get_running_loop()
+        self.waiting = True
+        try:
+            while True:
+                self._wakeup.clear()
+                next_due = self.next_due()
+                if next_due is None:
+                    timeout = self.MAX_SLEEP_SECONDS
+                else:
+                    timeout = (next_due - datetime.now(timezone.utc)).total_seconds()
+                    if timeout <= 0:
+                        return
+                    timeout = min(timeout, self.MAX_SLEEP_SECONDS)
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            self.waiting = False
+
+    def _discard_stale(self):
+        while self._heap and self._due.get(self._heap[0][1]) != self._heap[0][0]:
+            heapq.heappop(self._heap)
+
+    def _notify(self):
+        if self._loop is not None and not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+
+
+reminder_scheduler = ReminderScheduler()
+
+
+# ============================================================================
+# USER CACHE
+# ============================================================================
+
+class UserCache:
+    """LRU cache of ``users`` rows with a time-to-live.
+
+    get_user serves reads from here; every helper that writes a user row puts
+    the fresh row back (or invalidates it) so cached rows never lag behind the
+    bot's own writes. The TTL bounds staleness from edits made outside the bot.
+    """
+
+    def __init__(self, max_size: int = 5000, ttl: float = 300.0):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._rows = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, user_id: int) -> Optional[Dict]:
+        """Return a copy of the cached row, or None on a miss"""
+        with self._lock:
+            entry = self._rows.get(user_id)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self._rows[user_id]
+                self.misses += 1
+                return None
+            self._rows.move_to_end(user_id)
+            self.hits += 1
+            return dict(entry[1])
+
+    def put(self, row: Dict):
+        """Cache a full users row"""
+        with self._lock:
+            self._rows[row['user_id']] = (time.monotonic() + self.ttl, dict(row))
+            self._rows.move_to_end(row['user_id'])
+            while len(self._rows) > self.max_size:
+                self._rows.popitem(last=False)
+
+    def update(self, user_id: int, **fields):
+        """Apply a partial write to a cached row, if it is cached"""
+        with self._lock:
+            entry = self._rows.get(user_id)
+            if entry is not None:
+                entry[1].update(fields)
+
+    def invalidate(self, user_id: int):
+        with self._lock:
+            self._rows.pop(user_id, None)
+
+    def stats(self) -> Dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self._rows),
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': (self.hits / lookups * 100) if lookups else 0.0
+            }
+
+
+user_cache = UserCache()
+
+
+# ============================================================================
+# METRICS
+# ============================================================================
+
+# Seconds; spans a cache hit up to a slow Discord API call
+DEFAULT_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+metrics_registry = []
+
+
+def _escape_label_value(value) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+class Metric:
+    """Base for the small Prometheus-format metrics served on /metrics.
+
+    Labelled values live in a dict keyed by the label tuple. Updates come from
+    the event loop and from DB executor threads, so every access takes the lock.
+    """
+
+    type_name = 'untyped'
+
+    def __init__(self, name: str, documentation: str, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+        metrics_registry.append(self)
+
+    def _key(self, labels: Dict) -> tuple:
+        return tuple(str(labels.get(name, '')) for name in self.labelnames)
+
+    def _label_text(self, key: tuple, extra: Dict = None) -> str:
+        pairs = list(zip(self.labelnames, key)) + list((extra or {}).items())
+        if not pairs:
+            return ''
+        return '{' + ','.join(f'{name}="{_escape_label_value(value)}"' for name, value in pairs) + '}'
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            return [f'{self.name}{self._label_text(key)} {value}' for key, value in self._values.items()]
+
+    def render(self) -> List[str]:
+        return [f'# HELP {self.name} {self.documentation}',
+                f'# TYPE {self.name} {self.type_name}'] + self._samples()
+
+
+class Counter(Metric):
+    type_name = 'counter'
+
+    def inc(self, amount: float = 1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+
+class Gauge(Metric):
+    type_name = 'gauge'
+
+    def set(self, value: float, **labels):
+        with self._lock:
+            self._values[self._key(labels)] = value
+
+    def inc(self, amount: float = 1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount: float = 1, **labels):
+        self.inc(-amount, **labels)
+
+
+class Histogram(Metric):
+    type_name = 'histogram'
+
+    def __init__(self, name: str, documentation: str, labelnames=(), buckets=DEFAULT_LATENCY_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is None:
+                # [per-bucket counts..., sum, count]
+                entry = self._values[key] = [0] * len(self.buckets) + [0.0, 0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    entry[i] += 1
+                    break
+            entry[-2] += value
+            entry[-1] += 1
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            snapshot = [(key, list(entry)) for key, entry in self._values.items()]
+        lines = []
+        for key, entry in snapshot:
+            cumulative = 0
+            for bound, count in zip(self.buckets, entry):
+                cumulative += count
+                lines.append(f'{self.name}_bucket{self._label_text(key, {"le": bound})} {cumulative}')
+            lines.append(f'{self.name}_bucket{self._label_text(key, {"le": "+Inf"})} {entry[-1]}')
+            lines.append(f'{self.name}_sum{self._label_text(key)} {entry[-2]}')
+            lines.append(f'{self.name}_count{self._label_text(key)} {entry[-1]}')
+        return lines
+
+
+command_latency = Histogram('bloxbot_command_duration_seconds',
+                            'Slash command handler latency', ['command', 'status'])
+db_query_latency = Histogram('bloxbot_db_query_duration_seconds',
+                             'Database helper latency, measured on the executor thread', ['helper'])
+db_executor_wait = Histogram('bloxbot_db_executor_wait_seconds',
+                             'Time a database call waits for a free executor thread')
+db_pool_checkout_wait = Histogram('bloxbot_db_pool_checkout_seconds',
+                                  'Time spent checking a connection out of the pool')
+db_pool_in_use = Gauge('bloxbot_db_pool_connections_in_use',
+                       'Connections currently checked out of the pool')
+checker_cycle_latency = Histogram('bloxbot_notification_cycle_duration_seconds',
+                                  'Time to claim one batch of due reminders and queue them for delivery')
+reminders_total = Counter('bloxbot_reminders_total',
+                          'Roll reminders by outcome (sent or failed)', ['outcome'])
+web_latency = Histogram('bloxbot_http_request_duration_seconds',
+                        'Web handler latency', ['route', 'method', 'status'])
+
+
+def render_metrics() -> str:
+    """Every registered metric in the Prometheus text exposition format"""
+    lines = []
+    for metric in metrics_registry:
+        lines.extend(metric.render())
+    return '\n'.join(lines) + '\n'
+
+
+event_loop_lag = Histogram('bloxbot_event_loop_lag_seconds',
+                           'How late the watchdog tick woke up, i.e. time the event loop was blocked',
+                           buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0))
+event_loop_lag_quantile = Gauge('bloxbot_event_loop_lag_quantile_seconds',
+                                'Event loop lag percentiles over the watchdog window', ['quantile'])
+event_loop_stalls_total = Counter('bloxbot_event_loop_stalls_total',
+                                  'Event loop stalls over the lag threshold, by blocking code location', ['location'])
+
+
+sse_clients = Gauge('bloxbot_sse_clients', 'Dashboard viewers connected to /api/events')
+sse_resyncs_total = Counter('bloxbot_sse_resyncs_total',
+                            'Times a slow viewer overflowed its event buffer and was told to resync')
+
+
+def timed_command(func):
+    """Record a slash command's latency in command_latency.
+
+    functools.wraps copies __wrapped__, __qualname__, the docstring and any
+    describe() attributes, which is everything discord.py inspects to build the
+    command's parameters, so the registered command is unchanged.
+    """
+    @functools.wraps(func)
+    async def wrapper(interaction: discord.Interaction, *args, **kwargs):
+        started = time.perf_counter()
+        status = 'ok'
+        try:
+            return await func(interaction, *args, **kwargs)
+        except Exception:
+            status = 'error'
+            raise
+        finally:
+            command_name = getattr(interaction.command, 'name', func.__name__)
+            command_latency.observe(time.perf_counter() - started, command=command_name, status=status)
+    return wrapper
+
+
+# ============================================================================
+# EVENT LOOP WATCHDOG
+# ============================================================================
+
+class LoopWatchdog:
+    """Measures event loop lag and names the code that blocked it.
+
+    A task on the loop sleeps for ``interval`` and records how late it woke up.
+    A helper thread watches the task's heartbeat; once a tick is overdue by
+    ``threshold`` the loop is stuck, so the thread samples the loop thread's
+    stack with sys._current_frames() while the blocking call is still running.
+    """
+
+    STACK_DEPTH = 8
+
+    def __init__(self, interval: float = 0.5, threshold: float = 0.25, window: int = 600):
+        self.interval = interval
+        self.threshold = threshold
+        self.stalls = 0
+        self._lags = deque(maxlen=window)
+        self._offenders = {}
+        self._beat = time.monotonic()
+        self._sampled_beat = None
+        self._loop_thread_id = None
+        self._task = None
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+
+    def start(self):
+        """Start the lag task on the running loop and the stack sampler thread"""
+        self._loop_thread_id = threading.get_ident()
+        self._beat = time.monotonic()
+        self._task = asyncio.get_running_loop().create_task(self._run())
+        threading.Thread(target=self._watch, name='loop-watchdog', daemon=True).start()
+        logger.info(f"🐕 Event loop watchdog started (threshold {self.threshold * 1000:.0f}ms)")
+
+    def stop(self):
+        self._stop.set()
+        if self._task:
+            self._task.cancel()
+
+    async def _run(self):
+        while True:
+            started = time.perf_counter()
+            await asyncio.sleep(self.interval)
+            lag = max(0.0, time.perf_counter() - started - self.interval)
+            event_loop_lag.observe(lag)
+            with self._lock:
+                self._lags.append(lag)
+                self._beat = time.monotonic()
+
+    def _watch(self):
+        while not self._stop.wait(self.threshold / 2):
+            with self._lock:
+                beat = self._beat
+            overdue = time.monotonic() - beat - self.interval
+            if overdue < self.threshold or beat == self._sampled_beat:
+                continue
+            # One sample per stall: the stack right after it crossed the threshold
+            self._sampled_beat = beat
+            frame = sys._current_frames().get(self._loop_thread_id)
+            if frame is not None:
+                self._record_stall(traceback.extract_stack(frame)[-self.STACK_DEPTH:], overdue)
+
+    def _record_stall(self, stack, overdue: float):
+        # Name the stall after the innermost frame in this file, since that is
+        # the call site to fix even when the time is spent inside a library
+        ours = [entry for entry in stack if entry.filename == __file__]
+        culprit = (ours or stack)[-1]
+        location = f"{culprit.name} ({os.path.basename(culprit.filename)}:{culprit.lineno})"
+        with self._lock:
+            self.stalls += 1
+            self._offenders[location] = self._offenders.get(location, 0) + 1
+        event_loop_stalls_total.inc(location=location)
+        logger.warning("🐢 Event loop blocked for %.0fms+ at %s\n%s",
+                       overdue * 1000, location, ''.join(traceback.format_list(stack)).rstrip())
+
+    def percentiles(self) -> Dict[str, float]:
+        """p50/p95/p99/max lag in seconds over the recent window"""
+        with self._lock:
+            lags = sorted(self._lags)
+        if not lags:
+            return {'p50': 0.0, 'p95': 0.0, 'p99': 0.0, 'max': 0.0}
+
+        def pick(q):
+            return lags[min(len(lags) - 1, int(q * len(lags)))]
+        return {'p50': pick(0.50), 'p95': pick(0.95), 'p99': pick(0.99), 'max': lags[-1]}
+
+    def top_offenders(self, limit: int = 5) -> List[tuple]:
+        """(location, stall count) pairs for the code that blocked the loop most often"""
+        with self._lock:
+            return sorted(self._offenders.items(), key=lambda item: item[1], reverse=True)[:limit]
+
+
+loop_watchdog = LoopWatchdog(threshold=int(os.getenv('LOOP_LAG_THRESHOLD_MS', 250)) / 1000)
+
+
+# ============================================================================
+# LIVE EVENTS
+# ============================================================================
+
+class EventBroadcaster:
+    """Fans dashboard events out to every /api/events viewer.
+
+    Each event is serialized once into an SSE frame and handed to every
+    client's bounded queue. A client that falls ``buffer_size`` events behind
+    has its backlog replaced by a single ``resync`` event, telling the page to
+    refetch the JSON API, so one slow viewer never holds memory for the rest.
+    publish() may be called from DB executor threads.
+    """
+
+    def __init__(self, buffer_size: int = 256):
+        self.buffer_size = buffer_size
+        self._clients = set()
+        self._loop = None
+        self._loop_thread = None
+
+    def start(self):
+        """Bind to the running loop; events published before this are dropped"""
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread = threading.get_ident()
+
+    def subscribe(self) -> asyncio.Queue:
+        client = asyncio.Queue(maxsize=self.buffer_size)
+        self._clients.add(client)
+        sse_clients.set(len(self._clients))
+        return client
+
+    def unsubscribe(self, client: asyncio.Queue):
+        self._clients.discard(client)
+        sse_clients.set(len(self._clients))
+
+    def publish(self, event: str, data: Dict):
+        if self._loop is None or self._loop.is_closed():
+            return
+        frame = f"event: {event}\ndata: {json.dumps(data)}\n\n".encode('utf-8')
+        if threading.get_ident() == self._loop_thread:
+            self._fan_out(frame)
+        else:
+            self._loop.call_soon_threadsafe(self._fan_out, frame)
+
+    def _fan_out(self, frame: bytes):
+        for client in self._clients:
+            try:
+                client.put_nowait(frame)
+            except asyncio.QueueFull:
+                while not client.empty():
+                    client.get_nowait()
+                client.put_nowait(b"event: resync\ndata: {}\n\n")
+                sse_resyncs_total.inc()
+
+
+event_broadcaster = EventBroadcaster()
+
+
+# ============================================================================
+# REMINDER DISPATCH
+# ============================================================================
+
+# Discord's limits for one message: 2000 characters of content, 4096 in an
+# embed description, and at most 100 users in allowed mentions
+REMINDER_CONTENT_LIMIT = 2000
+REMINDER_DESCRIPTION_LIMIT = 4096
+REMINDER_MAX_MENTIONS = 100
+
+reminder_delivery_delay = Histogram('bloxbot_reminder_delivery_delay_seconds',
+                                    'Time from a reminder falling due to Discord accepting its message',
+                                    buckets=(0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0))
+reminder_messages_total = Counter('bloxbot_reminder_messages_total',
+                                  'Reminder messages sent, by kind (single or batch)', ['kind'])
+discord_rate_limited_total = Counter('bloxbot_discord_rate_limited_total',
+                                     'HTTP 429 responses from Discord, by scope (user, global or shared)', ['scope'])
+discord_ratelimit_remaining = Gauge('bloxbot_discord_ratelimit_remaining',
+                                    'Requests left in the Discord rate-limit bucket at its last response, by route',
+                                    ['route'])
+discord_retry_after = Histogram('bloxbot_discord_retry_after_seconds',
+                                'Retry-After on Discord 429 responses',
+                                buckets=(0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0))
+
+
+def _route_template(path: str) -> str:
+    """URL path with IDs and interaction/webhook tokens replaced: safe to log, bounded as a label"""
+    return '/'.join(':id' if part.isdigit() else ':token' if len(part) > 40 else part
+                    for part in path.split('/'))
+
+
+async def track_discord_rate_limits(session, context, params):
+    """Record Discord's rate-limit headers from every API response.
+
+    discord.py already waits out exhausted buckets and retries 429s on its
+    own; this exposes what it saw so reminder delays can be explained.
+    """
+    headers = params.response.headers
+    route = f"{params.method} {_route_template(params.url.path)}"
+    if 'X-RateLimit-Remaining' in headers:
+        remaining = int(headers['X-RateLimit-Remaining'])
+        discord_ratelimit_remaining.set(remaining, route=route)
+        if remaining == 0:
+            logger.debug("🚦 Rate limit bucket for %s exhausted, resets in %ss",
+                         route, headers.get('X-RateLimit-Reset-After', '?'))
+    if params.response.status == 429:
+        retry_after = float(headers.get('Retry-After', 0))
+        scope = headers.get('X-RateLimit-Scope', 'unknown')
+        discord_rate_limited_total.inc(scope=scope)
+        discord_retry_after.observe(retry_after)
+        logger.warning(f"🚦 Discord rate limited {route} ({scope} scope), retry after {retry_after:.2f}s")
+
+
+discord_http_trace.on_request_end.append(track_discord_rate_limits)
+
+
+class ReminderMessage:
+    """One Discord message carrying the reminders for ``users``"""
+
+    def __init__(self, users: List[Dict], content: str, embed: discord.Embed):
+        self.users = users
+        self.content = content
+        self.embed = embed
+
+
+class ReminderDispatcher:
+    """Turns due reminders into as few Discord messages as the limits allow.
+
+    Dad keeps his own message; everyone else due at the same time shares one,
+    with a mention per user, so a burst of expiring cooldowns costs a handful
+    of sends against the channel's rate limit instead of one per user.
+    """
+
+    def __init__(self, max_mentions: int = REMINDER_MAX_MENTIONS):
+        self.max_mentions = max_mentions
+
+    def build_messages(self, users: List[Dict]) -> List[ReminderMessage]:
+        # Earliest due first, so the longest-waiting users are at the front of the queue
+        users = sorted(users, key=lambda user: user['next_roll_time'])
+        messages = [self._dad_message(user) for user in users if user['user_id'] == DAD_USER_ID]
+
+        batch, mentions, lines = [], [], []
+        for user in users:
+            if user['user_id'] == DAD_USER_ID:
+                continue
+            mention = f"<@{user['user_id']}>"
+            line = f"**{get_display_name(user['user_id'], user['username'])}**'s fruit roll cooldown is complete!"
+            if batch and (len(batch) >= self.max_mentions
+                          or len(' '.join(mentions + [mention])) > REMINDER_CONTENT_LIMIT
+                          or len('\n'.join(lines + [line])) > REMINDER_DESCRIPTION_LIMIT):
+                messages.append(self._batch_message(batch, mentions, lines))
+                batch, mentions, lines = [], [], []
+            batch.append(user)
+            mentions.append(mention)
+            lines.append(line)
+        if batch:
+            messages.append(self._batch_message(batch, mentions, lines))
+        return messages
+
+    @staticmethod
+    def _dad_message(user: Dict) -> ReminderMessage:
+        embed = discord.Embed(
+            title="🎲 Fruity rolly ready!",
+            description=f"Daddy's fruit rolly cooldown is all doney woney :3",
+            color=discord.Color.gold()
+        )
+        embed.add_field(
+            name="📝 Log your rolly",
+            value="Use `/fruit-roll` to loggy your next fruit roll!",
+            inline=False
+        )
+        embed.set_footer(text="Use /sleep to disable able these reminders tee hee :3c")
+        content = f"**Blox Fruits Notifier:** Daddy Lucian Your fruit roll is weddy when you are :3c ||<@{user['user_id']}>||"
+        return ReminderMessage([user], content, embed)
+
+    @staticmethod
+    def _batch_message(users: List[Dict], mentions: List[str], lines: List[str]) -> ReminderMessage:
+        embed = discord.Embed(
+            title="🎲 Fruit Roll Ready!",
+            description='\n'.join(lines),
+            color=discord.Color.gold()
+        )
+        embed.add_field(
+            name="📝 Log Your Roll",
+            value="Use `/fruit-roll` to log your next fruit roll!",
+            inline=False
+        )
+        embed.set_footer(text="Use /sleep to disable these reminders")
+        return ReminderMessage(users, ' '.join(mentions), embed)
+
+    async def send(self, channel, message: ReminderMessage) -> Optional[List[float]]:
+        """Send one message; each user's delivery delay in seconds, or None if it failed"""
+        names = ', '.join(get_display_name(user['user_id'], user['username']) for user in message.users)
+        try:
+            await channel.send(content=message.content, embed=message.embed)
+        except Exception as e:
+            reminders_total.inc(len(message.users), outcome='failed')
+            logger.error(f"❌ Failed to send roll reminder to {names}: {e}")
+            return None
+
+        delivered_at = datetime.now(timezone.utc)
+        reminder_messages_total.inc(kind='batch' if len(message.users) > 1 else 'single')
+        reminders_total.inc(len(message.users), outcome='sent')
+        delays = []
+        for user in message.users:
+            delays.append((delivered_at - user['next_roll_time']).total_seconds())
+            reminder_delivery_delay.observe(delays[-1])
+            event_broadcaster.publish('reminder', {
+                'user_id': str(user['user_id']),
+                'username': user['username']
+            })
+        logger.info(f"✅ Sent roll reminder to {names} ({max(delays):.1f}s after due)")
+        return delays
+
+
+reminder_dispatcher = ReminderDispatcher()
+
+REMINDER_WORKERS = int(os.getenv('REMINDER_WORKERS', 4))
+REMINDER_QUEUE_SIZE = int(os.getenv('REMINDER_QUEUE_SIZE', 500))
+
+reminder_queue_depth = Gauge('bloxbot_reminder_queue_depth',
+                             'Reminder messages queued or being sent by the delivery workers')
+reminder_enqueue_wait = Histogram('bloxbot_reminder_enqueue_wait_seconds',
+                                  'Time the notification checker waited for room in the full delivery queue')
+
+
+class ReminderWorkerPool:
+    """Fixed set of async workers that send reminder messages for the checker.
+
+    The checker only enqueues. Each destination channel always maps to the
+    same worker, so its messages go out in the order they were queued; only
+    different destinations are sent concurrently. Every reminder currently
+    goes to NOTIFICATION_CHANNEL_ID, so in practice one worker sends them all
+    (Discord rate-limits per channel anyway) and the others are idle.
+
+    ``queue_size`` bounds the messages queued across all workers, so a single
+    busy destination can use all of it. When it is full, enqueue() waits,
+    holding the checker back rather than letting claimed reminders pile up.
+    """
+
+    def __init__(self, dispatcher: ReminderDispatcher, workers: int = REMINDER_WORKERS,
+                 queue_size: int = REMINDER_QUEUE_SIZE):
+        self.dispatcher = dispatcher
+        self.queue_size = queue_size
+        self.sent = 0
+        self.failed = 0
+        self._queues = [asyncio.Queue() for _ in range(workers)]
+        self._capacity = asyncio.Semaphore(queue_size)
+        self._tasks = []
+        self._closing = False
+
+    def start(self):
+        if not self._tasks:
+            self._tasks = [asyncio.create_task(self._work(queue), name=f"reminder-worker-{i}")
+                           for i, queue in enumerate(self._queues)]
+            logger.info(f"📨 Reminder delivery workers started (workers={len(self._queues)}, "
+                        f"queue={self.queue_size})")
+
+    async def enqueue(self, channel, message: ReminderMessage):
+        """Queue a message for its destination's worker, waiting if the pool is full
+
+        Raises RuntimeError once close() has started, since nothing would send it.
+        """
+        if self._closing:
+            raise RuntimeError("Reminder worker pool is closing")
+        started = time.perf_counter()
+        await self._capacity.acquire()
+        if self._closing:
+            self._capacity.release()
+            raise RuntimeError("Reminder worker pool is closing")
+        reminder_enqueue_wait.observe(time.perf_counter() - started)
+        reminder_queue_depth.inc()
+        self._queues[channel.id % len(self._queues)].put_nowait((channel, message))
+
+    async def _work(self, queue: asyncio.Queue):
+        while True:
+            channel, message = await queue.get()
+            try:
+                # send() handles its own errors, so one bad message never kills the worker
+                if await self.dispatcher.send(channel, message) is None:
+                    self.failed += len(message.users)
+                else:
+                    self.sent += len(message.users)
+            finally:
+                reminder_queue_depth.dec()
+                self._capacity.release()
+                queue.task_done()
+
+    async def join(self):
+        """Wait until every queued message has been sent or has failed"""
+        for queue in self._queues:
+            await queue.join()
+
+    async def close(self, timeout: float = 10.0):
+        """Give queued reminders ``timeout`` seconds to go out, then stop the workers"""
+        self._closing = True
+        if not self._tasks:
+            return
+        try:
+            await asyncio.wait_for(self.join(), timeout)
+        except asyncio.TimeoutError:
+            pending = sum(queue.qsize() for queue in self._queues)
+            logger.warning(f"⚠️  Stopping reminder workers with {pending} message(s) unsent")
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        logger.info(f"📨 Reminder delivery workers stopped ({self.sent} sent, {self.failed} failed)")
+
+
+reminder_workers = ReminderWorkerPool(reminder_dispatcher)
+
+
 def get_display_name(user_id: int, username: str = None) -> str:
     """Get display name for user (Daddy for special user, otherwise username)"""
     if user_id == DAD_USER_ID:
@@ -141,21 +1013,171 @@ def get_display_name(user_id: int, username: str = None) -> str:
 
 def get_db_connection():
     """Get a database connection from the pool"""
-    logger.debug("🔌 Acquiring database connection from pool...")
-    return db_pool.getconn()
+    db_logger.debug("🔌 Acquiring database connection from pool...")
+    started = time.perf_counter()
+    conn = db_pool.getconn()
+    db_pool_checkout_wait.observe(time.perf_counter() - started)
+    db_pool_in_use.inc()
+    return conn
 
 
 def return_db_connection(conn):
     """Return a connection to the pool"""
-    logger.debug("🔌 Returning database connection to pool...")
+    db_logger.debug("🔌 Returning database connection to pool...")
     db_pool.putconn(conn)
+    db_pool_in_use.dec()
+
+
+async def run_db(func, *args, **kwargs):
+    """Run a blocking database helper on the DB executor without stalling the event loop"""
+    loop = asyncio.get_running_loop()
+    submitted = time.perf_counter()
+    helper = getattr(func, '__name__', 'unknown')
+
+    def call():
+        started = time.perf_counter()
+        db_executor_wait.observe(started - submitted)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            db_query_latency.observe(time.perf_counter() - started, helper=helper)
+
+    return await loop.run_in_executor(db_executor, call)
 
 
 # Database setup
+# Schema migrations, applied in order and recorded in schema_version so each
+# one runs exactly once per database. Steps are SQL strings or callables that
+# receive the migration's cursor. Never edit a released migration; add a new one.
+MIGRATIONS = [
+    (1, "initial schema", [
+        '''CREATE TABLE IF NOT EXISTS users
+           (
+               user_id               BIGINT PRIMARY KEY,
+               username              TEXT NOT NULL,
+               total_rolls           INTEGER DEFAULT 0,
+               last_roll_time        TIMESTAMP WITH TIME ZONE,
+               next_roll_time        TIMESTAMP WITH TIME ZONE,
+               notifications_enabled BOOLEAN DEFAULT TRUE,
+               created_at            TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+           )''',
+        'ALTER TABLE users ADD COLUMN IF NOT EXISTS suspended BOOLEAN DEFAULT FALSE',
+        'ALTER TABLE users ADD COLUMN IF NOT EXISTS suspension_reason TEXT',
+        '''CREATE TABLE IF NOT EXISTS rolls
+           (
+               roll_id      SERIAL PRIMARY KEY,
+               user_id      BIGINT NOT NULL REFERENCES users (user_id),
+               fruit_name   TEXT NOT NULL,
+               fruit_rarity TEXT NOT NULL,
+               rolled_at    TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+           )''',
+        '''CREATE TABLE IF NOT EXISTS command_usage
+           (
+               id           SERIAL PRIMARY KEY,
+               command_name TEXT NOT NULL,
+               user_id      BIGINT NOT NULL,
+               used_at      TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+           )''',
+        'CREATE INDEX IF NOT EXISTS idx_rolls_rolled_at ON rolls(rolled_at)',
+        'CREATE INDEX IF NOT EXISTS idx_rolls_rarity ON rolls(fruit_rarity)',
+        'CREATE INDEX IF NOT EXISTS idx_command_usage_used_at ON command_usage(used_at)',
+        'CREATE INDEX IF NOT EXISTS idx_users_next_roll_time ON users(next_roll_time)',
+    ]),
+    (2, "roll history index", [
+        'CREATE INDEX IF NOT EXISTS idx_rolls_user_history ON rolls(user_id, rolled_at DESC, roll_id DESC)',
+        # Databases created before migrations have this; the history index leads with user_id
+        'DROP INDEX IF EXISTS idx_rolls_user_id',
+    ]),
+    (3, "roll counters", [
+        '''CREATE TABLE IF NOT EXISTS rarity_roll_counts
+           (
+               fruit_rarity TEXT PRIMARY KEY,
+               roll_count   BIGINT NOT NULL DEFAULT 0
+           )''',
+        '''CREATE TABLE IF NOT EXISTS user_rarity_counts
+           (
+               user_id      BIGINT NOT NULL REFERENCES users (user_id),
+               fruit_rarity TEXT NOT NULL,
+               roll_count   INTEGER NOT NULL DEFAULT 0,
+               PRIMARY KEY (user_id, fruit_rarity)
+           )''',
+        '''CREATE TABLE IF NOT EXISTS user_fruit_counts
+           (
+               user_id    BIGINT NOT NULL REFERENCES users (user_id),
+               fruit_name TEXT NOT NULL,
+               roll_count INTEGER NOT NULL DEFAULT 0,
+               PRIMARY KEY (user_id, fruit_name)
+           )''',
+        lambda cur: _rebuild_roll_counters(cur),
+    ]),
+    (4, "bot state", [
+        '''CREATE TABLE IF NOT EXISTS bot_state
+           (
+               key        TEXT PRIMARY KEY,
+               value      TEXT NOT NULL,
+               updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+           )''',
+    ]),
+]
+
+# Arbitrary key for pg_advisory_xact_lock so two processes never migrate at once
+MIGRATION_LOCK_KEY = 7_214_002
+
+
+def run_migrations():
+    """Apply every migration newer than the database's schema_version"""
+    conn = get_db_connection()
+    try:
+        cur = conn.cursor()
+        cur.execute('''CREATE TABLE IF NOT EXISTS schema_version
+                       (
+                           version     INTEGER PRIMARY KEY,
+                           description TEXT NOT NULL,
+                           applied_at  TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+                       )''')
+        conn.commit()
+
+        cur.execute('SELECT COALESCE(MAX(version), 0) FROM schema_version')
+        current_version = cur.fetchone()[0]
+        pending = [m for m in MIGRATIONS if m[0] > current_version]
+        if not pending:
+            db_logger.info("✅ Database schema is up to date (version %s)", current_version)
+            cur.close()
+            return
+
+        for version, description, steps in pending:
+            cur.execute('SELECT pg_advisory_xact_lock(%s)', (MIGRATION_LOCK_KEY,))
+            cur.execute('SELECT 1 FROM schema_version WHERE version = %s', (version,))
+            if cur.fetchone():
+                conn.commit()
+                continue
+
+            db_logger.info("📋 Applying migration %s: %s...", version, description)
+            for step in steps:
+                if callable(step):
+                    step(cur)
+                else:
+                    cur.execute(step)
+            cur.execute('INSERT INTO schema_version (version, description) VALUES (%s, %s)',
+                        (version, description))
+            conn.commit()
+            db_logger.info("✅ Migration %s applied", version)
+        cur.close()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        return_db_connection(conn)
+
+
 def init_database():
-    """Initialize Supabase database with required tables"""
+    """Create the Supabase connection pool and migrate the schema, once per process"""
     global db_pool
-    
+
+    if db_pool is not None:
+        db_logger.debug("🗄️  Database already initialized, skipping")
+        return
+
     logger.info("=" * 80)
     logger.info("🗄️  INITIALIZING DATABASE")
     logger.info("=" * 80)
@@ -163,145 +1185,11 @@ def init_database():
     try:
         # Create connection pool for Supabase
         logger.info("🔄 Creating Supabase connection pool...")
-        db_pool = SimpleConnectionPool(1, 20, SUPABASE_URL)
-        logger.info("✅ Supabase connection pool created (min=1, max=20)")
+        db_pool = ThreadedConnectionPool(DB_POOL_MIN, DB_POOL_MAX, SUPABASE_URL)
+        logger.info(f"✅ Supabase connection pool created (min={DB_POOL_MIN}, max={DB_POOL_MAX})")
 
-        logger.info("🔌 Testing database connection...")
-        conn = get_db_connection()
-        cur = conn.cursor()
-        logger.info("✅ Database connection successful")
-
-        # Users table
-        logger.info("📋 Creating 'users' table if not exists...")
-        cur.execute('''CREATE TABLE IF NOT EXISTS users
-                       (
-                           user_id
-                           BIGINT
-                           PRIMARY
-                           KEY,
-                           username
-                           TEXT
-                           NOT
-                           NULL,
-                           total_rolls
-                           INTEGER
-                           DEFAULT
-                           0,
-                           last_roll_time
-                           TIMESTAMP
-                           WITH
-                           TIME
-                           ZONE,
-                           next_roll_time
-                           TIMESTAMP
-                           WITH
-                           TIME
-                           ZONE,
-                           notifications_enabled
-                           BOOLEAN
-                           DEFAULT
-                           TRUE,
-                           created_at
-                           TIMESTAMP
-                           WITH
-                           TIME
-                           ZONE
-                           DEFAULT
-                           CURRENT_TIMESTAMP
-                       )''')
-        logger.info("✅ 'users' table ready")
-        
-        # Add suspended column if it doesn't exist
-        try:
-            cur.execute('ALTER TABLE users ADD COLUMN IF NOT EXISTS suspended BOOLEAN DEFAULT FALSE')
-            logger.info("✅ 'suspended' column added/verified")
-        except Exception as e:
-            logger.debug(f"Suspended column may already exist: {e}")
-        
-        # Add suspension_reason column if it doesn't exist
-        try:
-            cur.execute('ALTER TABLE users ADD COLUMN IF NOT EXISTS suspension_reason TEXT')
-            logger.info("✅ 'suspension_reason' column added/verified")
-        except Exception as e:
-            logger.debug(f"Suspension_reason column may already exist: {e}")
-
-        # Rolls table - NOW INCLUDES RARITY
-        logger.info("📋 Creating 'rolls' table if not exists...")
-        cur.execute('''CREATE TABLE IF NOT EXISTS rolls
-        (
-            roll_id
-            SERIAL
-            PRIMARY
-            KEY,
-            user_id
-            BIGINT
-            NOT
-            NULL,
-            fruit_name
-            TEXT
-            NOT
-            NULL,
-            fruit_rarity
-            TEXT
-            NOT
-            NULL,
-            rolled_at
-            TIMESTAMP
-            WITH
-            TIME
-            ZONE
-            DEFAULT
-            CURRENT_TIMESTAMP,
-            FOREIGN
-            KEY
-                       (
-            user_id
-                       ) REFERENCES users
-                       (
-                           user_id
-                       )
-            )''')
-        logger.info("✅ 'rolls' table ready")
-
-        # Command usage tracking
-        logger.info("📋 Creating 'command_usage' table if not exists...")
-        cur.execute('''CREATE TABLE IF NOT EXISTS command_usage
-                       (
-                           id
-                           SERIAL
-                           PRIMARY
-                           KEY,
-                           command_name
-                           TEXT
-                           NOT
-                           NULL,
-                           user_id
-                           BIGINT
-                           NOT
-                           NULL,
-                           used_at
-                           TIMESTAMP
-                           WITH
-                           TIME
-                           ZONE
-                           DEFAULT
-                           CURRENT_TIMESTAMP
-                       )''')
-        logger.info("✅ 'command_usage' table ready")
-
-        # Create indexes for better performance
-        logger.info("📊 Creating database indexes...")
-        cur.execute('''CREATE INDEX IF NOT EXISTS idx_rolls_user_id ON rolls(user_id)''')
-        cur.execute('''CREATE INDEX IF NOT EXISTS idx_rolls_rolled_at ON rolls(rolled_at)''')
-        cur.execute('''CREATE INDEX IF NOT EXISTS idx_rolls_rarity ON rolls(fruit_rarity)''')
-        cur.execute('''CREATE INDEX IF NOT EXISTS idx_command_usage_used_at ON command_usage(used_at)''')
-        cur.execute('''CREATE INDEX IF NOT EXISTS idx_users_next_roll_time ON users(next_roll_time)''')
-        logger.info("✅ All indexes created")
-
-        conn.commit()
-        logger.info("✅ Database changes committed")
-        cur.close()
-        return_db_connection(conn)
+        logger.info("📋 Checking schema migrations...")
+        run_migrations()
 
         logger.info("=" * 80)
         logger.info("✅ SUPABASE DATABASE INITIALIZED SUCCESSFULLY")
@@ -316,9 +1204,14 @@ def init_database():
 
 # Database helper functions
 def get_user(user_id: int) -> Optional[Dict]:
-    """Get user from database"""
+    """Get user from cache or database"""
+    cached = user_cache.get(user_id)
+    if cached is not None:
+        db_logger.debug("✅ User cache hit: %s", cached.get('username'))
+        return cached
+
     try:
-        logger.debug(f"👤 Fetching user data for ID: {user_id}")
+        db_logger.debug("👤 Fetching user data for ID: %s", user_id)
         conn = get_db_connection()
         cur = conn.cursor(cursor_factory=RealDictCursor)
         cur.execute('SELECT * FROM users WHERE user_id = %s', (user_id,))
@@ -327,47 +1220,91 @@ def get_user(user_id: int) -> Optional[Dict]:
         return_db_connection(conn)
 
         if row:
-            logger.debug(f"✅ User found: {dict(row).get('username')}")
+            db_logger.debug("✅ User found: %s", row['username'])
+            user_cache.put(row)
             return dict(row)
-        logger.debug(f"⚠️  User not found: {user_id}")
+        db_logger.debug("⚠️  User not found: %s", user_id)
         return None
     except Exception as e:
-        logger.error(f"❌ Error in get_user: {e}")
+        db_logger.error("❌ Error in get_user: %s", e)
         return None
 
 
 def create_or_update_user(user_id: int, username: str):
     """Create or update user in database"""
+    conn = None
     try:
-        logger.info(f"👤 Creating/updating user: {username} (ID: {user_id})")
+        db_logger.info("👤 Creating/updating user: %s (ID: %s)", username, user_id)
         conn = get_db_connection()
-        cur = conn.cursor()
+        cur = conn.cursor(cursor_factory=RealDictCursor)
 
         # Check if user exists
         cur.execute('SELECT total_rolls, notifications_enabled FROM users WHERE user_id = %s', (user_id,))
         existing = cur.fetchone()
 
         if existing:
-            logger.debug(f"📝 Updating existing user: {username}")
-            cur.execute('UPDATE users SET username = %s WHERE user_id = %s', (username, user_id))
+            db_logger.debug("📝 Updating existing user: %s", username)
+            cur.execute('UPDATE users SET username = %s WHERE user_id = %s RETURNING *', (username, user_id))
         else:
-            logger.info(f"✨ Creating new user: {username}")
+            db_logger.info("✨ Creating new user: %s", username)
             cur.execute('''INSERT INTO users (user_id, username, total_rolls, notifications_enabled)
-                           VALUES (%s, %s, 0, TRUE)''', (user_id, username))
+                           VALUES (%s, %s, 0, TRUE)
+                           RETURNING *''', (user_id, username))
+        row = cur.fetchone()
 
         conn.commit()
         cur.close()
         return_db_connection(conn)
-        logger.debug(f"✅ User operation complete: {username}")
+        user_cache.put(row)
+        invalidate_page_snapshots()
+        db_logger.debug("✅ User operation complete: %s", username)
     except Exception as e:
-        logger.error(f"❌ Error in create_or_update_user: {e}")
+        db_logger.error("❌ Error in create_or_update_user: %s", e)
         if conn:
             conn.rollback()
             return_db_connection(conn)
 
 
-def log_roll(user_id: int, username: str, fruit_name: str):
-    """Log a fruit roll in the database"""
+LOG_ROLL_SQL = '''
+WITH logged_user AS (
+    INSERT INTO users (user_id, username, total_rolls, last_roll_time, next_roll_time, notifications_enabled)
+    VALUES (%(user_id)s, %(username)s, 1, %(now)s, %(next_roll)s, TRUE)
+    ON CONFLICT (user_id) DO UPDATE
+        SET total_rolls    = users.total_rolls + 1,
+            last_roll_time = EXCLUDED.last_roll_time,
+            next_roll_time = EXCLUDED.next_roll_time,
+            username       = EXCLUDED.username
+        WHERE (users.next_roll_time IS NULL OR users.next_roll_time <= EXCLUDED.last_roll_time)
+          AND NOT COALESCE(users.suspended, FALSE)
+    RETURNING *
+), new_roll AS (
+    INSERT INTO rolls (user_id, fruit_name, fruit_rarity, rolled_at)
+    SELECT user_id, %(fruit_name)s, %(fruit_rarity)s, %(now)s FROM logged_user
+), rarity_count AS (
+    INSERT INTO rarity_roll_counts (fruit_rarity, roll_count)
+    SELECT %(fruit_rarity)s, 1 FROM logged_user
+    ON CONFLICT (fruit_rarity) DO UPDATE SET roll_count = rarity_roll_counts.roll_count + 1
+), user_rarity_count AS (
+    INSERT INTO user_rarity_counts (user_id, fruit_rarity, roll_count)
+    SELECT user_id, %(fruit_rarity)s, 1 FROM logged_user
+    ON CONFLICT (user_id, fruit_rarity) DO UPDATE SET roll_count = user_rarity_counts.roll_count + 1
+), user_fruit_count AS (
+    INSERT INTO user_fruit_counts (user_id, fruit_name, roll_count)
+    SELECT user_id, %(fruit_name)s, 1 FROM logged_user
+    ON CONFLICT (user_id, fruit_name) DO UPDATE SET roll_count = user_fruit_counts.roll_count + 1
+)
+SELECT * FROM logged_user
+'''
+
+
+def log_roll(user_id: int, username: str, fruit_name: str) -> Optional[Dict]:
+    """Log a fruit roll in the database
+
+    A single statement upserts the user, enforces the cooldown and suspension
+    server-side, inserts the roll and bumps the counters. Returns the updated
+    user row, or None when nothing was logged (still on cooldown, suspended,
+    or a database error), so two fast clicks can never both log.
+    """
     now = datetime.now(timezone.utc)
     next_roll = now + timedelta(hours=ROLL_COOLDOWN_HOURS)
 
@@ -375,141 +1312,325 @@ def log_roll(user_id: int, username: str, fruit_name: str):
     fruit_rarity = FRUITS_DATA.get(fruit_name, {}).get('rarity', 'Unknown')
     
     display_name = get_display_name(user_id, username)
-    logger.info(f"🎲 Logging roll: {display_name} ({username}) -> {fruit_name} ({fruit_rarity})")
+    db_logger.info("🎲 Logging roll: %s (%s) -> %s (%s)", display_name, username, fruit_name, fruit_rarity)
 
+    conn = None
     try:
         conn = get_db_connection()
-        cur = conn.cursor()
-
-        # Update user
-        logger.debug(f"📝 Updating user stats for {display_name} ({username})")
-        cur.execute('''UPDATE users
-                       SET total_rolls    = total_rolls + 1,
-                           last_roll_time = %s,
-                           next_roll_time = %s,
-                           username       = %s
-                       WHERE user_id = %s''',
-                    (now, next_roll, username, user_id))
-
-        # Log the roll WITH RARITY
-        logger.debug(f"📝 Inserting roll record")
-        cur.execute('INSERT INTO rolls (user_id, fruit_name, fruit_rarity, rolled_at) VALUES (%s, %s, %s, %s)',
-                    (user_id, fruit_name, fruit_rarity, now))
-
+        cur = conn.cursor(cursor_factory=RealDictCursor)
+        cur.execute(LOG_ROLL_SQL, {
+            'user_id': user_id,
+            'username': username,
+            'now': now,
+            'next_roll': next_roll,
+            'fruit_name': fruit_name,
+            'fruit_rarity': fruit_rarity
+        })
+        user_row = cur.fetchone()
         conn.commit()
         cur.close()
         return_db_connection(conn)
-
-        stats['total_rolls'] += 1
-        logger.info(f"✅ Roll logged successfully! Total rolls: {stats['total_rolls']}")
-        logger.info(f"⏰ Next roll for {display_name}: {next_roll.strftime('%Y-%m-%d %H:%M:%S UTC')}")
     except Exception as e:
-        logger.error(f"❌ Error in log_roll: {e}")
+        db_logger.error("❌ Error in log_roll: %s", e)
         if conn:
             conn.rollback()
             return_db_connection(conn)
+        return None
 
+    if not user_row:
+        db_logger.warning("⏰ Roll not logged for %s: on cooldown or suspended", display_name)
+        user_cache.invalidate(user_id)
+        return None
 
-def get_user_rolls(user_id: int) -> List[Dict]:
-    """Get all rolls for a user"""
+    user_row = dict(user_row)
+    user_cache.put(user_row)
+    if user_row['notifications_enabled'] and not user_row['suspended']:
+        reminder_scheduler.schedule(user_id, next_roll)
+    invalidate_page_snapshots()
+
+    stats['total_rolls'] += 1
+    event_broadcaster.publish('roll', {
+        'user_id': str(user_id),
+        'username': user_row['username'],
+        'fruit': fruit_name,
+        'rarity': fruit_rarity,
+        'total_rolls': user_row['total_rolls'],
+        'last_roll_time': now.isoformat(),
+        'next_roll_time': next_roll.isoformat(),
+        'notifications_enabled': user_row['notifications_enabled'],
+        'bot_total_rolls': stats['total_rolls']
+    })
+    db_logger.info("✅ Roll logged successfully! Total rolls: %s", stats['total_rolls'])
+    db_logger.info("⏰ Next roll for %s: %s", display_name, next_roll)
+    return user_row
+
+
+ROLL_HISTORY_PAGE_SIZE = 25
+
+
+def get_user_rolls_page(user_id: int, cursor: Optional[tuple] = None, newer: bool = False,
+                        limit: int = ROLL_HISTORY_PAGE_SIZE) -> tuple:
+    """Get one page of a user's rolls, most recent first, using keyset pagination
+
+    ``cursor`` is the (rolled_at, roll_id) of the roll at the edge of the current
+    page. Without ``newer`` the page holds the rolls just older than it, with
+    ``newer`` the rolls just newer. Returns (rolls, has_more) where has_more says
+    whether another page exists further in the same direction.
+    """
+    conn = None
     try:
-        logger.debug(f"📊 Fetching roll history for user ID: {user_id}")
+        db_logger.debug("📊 Fetching roll history page for user ID: %s", user_id)
         conn = get_db_connection()
         cur = conn.cursor(cursor_factory=RealDictCursor)
-        cur.execute('''SELECT fruit_name, rolled_at
-                       FROM rolls
-                       WHERE user_id = %s
-                       ORDER BY rolled_at DESC''', (user_id,))
+        if cursor is None:
+            cur.execute('''SELECT roll_id, fruit_name, rolled_at
+                           FROM rolls
+                           WHERE user_id = %s
+                           ORDER BY rolled_at DESC, roll_id DESC
+                           LIMIT %s''', (user_id, limit + 1))
+        elif newer:
+            cur.execute('''SELECT roll_id, fruit_name, rolled_at
+                           FROM rolls
+                           WHERE user_id = %s AND (rolled_at, roll_id) > (%s, %s)
+                           ORDER BY rolled_at, roll_id
+                           LIMIT %s''', (user_id, cursor[0], cursor[1], limit + 1))
+        else:
+            cur.execute('''SELECT roll_id, fruit_name, rolled_at
+                           FROM rolls
+                           WHERE user_id = %s AND (rolled_at, roll_id) < (%s, %s)
+                           ORDER BY rolled_at DESC, roll_id DESC
+                           LIMIT %s''', (user_id, cursor[0], cursor[1], limit + 1))
         rows = cur.fetchall()
         cur.close()
         return_db_connection(conn)
 
-        logger.debug(f"✅ Found {len(rows)} rolls for user")
-        return [{'fruit': row['fruit_name'], 'time': row['rolled_at']} for row in rows]
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        if newer:
+            rows.reverse()
+        db_logger.debug("✅ Found %s rolls for page", len(rows))
+        return [{'id': row['roll_id'], 'fruit': row['fruit_name'], 'time': row['rolled_at']} for row in rows], has_more
     except Exception as e:
-        logger.error(f"❌ Error in get_user_rolls: {e}")
-        return []
+        db_logger.error("❌ Error in get_user_rolls_page: %s", e)
+        if conn:
+            conn.rollback()
+            return_db_connection(conn)
+        return [], False
 
 
-def get_all_users() -> List[Dict]:
-    """Get all users from database"""
+def count_users() -> int:
+    """Count all users in database"""
+    conn = None
     try:
-        logger.debug("👥 Fetching all users from database")
+        conn = get_db_connection()
+        cur = conn.cursor()
+        cur.execute('SELECT COUNT(*) FROM users')
+        count = cur.fetchone()[0]
+        cur.close()
+        return_db_connection(conn)
+        return count
+    except Exception as e:
+        db_logger.error("❌ Error in count_users: %s", e)
+        if conn:
+            conn.rollback()
+            return_db_connection(conn)
+        return 0
+
+
+def get_upcoming_rolls() -> List[Dict]:
+    """Get users with an upcoming roll, soonest first, with the fruit they last rolled"""
+    conn = None
+    try:
+        db_logger.debug("👥 Fetching upcoming rolls with last fruit")
         conn = get_db_connection()
         cur = conn.cursor(cursor_factory=RealDictCursor)
-        cur.execute('''SELECT user_id,
-                              username,
-                              total_rolls,
-                              last_roll_time,
-                              next_roll_time,
-                              notifications_enabled
-                       FROM users''')
+        cur.execute('''SELECT u.user_id,
+                              u.username,
+                              u.total_rolls,
+                              u.last_roll_time,
+                              u.next_roll_time,
+                              u.notifications_enabled,
+                              last_roll.fruit_name AS last_fruit
+                       FROM users u
+                       LEFT JOIN LATERAL (SELECT fruit_name
+                                          FROM rolls r
+                                          WHERE r.user_id = u.user_id
+                                          ORDER BY r.rolled_at DESC
+                                          LIMIT 1) last_roll ON TRUE
+                       WHERE u.next_roll_time IS NOT NULL
+                       ORDER BY u.next_roll_time''')
         rows = cur.fetchall()
         cur.close()
         return_db_connection(conn)
 
-        logger.debug(f"✅ Fetched {len(rows)} users")
+        db_logger.debug("✅ Fetched %s upcoming rolls", len(rows))
         return [dict(row) for row in rows]
     except Exception as e:
-        logger.error(f"❌ Error in get_all_users: {e}")
+        db_logger.error("❌ Error in get_upcoming_rolls: %s", e)
+        if conn:
+            conn.rollback()
+            return_db_connection(conn)
         return []
 
 
 def toggle_notifications(user_id: int, enabled: bool):
     """Toggle notifications for a user"""
+    conn = None
     try:
         status = "ENABLED" if enabled else "DISABLED"
-        logger.info(f"🔔 Setting notifications {status} for user ID: {user_id}")
+        db_logger.info("🔔 Setting notifications %s for user ID: %s", status, user_id)
         conn = get_db_connection()
-        cur = conn.cursor()
-        cur.execute('UPDATE users SET notifications_enabled = %s WHERE user_id = %s',
+        cur = conn.cursor(cursor_factory=RealDictCursor)
+        cur.execute('''UPDATE users SET notifications_enabled = %s WHERE user_id = %s
+                       RETURNING *''',
                     (enabled, user_id))
+        row = cur.fetchone()
         conn.commit()
         cur.close()
         return_db_connection(conn)
-        logger.debug(f"✅ Notifications toggled successfully")
+
+        if row:
+            user_cache.put(row)
+        if enabled and row and row['next_roll_time'] and not row['suspended']:
+            reminder_scheduler.schedule(user_id, row['next_roll_time'])
+        elif not enabled:
+            reminder_scheduler.cancel(user_id)
+        invalidate_page_snapshots()
+        db_logger.debug("✅ Notifications toggled successfully")
     except Exception as e:
-        logger.error(f"❌ Error in toggle_notifications: {e}")
+        db_logger.error("❌ Error in toggle_notifications: %s", e)
         if conn:
             conn.rollback()
             return_db_connection(conn)
 
 
-def log_command_usage(command_name: str, user_id: int):
-    """Log command usage for statistics"""
+def write_command_usage(rows: List[tuple]) -> bool:
+    """Insert a batch of (command_name, user_id, used_at) rows"""
+    conn = None
     try:
-        logger.debug(f"📊 Logging command usage: /{command_name} by user {user_id}")
+        db_logger.debug("📊 Writing %s command usage row(s)", len(rows))
         conn = get_db_connection()
         cur = conn.cursor()
-        cur.execute('INSERT INTO command_usage (command_name, user_id) VALUES (%s, %s)',
-                    (command_name, user_id))
+        execute_values(cur, 'INSERT INTO command_usage (command_name, user_id, used_at) VALUES %s',
+                       rows, page_size=len(rows))
         conn.commit()
         cur.close()
         return_db_connection(conn)
-
-        if command_name not in stats['command_usage']:
-            stats['command_usage'][command_name] = 0
-        stats['command_usage'][command_name] += 1
-        logger.debug(f"✅ Command logged (total for /{command_name}: {stats['command_usage'][command_name]})")
+        return True
     except Exception as e:
-        logger.error(f"❌ Error in log_command_usage: {e}")
+        db_logger.error("❌ Error in write_command_usage: %s", e)
         if conn:
             conn.rollback()
             return_db_connection(conn)
+        return False
+
+
+class CommandUsageBuffer:
+    """Write-behind buffer for command usage telemetry.
+
+    Commands only enqueue an event; a background task writes them in batches
+    once ``batch_size`` events are waiting or every ``flush_interval`` seconds.
+    The queue is bounded so a database outage can't grow memory without limit,
+    and events that don't fit (or whose batch fails to write) are counted in
+    ``dropped``.
+    """
+
+    def __init__(self, max_size: int = 10000, batch_size: int = 200, flush_interval: float = 10.0):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.written = 0
+        self.dropped = 0
+        self._queue = asyncio.Queue(maxsize=max_size)
+        self._flush_now = asyncio.Event()
+        self._stopping = asyncio.Event()
+        self._task = None
+
+    def add(self, command_name: str, user_id: int):
+        """Queue one command usage event without touching the database"""
+        try:
+            self._queue.put_nowait((command_name, user_id, datetime.now(timezone.utc)))
+        except asyncio.QueueFull:
+            self.dropped += 1
+            if self.dropped == 1 or self.dropped % 100 == 0:
+                logger.warning(f"⚠️  Command usage buffer full, dropped /{command_name} (total dropped: {self.dropped})")
+            return
+        if self._queue.qsize() >= self.batch_size:
+            self._flush_now.set()
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+            logger.info(f"📊 Command usage buffer started (batch={self.batch_size}, interval={self.flush_interval}s)")
+
+    async def _run(self):
+        while not self._stopping.is_set():
+            try:
+                await asyncio.wait_for(self._flush_now.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._flush_now.clear()
+            await self.flush()
+
+    async def flush(self):
+        """Write everything currently queued"""
+        while not self._queue.empty():
+            rows = []
+            while len(rows) < self.batch_size and not self._queue.empty():
+                rows.append(self._queue.get_nowait())
+            try:
+                written = await run_db(write_command_usage, rows)
+            except asyncio.CancelledError:
+                # Off the queue but never confirmed, so count the batch as lost
+                self.dropped += len(rows)
+                raise
+            if written:
+                self.written += len(rows)
+            else:
+                self.dropped += len(rows)
+
+    async def close(self, timeout: float = 10.0):
+        """Let the background task finish its final flush, then flush what is left
+
+        The task is only cancelled if that flush takes longer than ``timeout``.
+        """
+        if self._task is not None:
+            self._stopping.set()
+            self._flush_now.set()
+            done, _ = await asyncio.wait({self._task}, timeout=timeout)
+            if not done:
+                logger.warning("⚠️  Command usage flush still running at shutdown, cancelling it")
+                self._task.cancel()
+                await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        await self.flush()
+        logger.info(f"📊 Command usage buffer flushed ({self.written} written, {self.dropped} dropped)")
+
+
+command_usage_buffer = CommandUsageBuffer()
+
+
+def log_command_usage(command_name: str, user_id: int):
+    """Log command usage for statistics (written to the database in the background)"""
+    db_logger.debug("📊 Logging command usage: /%s by user %s", command_name, user_id)
+    command_usage_buffer.add(command_name, user_id)
+
+    if command_name not in stats['command_usage']:
+        stats['command_usage'][command_name] = 0
+    stats['command_usage'][command_name] += 1
+    db_logger.debug("✅ Command logged (total for /%s: %s)", command_name, stats['command_usage'][command_name])
 
 
 def get_rarity_distribution() -> Dict:
     """Get distribution of fruit rarities rolled"""
     try:
-        logger.debug("📊 Fetching rarity distribution")
+        db_logger.debug("📊 Fetching rarity distribution")
         conn = get_db_connection()
         cur = conn.cursor()
 
-        # Get count of rolls by rarity
+        # Read the maintained per-rarity counters
         cur.execute('''SELECT fruit_rarity,
-                              COUNT(*) as count
-                       FROM rolls
-                       GROUP BY fruit_rarity
+                              roll_count
+                       FROM rarity_roll_counts
                        ORDER BY
                            CASE fruit_rarity
                            WHEN 'Common' THEN 1
@@ -526,65 +1647,138 @@ def get_rarity_distribution() -> Dict:
 
         cur.close()
         return_db_connection(conn)
-        logger.debug(f"✅ Rarity distribution: {rarity_data}")
+        db_logger.debug("✅ Rarity distribution: %s", rarity_data)
         return rarity_data
     except Exception as e:
-        logger.error(f"❌ Error in get_rarity_distribution: {e}")
+        db_logger.error("❌ Error in get_rarity_distribution: %s", e)
         return {}
 
 
+def get_user_rarity_counts(user_id: int) -> Dict:
+    """Get how many rolls of each rarity a user has logged"""
+    conn = None
+    try:
+        db_logger.debug("📊 Fetching rarity counts for user ID: %s", user_id)
+        conn = get_db_connection()
+        cur = conn.cursor()
+        cur.execute('SELECT fruit_rarity, roll_count FROM user_rarity_counts WHERE user_id = %s', (user_id,))
+        rarity_counts = dict(cur.fetchall())
+        cur.close()
+        return_db_connection(conn)
+        return rarity_counts
+    except Exception as e:
+        db_logger.error("❌ Error in get_user_rarity_counts: %s", e)
+        if conn:
+            conn.rollback()
+            return_db_connection(conn)
+        return {}
+
+
+def _rebuild_roll_counters(cur):
+    """Recompute every roll counter table from rolls using an open cursor"""
+    # Block new rolls while rebuilding so the counters match rolls exactly
+    cur.execute('LOCK TABLE rolls IN SHARE MODE')
+    cur.execute('TRUNCATE rarity_roll_counts, user_rarity_counts, user_fruit_counts')
+    cur.execute('''INSERT INTO rarity_roll_counts (fruit_rarity, roll_count)
+                   SELECT fruit_rarity, COUNT(*) FROM rolls GROUP BY fruit_rarity''')
+    cur.execute('''INSERT INTO user_rarity_counts (user_id, fruit_rarity, roll_count)
+                   SELECT user_id, fruit_rarity, COUNT(*) FROM rolls GROUP BY user_id, fruit_rarity''')
+    cur.execute('''INSERT INTO user_fruit_counts (user_id, fruit_name, roll_count)
+                   SELECT user_id, fruit_name, COUNT(*) FROM rolls GROUP BY user_id, fruit_name''')
+    db_logger.info("✅ Roll counters rebuilt from rolls")
+
+
+def rebuild_roll_counters() -> bool:
+    """Rebuild the rarity and fruit counters from the rolls table"""
+    conn = None
+    try:
+        db_logger.info("🔢 Rebuilding roll counters...")
+        conn = get_db_connection()
+        cur = conn.cursor()
+        _rebuild_roll_counters(cur)
+        conn.commit()
+        cur.close()
+        return_db_connection(conn)
+        invalidate_page_snapshots()
+        # Counts may have moved arbitrarily; live dashboards refetch everything
+        event_broadcaster.publish('resync', {})
+        return True
+    except Exception as e:
+        db_logger.error("❌ Error in rebuild_roll_counters: %s", e)
+        if conn:
+            conn.rollback()
+            return_db_connection(conn)
+        return False
+
+
+MEMBER_SYNC_CHUNK_SIZE = 1000
+
+
 def sync_guild_members_to_db(guild):
-    """Sync all guild members to database (bots excluded, alts added as suspended with reasons)"""
-    logger.info(f"🔄 Syncing members from guild: {guild.name}")
-    
-    synced_count = 0
+    """Sync all guild members to database (bots excluded, alts added as suspended with reasons)
+
+    Members are upserted in chunks of MEMBER_SYNC_CHUNK_SIZE with one multi-row
+    INSERT ... ON CONFLICT per chunk. Existing rows are only written when the
+    username actually changed.
+    """
+    db_logger.info("🔄 Syncing members from guild: %s", guild.name)
+    start = time.perf_counter()
+
+    rows = []
     skipped_count = 0
-    
     for member in guild.members:
         # Skip bots completely
         if member.bot:
             skipped_count += 1
             continue
-        
-        # Check if member is an alt (and get reason if so)
-        suspension_reason = None
-        is_alt = False
-        if member.id in IGNORED_ALTS:
-            is_alt = True
-            suspension_reason = IGNORED_ALTS[member.id]
-        
-        try:
-            conn = get_db_connection()
-            cur = conn.cursor()
-            cur.execute('SELECT user_id FROM users WHERE user_id = %s', (member.id,))
-            exists = cur.fetchone()
-            
-            if not exists:
-                # Add user - alts are suspended with reason, regular users are not
-                cur.execute('''INSERT INTO users (user_id, username, total_rolls, notifications_enabled, suspended, suspension_reason)
-                               VALUES (%s, %s, 0, TRUE, %s, %s)''', (member.id, member.name, is_alt, suspension_reason))
-                conn.commit()
+
+        # Alts are added suspended with their reason, regular users are not
+        suspension_reason = IGNORED_ALTS.get(member.id)
+        rows.append((member.id, member.name, 0, True, suspension_reason is not None, suspension_reason))
+
+    synced_count = 0
+    renamed_count = 0
+    conn = None
+    try:
+        conn = get_db_connection()
+        cur = conn.cursor()
+        for offset in range(0, len(rows), MEMBER_SYNC_CHUNK_SIZE):
+            chunk = rows[offset:offset + MEMBER_SYNC_CHUNK_SIZE]
+            changed = execute_values(
+                cur,
+                '''INSERT INTO users (user_id, username, total_rolls, notifications_enabled, suspended, suspension_reason)
+                   VALUES %s
+                   ON CONFLICT (user_id) DO UPDATE SET username = EXCLUDED.username
+                   WHERE users.username IS DISTINCT FROM EXCLUDED.username
+                   RETURNING user_id, username, suspension_reason, (xmax = 0) AS inserted''',
+                chunk,
+                page_size=len(chunk),
+                fetch=True
+            )
+            conn.commit()
+
+            for user_id, username, suspension_reason, inserted in changed:
+                if not inserted:
+                    user_cache.update(user_id, username=username)
+                    renamed_count += 1
+                    continue
                 synced_count += 1
-                if is_alt:
-                    logger.info(f"✨ Added ALT member (suspended): {member.name} (ID: {member.id}) - Reason: {suspension_reason}")
-                else:
-                    logger.info(f"✨ Added new member: {member.name} (ID: {member.id})")
-            else:
-                cur.execute('UPDATE users SET username = %s WHERE user_id = %s', (member.name, member.id))
-                conn.commit()
-            
-            cur.close()
+                if suspension_reason:
+                    db_logger.info("✨ Added ALT member (suspended): %s (ID: %s) - Reason: %s",
+                                   username, user_id, suspension_reason)
+        cur.close()
+        return_db_connection(conn)
+    except Exception as e:
+        db_logger.error("❌ Error syncing members of %s: %s", guild.name, e)
+        if conn:
+            conn.rollback()
             return_db_connection(conn)
-        except Exception as e:
-            logger.error(f"❌ Error syncing member {member.name}: {e}")
-            if 'conn' in locals():
-                try:
-                    conn.rollback()
-                    return_db_connection(conn)
-                except:
-                    pass
-    
-    logger.info(f"✅ Member sync complete: {synced_count} added, {skipped_count} skipped (bots)")
+
+    invalidate_page_snapshots()
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    unchanged_count = len(rows) - synced_count - renamed_count
+    db_logger.info("✅ Member sync complete in %.0fms: %s added, %s renamed, %s unchanged, %s skipped (bots)",
+                   elapsed_ms, synced_count, renamed_count, unchanged_count, skipped_count)
     return synced_count, skipped_count
 
 
@@ -603,17 +1797,32 @@ def suspend_user(user_id: int, suspend: bool = True, reason: str = None):
             return False, "User not found in database"
         
         # Update suspended status and reason
-        cur.execute('UPDATE users SET suspended = %s, suspension_reason = %s WHERE user_id = %s', 
+        cur.execute('''UPDATE users SET suspended = %s, suspension_reason = %s WHERE user_id = %s
+                       RETURNING next_roll_time, notifications_enabled''',
                    (suspend, reason, user_id))
+        next_roll_time, notifications_enabled = cur.fetchone()
         conn.commit()
         cur.close()
         return_db_connection(conn)
+
+        user_cache.update(user_id, suspended=suspend, suspension_reason=reason)
+        if suspend:
+            reminder_scheduler.cancel(user_id)
+        elif next_roll_time and notifications_enabled:
+            reminder_scheduler.schedule(user_id, next_roll_time)
+        invalidate_page_snapshots()
+        event_broadcaster.publish('suspension', {
+            'user_id': str(user_id),
+            'username': user[0],
+            'suspended': suspend,
+            'reason': reason
+        })
         
         status = "SUSPENDED" if suspend else "UNSUSPENDED"
-        logger.info(f"✅ User {user[0]} (ID: {user_id}) {status}" + (f" - Reason: {reason}" if reason else ""))
+        db_logger.info("✅ User %s (ID: %s) %s%s", user[0], user_id, status, f" - Reason: {reason}" if reason else "")
         return True, f"User {user[0]} {status.lower()}"
     except Exception as e:
-        logger.error(f"❌ Error in suspend_user: {e}")
+        db_logger.error("❌ Error in suspend_user: %s", e)
         if 'conn' in locals():
             try:
                 conn.rollback()
@@ -623,6 +1832,71 @@ def suspend_user(user_id: int, suspend: bool = True, reason: str = None):
         return False, f"Error: {str(e)}"
 
 
+def get_pending_reminders() -> List[Dict]:
+    """Get every user who is waiting on a roll reminder"""
+    conn = None
+    try:
+        db_logger.debug("⏰ Fetching pending reminders")
+        conn = get_db_connection()
+        cur = conn.cursor(cursor_factory=RealDictCursor)
+        cur.execute('''SELECT user_id, next_roll_time
+                       FROM users
+                       WHERE next_roll_time IS NOT NULL
+                         AND notifications_enabled
+                         AND NOT COALESCE(suspended, FALSE)''')
+        rows = cur.fetchall()
+        cur.close()
+        return_db_connection(conn)
+        return [dict(row) for row in rows]
+    except Exception as e:
+        db_logger.error("❌ Error in get_pending_reminders: %s", e)
+        if conn:
+            conn.rollback()
+            return_db_connection(conn)
+        return []
+
+
+def claim_due_reminders(now: datetime) -> Optional[List[Dict]]:
+    """Claim every due reminder and clear its next_roll_time in a single statement
+
+    Claiming before sending means a reminder is never sent twice, even if the
+    send fails or the bot restarts mid-cycle. Rows locked by a concurrent claim
+    are skipped rather than waited on. Returns None if the claim failed, so
+    the caller can try again.
+    """
+    conn = None
+    try:
+        db_logger.debug("⏰ Claiming due reminders")
+        conn = get_db_connection()
+        cur = conn.cursor(cursor_factory=RealDictCursor)
+        cur.execute('''UPDATE users u
+                       SET next_roll_time = NULL
+                       FROM (SELECT user_id, next_roll_time
+                             FROM users
+                             WHERE next_roll_time <= %s
+                               AND notifications_enabled
+                               AND NOT COALESCE(suspended, FALSE)
+                             FOR UPDATE SKIP LOCKED) due
+                       WHERE u.user_id = due.user_id
+                       RETURNING u.user_id, u.username, due.next_roll_time''', (now,))
+        rows = cur.fetchall()
+        conn.commit()
+        cur.close()
+        return_db_connection(conn)
+        for row in rows:
+            user_cache.update(row['user_id'], next_roll_time=None)
+        if rows:
+            invalidate_page_snapshots()
+        db_logger.debug("✅ Claimed %s due reminder(s)", len(rows))
+        return [dict(row) for row in rows]
+    except Exception as e:
+        db_logger.error("❌ Error in claim_due_reminders: %s", e)
+        if conn:
+            conn.rollback()
+            return_db_connection(conn)
+        return None
+
+
 def get_suspended_users():
     """Get all suspended users"""
     try:
@@ -633,10 +1907,52 @@ def get_suspended_users():
         rows = cur.fetchall()
         cur.close()
         return_db_connection(conn)
-        return [dict(row) for row in rows]
+        return [dict(row) for row in rows]
+    except Exception as e:
+        db_logger.error("❌ Error getting suspended users: %s", e)
+        return []
+
+
+def get_bot_state(key: str) -> Optional[str]:
+    """Read a value from the bot_state key/value table"""
+    conn = None
+    try:
+        conn = get_db_connection()
+        cur = conn.cursor()
+        cur.execute('SELECT value FROM bot_state WHERE key = %s', (key,))
+        row = cur.fetchone()
+        cur.close()
+        return_db_connection(conn)
+        return row[0] if row else None
+    except Exception as e:
+        db_logger.error("❌ Error reading bot state '%s': %s", key, e)
+        if conn:
+            conn.rollback()
+            return_db_connection(conn)
+        return None
+
+
+def set_bot_state(key: str, value: str) -> bool:
+    """Write a value to the bot_state key/value table"""
+    conn = None
+    try:
+        conn = get_db_connection()
+        cur = conn.cursor()
+        cur.execute('''INSERT INTO bot_state (key, value, updated_at)
+                       VALUES (%s, %s, CURRENT_TIMESTAMP)
+                       ON CONFLICT (key) DO UPDATE
+                           SET value = EXCLUDED.value, updated_at = EXCLUDED.updated_at''',
+                    (key, value))
+        conn.commit()
+        cur.close()
+        return_db_connection(conn)
+        return True
     except Exception as e:
-        logger.error(f"❌ Error getting suspended users: {e}")
-        return []
+        db_logger.error("❌ Error writing bot state '%s': %s", key, e)
+        if conn:
+            conn.rollback()
+            return_db_connection(conn)
+        return False
 
 
 # Fruit list with rarities (Blox Fruits)
@@ -728,7 +2044,7 @@ class FruitSelectionView(discord.ui.View):
         self.total_pages = total_pages
         self.current_page = current_page
         
-        logger.debug(f"🎮 Created FruitSelectionView for user {user_id}: {page_name}")
+        ui_logger.debug("🎮 Created FruitSelectionView for user %s: %s", user_id, page_name)
 
         # Create buttons for fruits (up to 20 buttons per page, 4 rows of 5)
         for i, fruit in enumerate(fruits_list[:20]):
@@ -760,8 +2076,16 @@ class FruitSelectionView(discord.ui.View):
             
             logger.info(f"✅ Valid fruit selection: {fruit_name} ({fruit_data['rarity']})")
 
-            # Log the roll
-            log_roll(self.user_id, interaction.user.name, fruit_name)
+            # Log the roll (cooldown and suspension are enforced by the database)
+            user_row = await run_db(log_roll, self.user_id, interaction.user.name, fruit_name)
+            if not user_row:
+                logger.warning(f"⏰ Roll not logged for {interaction.user}")
+                await interaction.response.edit_message(
+                    content="❌ Couldn't log this roll. It may already be logged, or you're still on cooldown.",
+                    embed=None,
+                    view=None
+                )
+                return
 
             # Send public message
             channel = interaction.channel
@@ -782,8 +2106,8 @@ class FruitSelectionView(discord.ui.View):
                 f"🎲 **{display_name}** just rolled {rarity_display} **{fruit_name}** {fruit_data['emoji']} ({fruit_data['rarity']})!")
 
             # Update ephemeral message
-            next_roll_time = datetime.now(timezone.utc) + timedelta(hours=ROLL_COOLDOWN_HOURS)
-            logger.debug(f"📝 Updating ephemeral message for user")
+            next_roll_time = user_row['next_roll_time']
+            ui_logger.debug("📝 Updating ephemeral message for user")
             await interaction.response.edit_message(
                 content=f"✅ Logged your roll: {fruit_data['emoji']} **{fruit_name}** ({fruit_data['rarity']})\n⏰ Next roll available <t:{int(next_roll_time.timestamp())}:R>",
                 view=None
@@ -799,7 +2123,7 @@ class PageSelectionView(discord.ui.View):
     def __init__(self, user_id: int):
         super().__init__(timeout=180)
         self.user_id = user_id
-        logger.debug(f"🎮 Created PageSelectionView for user {user_id}")
+        ui_logger.debug("🎮 Created PageSelectionView for user %s", user_id)
 
     @discord.ui.button(label="📝 Alphabetical Order", style=discord.ButtonStyle.primary, row=0)
     async def alphabetical(self, interaction: discord.Interaction, button: discord.ui.Button):
@@ -818,7 +2142,7 @@ class PageSelectionView(discord.ui.View):
             color=discord.Color.blue()
         )
         await interaction.response.edit_message(embed=embed, view=view)
-        logger.debug("✅ Switched to alphabetical pages view")
+        ui_logger.debug("✅ Switched to alphabetical pages view")
 
     @discord.ui.button(label="✨ Sort by Rarity", style=discord.ButtonStyle.secondary, row=0)
     async def by_rarity(self, interaction: discord.Interaction, button: discord.ui.Button):
@@ -837,7 +2161,7 @@ class PageSelectionView(discord.ui.View):
             color=discord.Color.purple()
         )
         await interaction.response.edit_message(embed=embed, view=view)
-        logger.debug("✅ Switched to rarity selection view")
+        ui_logger.debug("✅ Switched to rarity selection view")
 
 
 class AlphabeticalPagesView(discord.ui.View):
@@ -853,7 +2177,7 @@ class AlphabeticalPagesView(discord.ui.View):
         for i in range(0, len(fruits_sorted), 20):
             self.pages.append(fruits_sorted[i:i + 20])
         
-        logger.debug(f"📄 Created {len(self.pages)} alphabetical pages")
+        ui_logger.debug("📄 Created %s alphabetical pages", len(self.pages))
 
     @discord.ui.button(label="Page 1 (Blade-Gas)", style=discord.ButtonStyle.primary, row=0)
     async def page1(self, interaction: discord.Interaction, button: discord.ui.Button):
@@ -938,7 +2262,7 @@ class RaritySelectionView(discord.ui.View):
     def __init__(self, user_id: int):
         super().__init__(timeout=180)
         self.user_id = user_id
-        logger.debug(f"🎮 Created RaritySelectionView for user {user_id}")
+        ui_logger.debug("🎮 Created RaritySelectionView for user %s", user_id)
 
     @discord.ui.button(label="⚪ Common", style=discord.ButtonStyle.secondary, emoji="⚪", row=0)
     async def common(self, interaction: discord.Interaction, button: discord.ui.Button):
@@ -1016,7 +2340,145 @@ class RaritySelectionView(discord.ui.View):
         embed.set_footer(text=f"⏱️ You have 3 minutes • {len(fruits_list)} {rarity} fruits")
 
         await interaction.response.edit_message(embed=embed, view=view)
-        logger.debug(f"✅ Showing {len(fruits_list)} {rarity} fruits")
+        ui_logger.debug("✅ Showing %s %s fruits", len(fruits_list), rarity)
+
+
+class RollHistoryView(discord.ui.View):
+    """Older/newer buttons for /fruits, loading one page of rolls per click"""
+
+    def __init__(self, user_id: int, total_rolls: int, rarity_counts: Dict):
+        super().__init__(timeout=180)
+        self.user_id = user_id
+        self.total_rolls = total_rolls
+        self.rarity_counts = rarity_counts
+        self.total_pages = max(1, -(-total_rolls // ROLL_HISTORY_PAGE_SIZE))
+        self.page = 1
+        self.first_roll = None
+        self.last_roll = None
+        ui_logger.debug("🎮 Created RollHistoryView for user %s: %s pages", user_id, self.total_pages)
+
+    def show_page(self, rolls: List[Dict], page: int, has_older: bool, has_newer: bool) -> discord.Embed:
+        """Remember the page edges, update the buttons and build the embed"""
+        self.page = page
+        self.first_roll = (rolls[0]['time'], rolls[0]['id'])
+        self.last_roll = (rolls[-1]['time'], rolls[-1]['id'])
+        self.newer.disabled = not has_newer
+        self.older.disabled = not has_older
+
+        rarity_counts = self.rarity_counts
+        embed = discord.Embed(
+            title="🍎 Your Fruit Roll History",
+            description=f"**Total Rolls:** {self.total_rolls}\n\n**By Rarity:**\n⚪ Common: {rarity_counts['Common']} | 🔵 Uncommon: {rarity_counts['Uncommon']} | 🟣 Rare: {rarity_counts['Rare']}\n🔮 Legendary: {rarity_counts['Legendary']} | 🔴 Mythic: {rarity_counts['Mythic']}",
+            color=discord.Color.purple()
+        )
+
+        rarity_emoji = {
+            "Common": "⚪",
+            "Uncommon": "🔵",
+            "Rare": "🟣",
+            "Legendary": "🔮",
+            "Mythic": "🔴"
+        }
+        first_number = (page - 1) * ROLL_HISTORY_PAGE_SIZE + 1
+        for i, roll in enumerate(rolls, first_number):
+            fruit_name = roll['fruit']
+            timestamp = int(roll['time'].timestamp())
+
+            # Get fruit data
+            if fruit_name in FRUITS_DATA:
+                fruit_data = FRUITS_DATA[fruit_name]
+                emoji = rarity_emoji.get(fruit_data["rarity"], "⚪")
+                display_name = f"{emoji} {fruit_data['emoji']} {fruit_name}"
+            else:
+                display_name = f"🍎 {fruit_name}"
+
+            embed.add_field(
+                name=f"{i}. {display_name}",
+                value=f"<t:{timestamp}:R>",
+                inline=True
+            )
+
+        if self.total_rolls > ROLL_HISTORY_PAGE_SIZE:
+            embed.set_footer(text=f"Page {page}/{self.total_pages} • Showing {first_number}-{first_number + len(rolls) - 1} of {self.total_rolls} rolls")
+        else:
+            embed.set_footer(text="SorynTech Blox Fruits Tracker")
+        return embed
+
+    async def load_page(self, interaction: discord.Interaction, newer: bool):
+        if interaction.user.id != self.user_id:
+            await interaction.response.send_message("❌ This history is not for you!", ephemeral=True)
+            return
+
+        edge = self.first_roll if newer else self.last_roll
+        rolls, has_more = await run_db(get_user_rolls_page, self.user_id, edge, newer)
+        if not rolls:
+            # Nothing further that way any more (e.g. history changed), just disable the button
+            (self.newer if newer else self.older).disabled = True
+            await interaction.response.edit_message(view=self)
+            return
+
+        if newer:
+            page = max(1, self.page - 1)
+            embed = self.show_page(rolls, page, has_older=True, has_newer=has_more)
+        else:
+            embed = self.show_page(rolls, self.page + 1, has_older=has_more, has_newer=True)
+        await interaction.response.edit_message(embed=embed, view=self)
+        ui_logger.debug("📄 Showing roll history page %s for user %s", self.page, self.user_id)
+
+    @discord.ui.button(label="◀ Newer", style=discord.ButtonStyle.secondary, row=0)
+    async def newer(self, interaction: discord.Interaction, button: discord.ui.Button):
+        logger.info(f"📄 Newer rolls requested by {interaction.user}")
+        await self.load_page(interaction, newer=True)
+
+    @discord.ui.button(label="Older ▶", style=discord.ButtonStyle.primary, row=0)
+    async def older(self, interaction: discord.Interaction, button: discord.ui.Button):
+        logger.info(f"📄 Older rolls requested by {interaction.user}")
+        await self.load_page(interaction, newer=False)
+
+
+# Slash command sync - tree.sync() is a rate-limited global API call, so it only
+# runs when the fingerprint of the local command tree differs from the last one synced
+COMMAND_TREE_STATE_KEY = 'command_tree_hash'
+
+
+def command_tree_fingerprint() -> str:
+    """Hash the payload Discord would receive for the global command tree
+
+    Command.to_dict(tree) needs discord.py 2.4+, which requirements.txt pins.
+    """
+    payload = sorted((cmd.to_dict(bot.tree) for cmd in bot.tree.get_commands()),
+                     key=lambda cmd: cmd['name'])
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+async def sync_command_tree(force: bool = False) -> Optional[int]:
+    """Sync slash commands if the tree changed (or when forced). Returns the synced count, or None if skipped"""
+    fingerprint = command_tree_fingerprint()
+    if not force:
+        synced_fingerprint = await run_db(get_bot_state, COMMAND_TREE_STATE_KEY)
+        if synced_fingerprint == fingerprint:
+            logger.info(f"⏭️  Slash commands unchanged (hash {fingerprint[:12]}), skipping sync")
+            return None
+
+    logger.info("🔄 Syncing slash commands with Discord...")
+    synced = await bot.tree.sync()
+    logger.info(f"✅ Successfully synced {len(synced)} slash command(s):")
+    for cmd in synced:
+        logger.info(f"   - /{cmd.name}")
+    await run_db(set_bot_state, COMMAND_TREE_STATE_KEY, fingerprint)
+    return len(synced)
+
+
+@bot.event
+async def setup_hook():
+    """Runs once after login, before the gateway connects - not on every reconnect like on_ready"""
+    try:
+        await sync_command_tree()
+    except Exception as e:
+        logger.error(f"❌ Failed to sync commands: {e}")
+
+
+startup_complete = False
 
 
 @bot.event
@@ -1035,31 +2497,30 @@ async def on_ready():
     for guild in bot.guilds:
         logger.info(f"   - {guild.name} (ID: {guild.id}, Members: {guild.member_count})")
 
-    # Initialize database
-    init_database()
+    # on_ready fires again after every gateway reconnect. Writes keep the
+    # database and the reminder scheduler current while connected, so the
+    # expensive startup work only runs once per process.
+    global startup_complete
+    if startup_complete:
+        logger.info("🔄 Reconnected to Discord, skipping startup sync")
+        return
+    startup_complete = True
 
     # Sync guild members to database
     logger.info("=" * 80)
     logger.info("👥 SYNCING GUILD MEMBERS")
     logger.info("=" * 80)
     for guild in bot.guilds:
-        synced, skipped = sync_guild_members_to_db(guild)
+        synced, skipped = await run_db(sync_guild_members_to_db, guild)
     logger.info("✅ Member sync complete")
     logger.info("=" * 80)
 
     # Update active users count
-    stats['active_users'] = len(get_all_users())
+    stats['active_users'] = await run_db(count_users)
     logger.info(f"👥 Active users in database: {stats['active_users']}")
 
-    # Sync slash commands
-    logger.info("🔄 Syncing slash commands with Discord...")
-    try:
-        synced = await bot.tree.sync()
-        logger.info(f"✅ Successfully synced {len(synced)} slash command(s):")
-        for cmd in synced:
-            logger.info(f"   - /{cmd.name}")
-    except Exception as e:
-        logger.error(f"❌ Failed to sync commands: {e}")
+    # Load pending reminders into the scheduler
+    reminder_scheduler.load(await run_db(get_pending_reminders))
 
     logger.info("=" * 80)
     logger.info("✅ BOT FULLY INITIALIZED AND READY")
@@ -1129,81 +2590,48 @@ async def notify_initial_users():
         logger.error(f"❌ Failed to send startup notification: {e}", exc_info=True)
 
 
-# Notification checker task
-@tasks.loop(minutes=1)
+# Notification checker task - sleeps on the reminder scheduler instead of polling
+REMINDER_CLAIM_RETRY_SECONDS = 30
+
+
+@tasks.loop(seconds=0)
 async def notification_checker():
-    """Check for users who need roll reminders"""
-    logger.debug("⏰ Notification checker running...")
-    now = datetime.now(timezone.utc)
-    users = get_all_users()
+    """Send roll reminders as soon as they fall due"""
+    await reminder_scheduler.wait_until_due()
+    scheduler_logger.debug("⏰ Notification checker running...")
 
     # Get notification channel
     channel = bot.get_channel(NOTIFICATION_CHANNEL_ID)
     if not channel:
         logger.error(f"❌ Could not find notification channel with ID {NOTIFICATION_CHANNEL_ID}")
+        await asyncio.sleep(60)
         return
 
-    notifications_sent = 0
-    for user_data in users:
-        if not user_data['notifications_enabled']:
-            continue
+    now = datetime.now(timezone.utc)
+    due_ids = reminder_scheduler.pop_due(now)
+    if not due_ids:
+        return
+    cycle_started = time.perf_counter()
+
+    # Claim and clear every due reminder up front so nobody gets pinged twice
+    users = await run_db(claim_due_reminders, now)
+    if users is None:
+        # Nothing was claimed, so the rows are still due; try again shortly
+        reminder_scheduler.retry(due_ids, now + timedelta(seconds=REMINDER_CLAIM_RETRY_SECONDS))
+        logger.warning(f"⚠️  Claiming {len(due_ids)} due reminder(s) failed, retrying in {REMINDER_CLAIM_RETRY_SECONDS}s")
+        return
 
-        if user_data['next_roll_time'] and user_data['next_roll_time'] <= now:
-            try:
-                display_name = get_display_name(user_data['user_id'], user_data['username'])
-                logger.info(f"🔔 Sending roll reminder to {display_name} ({user_data['username']}, ID: {user_data['user_id']})")
-                
-                # Special embed for Dad
-                if user_data['user_id'] == DAD_USER_ID:
-                    embed = discord.Embed(
-                        title="🎲 Fruity rolly ready!",
-                        description=f"Daddy's fruit rolly cooldown is all doney woney :3",
-                        color=discord.Color.gold()
-                    )
-                    embed.add_field(
-                        name="📝 Log your rolly",
-                        value="Use `/fruit-roll` to loggy your next fruit roll!",
-                        inline=False
-                    )
-                    embed.set_footer(text="Use /sleep to disable able these reminders tee hee :3c")
-                    mention_text = f"**Blox Fruits Notifier:** Daddy Lucian Your fruit roll is weddy when you are :3c ||<@{user_data['user_id']}>||"
-                else:
-                    embed = discord.Embed(
-                        title="🎲 Fruit Roll Ready!",
-                        description=f"**{display_name}**'s fruit roll cooldown is complete!",
-                        color=discord.Color.gold()
-                    )
-                    embed.add_field(
-                        name="📝 Log Your Roll",
-                        value="Use `/fruit-roll` to log your next fruit roll!",
-                        inline=False
-                    )
-                    embed.set_footer(text="Use /sleep to disable these reminders")
-                    mention_text = f"<@{user_data['user_id']}>"
-
-                await channel.send(content=mention_text, embed=embed)
-                notifications_sent += 1
-
-                # Clear next_roll_time so we don't spam
-                try:
-                    conn = get_db_connection()
-                    cur = conn.cursor()
-                    cur.execute('UPDATE users SET next_roll_time = NULL WHERE user_id = %s',
-                                (user_data['user_id'],))
-                    conn.commit()
-                    cur.close()
-                    return_db_connection(conn)
-                except Exception as e:
-                    logger.error(f"❌ Error updating next_roll_time: {e}")
-
-                logger.info(f"✅ Sent roll reminder to {display_name}")
-            except Exception as e:
-                logger.error(f"❌ Failed to send reminder to {user_data['user_id']}: {e}")
-    
-    if notifications_sent > 0:
-        logger.info(f"📬 Sent {notifications_sent} roll reminder(s) this cycle")
+    # Sending happens on the delivery workers, so the cycle lasts as long as
+    # the claim no matter how many reminders are due or how slow Discord is
+    messages = reminder_dispatcher.build_messages(users)
+    for message in messages:
+        await reminder_workers.enqueue(channel, message)
+
+    checker_cycle_latency.observe(time.perf_counter() - cycle_started)
+    if users:
+        logger.info(f"📬 Queued {len(users)} roll reminder(s) in {len(messages)} message(s) this cycle")
     else:
-        logger.debug("✅ No reminders to send this cycle")
+        scheduler_logger.debug("✅ No reminders to send this cycle")
 
 
 @notification_checker.before_loop
@@ -1215,6 +2643,7 @@ async def before_notification_checker():
 
 # Slash Commands
 @bot.tree.command(name='fruit-roll', description='Log your fruit roll')
+@timed_command
 async def fruit_roll(interaction: discord.Interaction):
     """Log a fruit roll"""
     logger.info("=" * 80)
@@ -1224,13 +2653,9 @@ async def fruit_roll(interaction: discord.Interaction):
     
     log_command_usage('fruit-roll', interaction.user.id)
 
-    # Check if user exists, create if not
-    logger.debug("👤 Checking if user exists in database...")
-    user_data = get_user(interaction.user.id)
-    if not user_data:
-        logger.info("✨ User not found, creating new user entry...")
-        create_or_update_user(interaction.user.id, interaction.user.name)
-        user_data = get_user(interaction.user.id)
+    # New users are created when their first roll is logged
+    logger.debug("👤 Checking user status in database...")
+    user_data = await run_db(get_user, interaction.user.id)
 
     # Check if user is suspended
     if user_data and user_data.get('suspended', False):
@@ -1291,12 +2716,17 @@ async def fruit_roll(interaction: discord.Interaction):
 
 
 @bot.tree.command(name='fruits', description='View all your rolled fruits')
+@timed_command
 async def fruits(interaction: discord.Interaction):
     """View all rolled fruits for the user"""
     logger.info(f"📊 /fruits command invoked by {interaction.user} (ID: {interaction.user.id})")
     log_command_usage('fruits', interaction.user.id)
 
-    rolls = get_user_rolls(interaction.user.id)
+    user_rarity_counts, (rolls, has_older) = await asyncio.gather(
+        run_db(get_user_rarity_counts, interaction.user.id),
+        run_db(get_user_rolls_page, interaction.user.id)
+    )
+    total_rolls = sum(user_rarity_counts.values())
 
     if not rolls:
         logger.info(f"⚠️  User {interaction.user} has no rolls yet")
@@ -1308,70 +2738,38 @@ async def fruits(interaction: discord.Interaction):
         await interaction.response.send_message(embed=embed, ephemeral=True)
         return
 
-    logger.info(f"📊 User has {len(rolls)} total rolls")
+    logger.info(f"📊 User has {total_rolls} total rolls")
 
-    # Count fruits by rarity
+    # Rarity breakdown from the maintained counters
     rarity_counts = {"Common": 0, "Uncommon": 0, "Rare": 0, "Legendary": 0, "Mythic": 0}
-    for roll in rolls:
-        fruit_name = roll['fruit']
-        if fruit_name in FRUITS_DATA:
-            rarity = FRUITS_DATA[fruit_name]["rarity"]
-            rarity_counts[rarity] += 1
-
-    logger.debug(f"Rarity breakdown: {rarity_counts}")
-
-    embed = discord.Embed(
-        title="🍎 Your Fruit Roll History",
-        description=f"**Total Rolls:** {len(rolls)}\n\n**By Rarity:**\n⚪ Common: {rarity_counts['Common']} | 🔵 Uncommon: {rarity_counts['Uncommon']} | 🟣 Rare: {rarity_counts['Rare']}\n🔮 Legendary: {rarity_counts['Legendary']} | 🔴 Mythic: {rarity_counts['Mythic']}",
-        color=discord.Color.purple()
-    )
+    for rarity, count in user_rarity_counts.items():
+        if rarity in rarity_counts:
+            rarity_counts[rarity] = count
 
-    # Show up to 25 most recent rolls
-    for i, roll in enumerate(rolls[:25], 1):
-        fruit_name = roll['fruit']
-        timestamp = int(roll['time'].timestamp())
-
-        # Get fruit data
-        if fruit_name in FRUITS_DATA:
-            fruit_data = FRUITS_DATA[fruit_name]
-            rarity_emoji = {
-                "Common": "⚪",
-                "Uncommon": "🔵",
-                "Rare": "🟣",
-                "Legendary": "🔮",
-                "Mythic": "🔴"
-            }
-            emoji = rarity_emoji.get(fruit_data["rarity"], "⚪")
-            display_name = f"{emoji} {fruit_data['emoji']} {fruit_name}"
-        else:
-            display_name = f"🍎 {fruit_name}"
+    logger.debug("Rarity breakdown: %s", rarity_counts)
 
-        embed.add_field(
-            name=f"{i}. {display_name}",
-            value=f"<t:{timestamp}:R>",
-            inline=True
-        )
+    view = RollHistoryView(interaction.user.id, total_rolls, rarity_counts)
+    embed = view.show_page(rolls, 1, has_older=has_older, has_newer=False)
 
-    if len(rolls) > 25:
-        embed.set_footer(text=f"Showing 25 of {len(rolls)} rolls")
+    if has_older:
+        await interaction.response.send_message(embed=embed, view=view, ephemeral=True)
     else:
-        embed.set_footer(text="SorynTech Blox Fruits Tracker")
-
-    await interaction.response.send_message(embed=embed, ephemeral=True)
+        await interaction.response.send_message(embed=embed, ephemeral=True)
     logger.info(f"✅ Sent roll history to {interaction.user}")
 
 
 @bot.tree.command(name='sleep', description='Disable fruit roll reminders')
+@timed_command
 async def sleep_mode(interaction: discord.Interaction):
     """Disable roll reminders"""
     logger.info(f"💤 /sleep command invoked by {interaction.user} (ID: {interaction.user.id})")
     log_command_usage('sleep', interaction.user.id)
 
-    user_data = get_user(interaction.user.id)
+    user_data = await run_db(get_user, interaction.user.id)
     if not user_data:
-        create_or_update_user(interaction.user.id, interaction.user.name)
+        await run_db(create_or_update_user, interaction.user.id, interaction.user.name)
 
-    toggle_notifications(interaction.user.id, False)
+    await run_db(toggle_notifications, interaction.user.id, False)
 
     embed = discord.Embed(
         title="💤 Sleep Mode Enabled",
@@ -1389,16 +2787,17 @@ async def sleep_mode(interaction: discord.Interaction):
 
 
 @bot.tree.command(name='awake', description='Enable fruit roll reminders')
+@timed_command
 async def awake_mode(interaction: discord.Interaction):
     """Enable roll reminders"""
     logger.info(f"☀️ /awake command invoked by {interaction.user} (ID: {interaction.user.id})")
     log_command_usage('awake', interaction.user.id)
 
-    user_data = get_user(interaction.user.id)
+    user_data = await run_db(get_user, interaction.user.id)
     if not user_data:
-        create_or_update_user(interaction.user.id, interaction.user.name)
+        await run_db(create_or_update_user, interaction.user.id, interaction.user.name)
 
-    toggle_notifications(interaction.user.id, True)
+    await run_db(toggle_notifications, interaction.user.id, True)
 
     embed = discord.Embed(
         title="☀️ Awake Mode Enabled",
@@ -1417,6 +2816,7 @@ async def awake_mode(interaction: discord.Interaction):
 
 # Owner Commands
 @bot.tree.command(name='stats-link', description='[OWNER] Get the stats page link')
+@timed_command
 async def stats_link(interaction: discord.Interaction):
     """Get stats page credentials"""
     logger.info(f"📊 /stats-link command invoked by {interaction.user} (ID: {interaction.user.id})")
@@ -1446,6 +2846,7 @@ async def stats_link(interaction: discord.Interaction):
     user_id='The Discord user ID to suspend/unsuspend',
     reason='Optional reason for suspension'
 )
+@timed_command
 async def suspend_command(interaction: discord.Interaction, user_id: str, reason: str = None):
     """Suspend or unsuspend a user from using the bot"""
     logger.info(f"🔒 /suspend command invoked by {interaction.user} (ID: {interaction.user.id})")
@@ -1463,24 +2864,20 @@ async def suspend_command(interaction: discord.Interaction, user_id: str, reason
         return
     
     try:
-        conn = get_db_connection()
-        cur = conn.cursor()
-        cur.execute('SELECT username, suspended FROM users WHERE user_id = %s', (target_user_id,))
-        user_data = cur.fetchone()
-        cur.close()
-        return_db_connection(conn)
+        user_data = await run_db(get_user, target_user_id)
         
         if not user_data:
             await interaction.response.send_message(f"❌ User ID {target_user_id} not found in database.", ephemeral=True)
             return
         
-        username, currently_suspended = user_data
+        username = user_data['username']
+        currently_suspended = user_data.get('suspended', False)
         new_status = not currently_suspended
         
         # Use provided reason or clear it when unsuspending
         suspension_reason = reason if new_status else None
         
-        success, message = suspend_user(target_user_id, new_status, suspension_reason)
+        success, message = await run_db(suspend_user, target_user_id, new_status, suspension_reason)
         
         if success:
             status_emoji = "🔒" if new_status else "🔓"
@@ -1504,6 +2901,47 @@ async def suspend_command(interaction: discord.Interaction, user_id: str, reason
         await interaction.response.send_message(f"❌ An error occurred: {str(e)}", ephemeral=True)
 
 
+@bot.tree.command(name='rebuild-counters', description='[OWNER] Rebuild roll counters from the rolls table')
+@timed_command
+async def rebuild_counters_command(interaction: discord.Interaction):
+    """Recompute the rarity and fruit counters from every logged roll"""
+    logger.info(f"🔢 /rebuild-counters command invoked by {interaction.user} (ID: {interaction.user.id})")
+    log_command_usage('rebuild-counters', interaction.user.id)
+
+    if interaction.user.id != OWNER_ID:
+        logger.warning(f"⚠️  Unauthorized rebuild-counters attempt by {interaction.user}")
+        await interaction.response.send_message("❌ Owner only command", ephemeral=True)
+        return
+
+    await interaction.response.defer(ephemeral=True)
+    success = await run_db(rebuild_roll_counters)
+    if success:
+        await interaction.followup.send("✅ Roll counters rebuilt from the rolls table.", ephemeral=True)
+    else:
+        await interaction.followup.send("❌ Failed to rebuild roll counters, check the logs.", ephemeral=True)
+
+
+@bot.tree.command(name='sync-commands', description='[OWNER] Force a slash command sync with Discord')
+@timed_command
+async def sync_commands_command(interaction: discord.Interaction):
+    """Push the command tree to Discord even if its fingerprint hasn't changed"""
+    logger.info(f"🔄 /sync-commands command invoked by {interaction.user} (ID: {interaction.user.id})")
+    log_command_usage('sync-commands', interaction.user.id)
+
+    if interaction.user.id != OWNER_ID:
+        logger.warning(f"⚠️  Unauthorized sync-commands attempt by {interaction.user}")
+        await interaction.response.send_message("❌ Owner only command", ephemeral=True)
+        return
+
+    await interaction.response.defer(ephemeral=True)
+    try:
+        count = await sync_command_tree(force=True)
+        await interaction.followup.send(f"✅ Synced {count} slash command(s) with Discord.", ephemeral=True)
+    except Exception as e:
+        logger.error(f"❌ Failed to sync commands: {e}")
+        await interaction.followup.send(f"❌ Failed to sync commands: {e}", ephemeral=True)
+
+
 # Web server functions
 def check_auth(request) -> bool:
     """Check HTTP Basic Auth"""
@@ -1529,6 +2967,191 @@ def get_auth_response():
     )
 
 
+# Static assets
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'static')
+STATIC_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+# /favicon.ico has a fixed URL, so browsers revalidate it with If-None-Match after a day
+FAVICON_CACHE_CONTROL = 'public, max-age=86400'
+COMPRESSIBLE_TYPES = ('text/', 'application/json', 'application/javascript')
+COMPRESSION_MIN_BYTES = 512
+
+
+class StaticAsset:
+    """A file held in memory with its fingerprinted URL, strong ETag and pre-compressed bodies"""
+
+    def __init__(self, name: str, body: bytes, content_type: Optional[str] = None):
+        self.name = name
+        self.body = body
+        digest = hashlib.sha256(body).hexdigest()
+        stem, ext = os.path.splitext(name)
+        self.url = f"/static/{stem}.{digest[:12]}{ext}"
+        self.etag = '"' + digest[:32] + '"'
+        self.content_type = content_type or mimetypes.guess_type(name)[0] or 'application/octet-stream'
+        self.charset = 'utf-8' if self.content_type.startswith(COMPRESSIBLE_TYPES) else None
+        candidates = {'gzip': gzip.compress(body, 9)}
+        if brotli is not None:
+            candidates['br'] = brotli.compress(body)
+        # Formats that are already compressed (PNG and the like) are only sent as-is
+        self.encodings = {encoding: compressed for encoding, compressed in candidates.items()
+                          if len(compressed) < len(body) * 0.9}
+
+    def response(self, request, cache_control: str) -> web.Response:
+        """304 if the client already has this version, else the best encoding it accepts"""
+        headers = {'Cache-Control': cache_control, 'ETag': self.etag}
+        if etag_matches(request, self.etag):
+            if self.encodings:
+                headers['Vary'] = 'Accept-Encoding'
+            return web.Response(status=304, headers=headers)
+        return negotiated_response(request, self.body, self.encodings, self.content_type, self.charset, headers)
+
+
+class StaticAssetRegistry:
+    """Files read into memory once at startup, looked up by name or by fingerprinted URL"""
+
+    def __init__(self):
+        self._by_name: Dict[str, StaticAsset] = {}
+        self._by_filename: Dict[str, StaticAsset] = {}
+
+    def __len__(self) -> int:
+        return len(self._by_name)
+
+    def add(self, name: str, body: bytes, content_type: Optional[str] = None) -> StaticAsset:
+        asset = StaticAsset(name, body, content_type)
+        self._by_name[name] = asset
+        self._by_filename[asset.url.rsplit('/', 1)[1]] = asset
+        return asset
+
+    def load_file(self, path: str, name: Optional[str] = None,
+                  content_type: Optional[str] = None) -> Optional[StaticAsset]:
+        """Read one file; a missing file is logged and skipped so the bot still starts"""
+        try:
+            with open(path, 'rb') as f:
+                body = f.read()
+        except OSError as e:
+            logger.warning(f"⚠️  Static asset {path} not loaded: {e}")
+            return None
+        return self.add(name or os.path.basename(path), body, content_type)
+
+    def load_directory(self, directory: str):
+        """Load every file directly inside ``directory`` under its own name"""
+        if os.path.isdir(directory):
+            for name in sorted(os.listdir(directory)):
+                path = os.path.join(directory, name)
+                if os.path.isfile(path):
+                    self.load_file(path, name)
+
+    def get(self, name: str) -> Optional[StaticAsset]:
+        return self._by_name.get(name)
+
+    def find(self, filename: str) -> Optional[StaticAsset]:
+        """Asset for the last path segment of its fingerprinted URL"""
+        return self._by_filename.get(filename)
+
+    def url(self, name: str) -> str:
+        return self._by_name[name].url
+
+
+# Read once at startup so asset URLs change whenever their content does
+static_assets = StaticAssetRegistry()
+static_assets.load_directory(STATIC_DIR)
+static_assets.load_file(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'favicon.ico'),
+                        content_type='image/x-icon')
+logger.info(f"📦 Loaded {len(static_assets)} static assets")
+
+
+def static_url(name: str) -> str:
+    """Fingerprinted URL of a file in static/, for use in page templates"""
+    return static_assets.url(name)
+
+
+# Content codings in order of preference
+ENCODING_PREFERENCE = ('br', 'gzip')
+
+
+def negotiate_encoding(request, available) -> Optional[str]:
+    """Best content coding that the client accepts and ``available`` has (br, then gzip), else None"""
+    accepted, refused = set(), set()
+    for part in request.headers.get('Accept-Encoding', '').split(','):
+        coding, _, params = part.strip().partition(';')
+        params = params.replace(' ', '')
+        if params in ('q=0', 'q=0.0', 'q=0.00', 'q=0.000'):
+            refused.add(coding.strip().lower())
+            continue
+        accepted.add(coding.strip().lower())
+    for encoding in ENCODING_PREFERENCE:
+        if encoding in available and encoding not in refused and (encoding in accepted or '*' in accepted):
+            return encoding
+    return None
+
+
+def compress_body(body: bytes, encoding: str) -> bytes:
+    """Compress a response body at a level cheap enough to redo on every render"""
+    if encoding == 'br':
+        return brotli.compress(body, quality=5)
+    return gzip.compress(body, 6)
+
+
+def precompress(body: bytes) -> Dict[str, bytes]:
+    """Compressed variants of a cached body by content coding, built once when it is rendered"""
+    if len(body) < COMPRESSION_MIN_BYTES:
+        return {}
+    encodings = {'gzip': compress_body(body, 'gzip')}
+    if brotli is not None:
+        encodings['br'] = compress_body(body, 'br')
+    return encodings
+
+
+def negotiated_response(request, body: bytes, encodings: Dict[str, bytes], content_type: str,
+                        charset: Optional[str] = None, headers: Optional[Dict] = None) -> web.Response:
+    """Serve the stored variant of a cached body that the client accepts, else the body itself"""
+    headers = dict(headers or {})
+    if encodings:
+        headers['Vary'] = 'Accept-Encoding'
+    encoding = negotiate_encoding(request, encodings)
+    if encoding is not None:
+        headers['Content-Encoding'] = encoding
+        etag = headers.get('ETag')
+        if etag and not etag.startswith('W/'):
+            # The compressed bytes differ from the identity body, so the tag is only weakly equal
+            headers['ETag'] = 'W/' + etag
+        body = encodings[encoding]
+    return web.Response(body=body, content_type=content_type, charset=charset, headers=headers)
+
+
+async def handle_static(request):
+    """Serve a fingerprinted asset; the URL changes with the content, so it can be cached forever"""
+    asset = static_assets.find(request.match_info['filename'])
+    if asset is None:
+        return web.Response(status=404)
+    return asset.response(request, STATIC_CACHE_CONTROL)
+
+
+@web.middleware
+async def compression_middleware(request, handler):
+    """Compress uncached text responses (metrics, errors) for clients that accept it.
+
+    Static assets, the health page and dashboard snapshots carry their own
+    pre-compressed variants and already set Content-Encoding, so they pass through.
+    """
+    response = await handler(request)
+    if (type(response) is not web.Response or response.status == 304 or response.body is None
+            or 'Content-Encoding' in response.headers
+            or len(response.body) < COMPRESSION_MIN_BYTES
+            or not response.content_type.startswith(COMPRESSIBLE_TYPES)):
+        return response
+
+    encoding = negotiate_encoding(request, ENCODING_PREFERENCE if brotli is not None else ('gzip',))
+    if encoding is not None:
+        response.body = compress_body(response.body, encoding)
+        response.headers['Content-Encoding'] = encoding
+        etag = response.headers.get('ETag')
+        if etag and not etag.startswith('W/'):
+            # The compressed bytes differ from the identity body, so the tag is only weakly equal
+            response.headers['ETag'] = 'W/' + etag
+    response.headers['Vary'] = 'Accept-Encoding'
+    return response
+
+
 # HTML Templates
 HEALTH_PAGE = """
 <!DOCTYPE html>
@@ -1538,59 +3161,7 @@ HEALTH_PAGE = """
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Blox Fruits Bot - Health Check</title>
     <link rel="icon" type="image/x-icon" href="/favicon.ico">
-    <style>
-        * {{
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }}
-        body {{
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            background: linear-gradient(135deg, #0a1929 0%, #1a2f42 50%, #0d3a5c 100%);
-            min-height: 100vh;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            color: #fff;
-        }}
-        .container {{
-            text-align: center;
-            padding: 40px;
-            background: rgba(13, 58, 92, 0.4);
-            backdrop-filter: blur(10px);
-            border-radius: 20px;
-            border: 2px solid rgba(59, 130, 246, 0.3);
-            box-shadow: 0 8px 32px 0 rgba(0, 0, 0, 0.37);
-        }}
-        h1 {{
-            font-size: 3em;
-            margin-bottom: 20px;
-            background: linear-gradient(135deg, #3b82f6 0%, #06b6d4 100%);
-            -webkit-background-clip: text;
-            -webkit-text-fill-color: transparent;
-        }}
-        .status {{
-            display: inline-block;
-            padding: 15px 30px;
-            background: linear-gradient(135deg, #10b981 0%, #059669 100%);
-            border-radius: 25px;
-            font-size: 1.5em;
-            margin: 20px 0;
-            box-shadow: 0 0 20px rgba(16, 185, 129, 0.5);
-        }}
-        .info {{
-            margin-top: 20px;
-            font-size: 1.1em;
-            opacity: 0.9;
-        }}
-        .supabase-badge {{
-            margin-top: 20px;
-            padding: 10px 20px;
-            background: rgba(59, 130, 246, 0.2);
-            border-radius: 10px;
-            display: inline-block;
-        }}
-    </style>
+    <link rel="stylesheet" href="{health_css}">
 </head>
 <body>
     <div class="container">
@@ -1600,6 +3171,8 @@ HEALTH_PAGE = """
             <p>Uptime: {uptime}</p>
             <p>Total Rolls: {total_rolls}</p>
             <p>Active Users: {active_users}</p>
+            <p>Event Loop Lag: p50 {lag_p50} · p95 {lag_p95} · p99 {lag_p99}</p>
+            <p>Event Loop Stalls: {loop_stalls}</p>
         </div>
         <div class="supabase-badge">
             <p>🗄️ Powered by Supabase</p>
@@ -1618,187 +3191,7 @@ STATS_PAGE = """
     <title>SorynTech - Blox Fruits Stats</title>
     <link rel="icon" type="image/x-icon" href="/favicon.ico">
     <script src="https://cdn.jsdelivr.net/npm/chart.js"></script>
-    <style>
-        * {{
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }}
-        body {{
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            background: linear-gradient(135deg, #0a1929 0%, #1a2f42 50%, #0d3a5c 100%);
-            min-height: 100vh;
-            padding: 20px;
-            color: #fff;
-            position: relative;
-            overflow-x: hidden;
-        }}
-        .shark-container {{
-            position: fixed;
-            top: 0;
-            left: 0;
-            width: 100%;
-            height: 100%;
-            pointer-events: none;
-            z-index: 0;
-            overflow: hidden;
-        }}
-        .shark {{
-            position: absolute;
-            font-size: 40px;
-            opacity: 0.15;
-            animation: swim 30s linear infinite;
-        }}
-        .shark:nth-child(2) {{
-            animation-delay: 10s;
-            top: 60%;
-            animation-duration: 40s;
-        }}
-        .shark:nth-child(3) {{
-            animation-delay: 20s;
-            top: 30%;
-            animation-duration: 35s;
-        }}
-        @keyframes swim {{
-            0% {{
-                left: -100px;
-                transform: scaleX(-1);
-            }}
-            100% {{
-                left: calc(100% + 100px);
-                transform: scaleX(-1);
-            }}
-        }}
-        .container {{
-            max-width: 1400px;
-            margin: 0 auto;
-            position: relative;
-            z-index: 1;
-        }}
-        .header {{
-            text-align: center;
-            padding: 40px 20px;
-            background: rgba(13, 58, 92, 0.3);
-            border-radius: 20px;
-            border: 2px solid rgba(59, 130, 246, 0.3);
-            margin-bottom: 30px;
-            box-shadow: 0 8px 32px 0 rgba(0, 0, 0, 0.37);
-        }}
-        .header h1 {{
-            font-size: 3em;
-            margin-bottom: 10px;
-            background: linear-gradient(135deg, #3b82f6 0%, #06b6d4 100%);
-            -webkit-background-clip: text;
-            -webkit-text-fill-color: transparent;
-        }}
-        .supabase-badge {{
-            display: inline-block;
-            margin-top: 10px;
-            padding: 8px 16px;
-            background: rgba(59, 130, 246, 0.2);
-            border-radius: 15px;
-            font-size: 0.9em;
-        }}
-        .stats-grid {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
-            gap: 20px;
-            margin-bottom: 30px;
-        }}
-        .stat-card {{
-            background: rgba(13, 58, 92, 0.4);
-            backdrop-filter: blur(10px);
-            border-radius: 15px;
-            padding: 30px;
-            box-shadow: 0 8px 32px 0 rgba(0, 0, 0, 0.37);
-            border: 2px solid rgba(59, 130, 246, 0.2);
-            transition: transform 0.3s ease;
-        }}
-        .stat-card:hover {{
-            transform: translateY(-5px);
-            border-color: rgba(59, 130, 246, 0.5);
-        }}
-        .stat-icon {{
-            font-size: 2.5em;
-            margin-bottom: 15px;
-        }}
-        .stat-label {{
-            font-size: 0.9em;
-            opacity: 0.8;
-            text-transform: uppercase;
-            margin-bottom: 10px;
-            color: #94a3b8;
-        }}
-        .stat-value {{
-            font-size: 2em;
-            font-weight: bold;
-            color: #06b6d4;
-        }}
-        .chart-section {{
-            background: rgba(13, 58, 92, 0.4);
-            backdrop-filter: blur(10px);
-            border-radius: 15px;
-            padding: 30px;
-            margin-bottom: 30px;
-            box-shadow: 0 8px 32px 0 rgba(0, 0, 0, 0.37);
-            border: 2px solid rgba(59, 130, 246, 0.2);
-        }}
-        .chart-title {{
-            font-size: 1.5em;
-            margin-bottom: 20px;
-            color: #06b6d4;
-        }}
-        .chart-container {{
-            position: relative;
-            height: 400px;
-        }}
-        .users-section {{
-            background: rgba(13, 58, 92, 0.4);
-            backdrop-filter: blur(10px);
-            border-radius: 15px;
-            padding: 30px;
-            margin-bottom: 30px;
-            box-shadow: 0 8px 32px 0 rgba(0, 0, 0, 0.37);
-            border: 2px solid rgba(59, 130, 246, 0.2);
-        }}
-        .user-item {{
-            background: rgba(13, 58, 92, 0.3);
-            border-radius: 8px;
-            padding: 15px;
-            margin-bottom: 10px;
-            border: 1px solid rgba(59, 130, 246, 0.1);
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-        }}
-        .user-info {{
-            flex-grow: 1;
-        }}
-        .user-name {{
-            font-weight: bold;
-            color: #06b6d4;
-        }}
-        .user-stats {{
-            font-size: 0.9em;
-            opacity: 0.8;
-            margin-top: 5px;
-        }}
-        .next-roll {{
-            text-align: right;
-            font-size: 0.9em;
-        }}
-        .footer {{
-            text-align: center;
-            margin-top: 40px;
-            opacity: 0.8;
-            color: #94a3b8;
-        }}
-    </style>
-    <script>
-        setTimeout(function() {{
-            location.reload();
-        }}, 30000);
-    </script>
+    <link rel="stylesheet" href="{stats_css}">
 </head>
 <body>
     <div class="shark-container">
@@ -1818,25 +3211,25 @@ STATS_PAGE = """
             <div class="stat-card">
                 <div class="stat-icon">⏱️</div>
                 <div class="stat-label">Uptime</div>
-                <div class="stat-value">{uptime}</div>
+                <div class="stat-value" id="stat-uptime">{uptime}</div>
             </div>
 
             <div class="stat-card">
                 <div class="stat-icon">🎲</div>
                 <div class="stat-label">Total Rolls</div>
-                <div class="stat-value">{total_rolls}</div>
+                <div class="stat-value" id="stat-total-rolls">{total_rolls}</div>
             </div>
 
             <div class="stat-card">
                 <div class="stat-icon">👥</div>
                 <div class="stat-label">Active Users</div>
-                <div class="stat-value">{active_users}</div>
+                <div class="stat-value" id="stat-active-users">{active_users}</div>
             </div>
 
             <div class="stat-card">
                 <div class="stat-icon">🌐</div>
                 <div class="stat-label">Servers</div>
-                <div class="stat-value">{guilds_count}</div>
+                <div class="stat-value" id="stat-guilds-count">{guilds_count}</div>
             </div>
         </div>
 
@@ -1849,71 +3242,18 @@ STATS_PAGE = """
 
         <div class="users-section">
             <div class="chart-title">👥 Recent Rolls & Upcoming Notifications</div>
-            {users_list}
+            <div id="users-list"></div>
         </div>
 
         <div class="footer">
             <p>🦈 SorynTech Bot Suite | 🗄️ Supabase PostgreSQL</p>
-            <p style="margin-top: 10px; font-size: 0.9em;">Auto-refresh every 30 seconds | Last Updated: {current_time}</p>
+            <p style="margin-top: 10px; font-size: 0.9em;">Live updates every 30 seconds | Last Updated: <span id="last-updated">{current_time}</span></p>
+            <p style="margin-top: 5px; font-size: 0.8em;" id="cache-stats">User cache: {cache_hits} hits / {cache_misses} misses ({cache_hit_rate:.1f}% hit rate, {cache_size} cached)</p>
         </div>
     </div>
 
-    <script>
-        const rarityData = {rarity_data};
-
-        const ctx = document.getElementById('rarityChart').getContext('2d');
-        new Chart(ctx, {{
-            type: 'bar',
-            data: {{
-                labels: rarityData.labels,
-                datasets: [{{
-                    label: 'Number of Rolls',
-                    data: rarityData.data,
-                    backgroundColor: rarityData.colors,
-                    borderColor: rarityData.borderColors,
-                    borderWidth: 2
-                }}]
-            }},
-            options: {{
-                responsive: true,
-                maintainAspectRatio: false,
-                plugins: {{
-                    legend: {{
-                        display: false
-                    }},
-                    tooltip: {{
-                        callbacks: {{
-                            label: function(context) {{
-                                let label = context.dataset.label || '';
-                                if (label) {{
-                                    label += ': ';
-                                }}
-                                label += context.parsed.y + ' rolls';
-                                return label;
-                            }}
-                        }}
-                    }}
-                }},
-                scales: {{
-                    y: {{
-                        beginAtZero: true,
-                        grid: {{ color: 'rgba(59, 130, 246, 0.1)' }},
-                        ticks: {{ 
-                            color: '#94a3b8',
-                            stepSize: 1
-                        }}
-                    }},
-                    x: {{
-                        grid: {{ display: false }},
-                        ticks: {{ 
-                            color: '#94a3b8',
-                            font: {{ size: 14, weight: 'bold' }}
-                        }}
-                    }}
-                }}
-            }}
-        }});
-    </script>
+    <script type="application/json" id="initial-state">{initial_state}</script>
+    <script src="{stats_js}"></script>
 </body>
 </html>
 """
@@ -1927,93 +3267,7 @@ SUSPENDED_PAGE = """
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>SorynTech - Suspended Users</title>
     <link rel="icon" type="image/x-icon" href="/favicon.ico">
-    <style>
-        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
-        body {{
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            background: linear-gradient(135deg, #0a1929 0%, #1a2f42 50%, #0d3a5c 100%);
-            min-height: 100vh;
-            padding: 20px;
-            color: #fff;
-            position: relative;
-            overflow-x: hidden;
-        }}
-        .shark-container {{
-            position: fixed;
-            top: 0;
-            left: 0;
-            width: 100%;
-            height: 100%;
-            pointer-events: none;
-            z-index: 0;
-            overflow: hidden;
-        }}
-        .shark {{
-            position: absolute;
-            font-size: 40px;
-            opacity: 0.15;
-            animation: swim 30s linear infinite;
-        }}
-        .shark:nth-child(2) {{
-            animation-delay: 10s;
-            top: 60%;
-            animation-duration: 40s;
-        }}
-        .shark:nth-child(3) {{
-            animation-delay: 20s;
-            top: 30%;
-            animation-duration: 35s;
-        }}
-        @keyframes swim {{
-            0% {{ left: -100px; transform: scaleX(-1); }}
-            100% {{ left: calc(100% + 100px); transform: scaleX(-1); }}
-        }}
-        .container {{ max-width: 1400px; margin: 0 auto; position: relative; z-index: 1; }}
-        .header {{
-            text-align: center;
-            padding: 40px 20px;
-            background: rgba(13, 58, 92, 0.3);
-            border-radius: 20px;
-            border: 2px solid rgba(220, 38, 38, 0.5);
-            margin-bottom: 30px;
-            box-shadow: 0 8px 32px 0 rgba(0, 0, 0, 0.37);
-        }}
-        .header h1 {{
-            font-size: 3em;
-            margin-bottom: 10px;
-            background: linear-gradient(135deg, #dc2626 0%, #ef4444 100%);
-            -webkit-background-clip: text;
-            -webkit-text-fill-color: transparent;
-        }}
-        .stats-box {{
-            background: rgba(13, 58, 92, 0.4);
-            padding: 20px;
-            border-radius: 15px;
-            margin-bottom: 30px;
-            text-align: center;
-        }}
-        .user-card {{
-            background: rgba(13, 58, 92, 0.3);
-            border-radius: 10px;
-            padding: 20px;
-            margin-bottom: 15px;
-            border: 2px solid rgba(220, 38, 38, 0.2);
-        }}
-        .user-name {{ font-size: 1.2em; font-weight: bold; color: #ef4444; margin-bottom: 5px; }}
-        .user-id {{ font-size: 0.9em; color: #94a3b8; font-family: monospace; }}
-        .user-stats {{ margin-top: 10px; font-size: 0.9em; color: #cbd5e1; }}
-        .empty {{ text-align: center; padding: 40px; opacity: 0.7; }}
-        .nav-link {{
-            display: inline-block;
-            margin-top: 20px;
-            padding: 12px 24px;
-            background: rgba(59, 130, 246, 0.3);
-            border-radius: 10px;
-            text-decoration: none;
-            color: #06b6d4;
-            border: 1px solid rgba(59, 130, 246, 0.5);
-        }}
-    </style>
+    <link rel="stylesheet" href="{suspended_css}">
 </head>
 <body>
     <div class="shark-container">
@@ -2043,86 +3297,125 @@ SUSPENDED_PAGE = """
 """
 
 
-async def handle_health(request):
-    """Public health check endpoint"""
-    logger.debug("🏥 Health check endpoint accessed")
-    
-    uptime = "Not started"
-    if stats['bot_start_time']:
-        delta = datetime.now(timezone.utc) - stats['bot_start_time']
-        days = delta.days
-        hours, remainder = divmod(delta.seconds, 3600)
-        minutes, _ = divmod(remainder, 60)
-        uptime = f"{days}d {hours}h {minutes}m"
-
-    html = HEALTH_PAGE.format(
-        uptime=uptime,
+HEALTH_REFRESH_SECONDS = 5
+HEALTH_CACHE_CONTROL = 'no-cache'
+HEALTHZ_BODY = b'ok\n'
+health_page_bodies: Optional[Dict[Optional[str], bytes]] = None
+
+
+def refresh_health_page():
+    """Re-render the public health page, plus its compressed variants, into bytes"""
+    global health_page_bodies
+    lag = loop_watchdog.percentiles()
+    offenders = ', '.join(f"{location} ×{count}" for location, count in loop_watchdog.top_offenders(3))
+    loop_stalls = f"{loop_watchdog.stalls} ({offenders})" if offenders else str(loop_watchdog.stalls)
+    body = HEALTH_PAGE.format(
+        health_css=static_url('health.css'),
+        uptime=format_uptime(),
         total_rolls=stats['total_rolls'],
-        active_users=stats['active_users']
-    )
+        active_users=stats['active_users'],
+        lag_p50=f"{lag['p50'] * 1000:.1f}ms",
+        lag_p95=f"{lag['p95'] * 1000:.1f}ms",
+        lag_p99=f"{lag['p99'] * 1000:.1f}ms",
+        # Locations can be '<module>' or '<lambda>'
+        loop_stalls=html.escape(loop_stalls)
+    ).encode('utf-8')
+    bodies = {None: body, 'gzip': compress_body(body, 'gzip')}
+    if brotli is not None:
+        bodies['br'] = compress_body(body, 'br')
+    # Swap the whole dict so a request never sees a half-updated set
+    health_page_bodies = bodies
+
+
+@tasks.loop(seconds=HEALTH_REFRESH_SECONDS)
+async def health_page_refresher():
+    """Keep the health page current without rendering it per request"""
+    refresh_health_page()
 
-    return web.Response(text=html, content_type='text/html')
 
+async def handle_health(request):
+    """Public health check endpoint; GET and HEAD answer from the pre-rendered page.
+
+    Uptime monitors hit this constantly, so it does no formatting or logging.
+    """
+    bodies = health_page_bodies
+    if bodies is None:
+        refresh_health_page()
+        bodies = health_page_bodies
+    encoding = negotiate_encoding(request, bodies)
+    headers = {'Cache-Control': HEALTH_CACHE_CONTROL, 'Vary': 'Accept-Encoding'}
+    if encoding is not None:
+        headers['Content-Encoding'] = encoding
+    return web.Response(body=bodies[encoding], content_type='text/html', charset='utf-8', headers=headers)
+
+
+async def handle_healthz(request):
+    """Minimal liveness probe: the web server is answering"""
+    return web.Response(body=HEALTHZ_BODY, content_type='text/plain',
+                        headers={'Cache-Control': HEALTH_CACHE_CONTROL})
+
+
+def readiness_checks() -> Dict[str, bool]:
+    """Whether each part the bot needs to do its job is up"""
+    return {
+        'database': db_pool is not None and not db_pool.closed,
+        'gateway': bot.is_ready() and not bot.is_closed(),
+        'scheduler': notification_checker.is_running() and not notification_checker.failed(),
+    }
 
-async def handle_stats(request):
-    """Protected stats page"""
-    logger.debug("📊 Stats page accessed")
-    
-    if not check_auth(request):
-        logger.warning("⚠️  Unauthorized stats page access attempt")
-        return get_auth_response()
 
-    logger.info("✅ Stats page access authorized")
+async def handle_readyz(request):
+    """Readiness probe: 200 when the DB pool, gateway and reminder scheduler are all up, else 503"""
+    checks = readiness_checks()
+    ready = all(checks.values())
+    return web.json_response({'ready': ready, 'checks': checks}, status=200 if ready else 503,
+                             headers={'Cache-Control': HEALTH_CACHE_CONTROL})
 
-    # Calculate uptime
-    uptime = "Not started"
-    if stats['bot_start_time']:
-        delta = datetime.now(timezone.utc) - stats['bot_start_time']
-        days = delta.days
-        hours, remainder = divmod(delta.seconds, 3600)
-        minutes, _ = divmod(remainder, 60)
-        uptime = f"{days}d {hours}h {minutes}m"
-
-    # Get all users sorted by next roll time
-    users = get_all_users()
-    users_sorted = sorted(
-        [u for u in users if u['next_roll_time']],
-        key=lambda x: x['next_roll_time']
-    )
 
-    # Build users list HTML
-    users_html = ""
-    for user in users_sorted:
-        last_roll = user['last_roll_time']
-        next_roll = user['next_roll_time']
+def format_uptime() -> str:
+    """Bot uptime as '1d 2h 3m'"""
+    if not stats['bot_start_time']:
+        return "Not started"
+    delta = datetime.now(timezone.utc) - stats['bot_start_time']
+    hours, remainder = divmod(delta.seconds, 3600)
+    minutes, _ = divmod(remainder, 60)
+    return f"{delta.days}d {hours}h {minutes}m"
 
-        # Get their last fruit
-        rolls = get_user_rolls(user['user_id'])
-        last_fruit = rolls[0]['fruit'] if rolls else "None"
 
-        next_roll_str = f"<t:{int(next_roll.timestamp())}:R>" if next_roll else "No upcoming roll"
-        notif_status = "🔔 Enabled" if user['notifications_enabled'] else "🔕 Disabled"
+def _isoformat(value: Optional[datetime]) -> Optional[str]:
+    return value.isoformat() if value else None
 
-        users_html += f"""
-        <div class="user-item">
-            <div class="user-info">
-                <div class="user-name">{user['username']}</div>
-                <div class="user-stats">
-                    Last Roll: {last_fruit} | Total: {user['total_rolls']} | {notif_status}
-                </div>
-            </div>
-            <div class="next-roll">
-                <div style="font-weight: bold;">Next Roll</div>
-                <div>{next_roll_str}</div>
-            </div>
-        </div>
-        """
 
-    if not users_html:
-        users_html = "<p style='text-align: center; opacity: 0.7;'>No users have logged rolls yet</p>"
+async def render_stats_json() -> str:
+    """Headline numbers for /api/stats"""
+    user_count = await run_db(count_users)
+    return json.dumps({
+        'bot_start_time': _isoformat(stats['bot_start_time']),
+        'total_rolls': stats['total_rolls'],
+        'active_users': user_count,
+        'guilds_count': stats['guilds_count'],
+        'user_cache': user_cache.stats()
+    })
+
+
+async def render_users_json() -> str:
+    """Upcoming rolls with each user's last fruit for /api/users"""
+    users = await run_db(get_upcoming_rolls)
+    return json.dumps([{
+        # Discord IDs exceed JavaScript's safe integer range
+        'user_id': str(user['user_id']),
+        'username': user['username'],
+        'total_rolls': user['total_rolls'],
+        'last_fruit': user['last_fruit'],
+        'last_roll_time': _isoformat(user['last_roll_time']),
+        'next_roll_time': _isoformat(user['next_roll_time']),
+        'notifications_enabled': user['notifications_enabled']
+    } for user in users])
+
 
-    # Get rarity distribution data
-    rarity_dist = get_rarity_distribution()
+async def render_rarity_json() -> str:
+    """Chart.js-ready rarity distribution for /api/rarity"""
+    rarity_dist = await run_db(get_rarity_distribution)
 
     # Define rarity order and colors
     rarity_order = ['Common', 'Uncommon', 'Rare', 'Legendary', 'Mythic']
@@ -2159,29 +3452,246 @@ async def handle_stats(request):
         colors.append(rarity_colors_hex.get(rarity, 'rgba(128, 128, 128, 0.8)'))
         border_colors.append(rarity_border_colors.get(rarity, 'rgba(128, 128, 128, 1)'))
 
-    rarity_data = {
+    return json.dumps({
         'labels': labels,
         'data': data,
         'colors': colors,
         'borderColors': border_colors
-    }
+    })
+
+
+def _script_json(value) -> str:
+    """JSON that is safe to inline in a <script> block"""
+    return json.dumps(value).replace('</', '<\\/')
+
 
+async def render_stats_page() -> str:
+    """Build the stats dashboard shell; the page then polls the JSON API"""
+    web_logger.debug("📊 Rendering stats page")
+
+    # The page embeds the same snapshots the API serves, with their ETags, so
+    # the first poll after loading is already a 304
+    initial_state = {}
+    for key, snapshot in (('stats', stats_api_snapshot), ('users', users_api_snapshot),
+                          ('rarity', rarity_api_snapshot)):
+        body = await snapshot.get()
+        initial_state[key] = {'etag': snapshot.etag, 'data': json.loads(body)}
+
+    summary = initial_state['stats']['data']
+    cache_stats = summary['user_cache']
     html = STATS_PAGE.format(
-        uptime=uptime,
-        total_rolls=stats['total_rolls'],
-        active_users=len(users),
-        guilds_count=stats['guilds_count'],
-        users_list=users_html,
-        rarity_data=json.dumps(rarity_data),
-        current_time=datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')
+        stats_css=static_url('stats.css'),
+        stats_js=static_url('stats.js'),
+        uptime=format_uptime(),
+        total_rolls=summary['total_rolls'],
+        active_users=summary['active_users'],
+        guilds_count=summary['guilds_count'],
+        initial_state=_script_json(initial_state),
+        current_time=datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC'),
+        cache_hits=cache_stats['hits'],
+        cache_misses=cache_stats['misses'],
+        cache_hit_rate=cache_stats['hit_rate'],
+        cache_size=cache_stats['size']
+    )
+
+    return html
+
+
+async def render_suspended_page() -> str:
+    """Build the suspended users page HTML"""
+    web_logger.debug("🔒 Rendering suspended users page")
+
+    suspended_users = await run_db(get_suspended_users)
+
+    if suspended_users:
+        users_html = ""
+        for user in suspended_users:
+            last_roll = user['last_roll_time'].strftime('%Y-%m-%d %H:%M UTC') if user['last_roll_time'] else 'Never'
+            created = user['created_at'].strftime('%Y-%m-%d') if user['created_at'] else 'Unknown'
+            reason = user.get('suspension_reason', 'No reason provided')
+            
+            users_html += f"""
+            <div class="user-card">
+                <div class="user-name">🔒 {user['username']}</div>
+                <div class="user-id">User ID: {user['user_id']}</div>
+                <div class="user-stats">
+                    Total Rolls: {user['total_rolls']} | Last Roll: {last_roll} | Joined: {created}
+                </div>
+                <div style="margin-top: 8px; color: #fbbf24; font-weight: bold;">
+                    Reason: {reason if reason else 'No reason provided'}
+                </div>
+            </div>
+            """
+    else:
+        users_html = '<div class="empty">✅ No suspended users! All clear! 🎉</div>'
+
+    html = SUSPENDED_PAGE.format(
+        suspended_css=static_url('suspended.css'),
+        suspended_count=len(suspended_users),
+        users_list=users_html
     )
 
-    return web.Response(text=html, content_type='text/html')
+    return html
+
+
+class PageSnapshot:
+    """Pre-rendered copy of a dashboard page shared by every viewer.
+
+    The page is rebuilt only after a write marks it stale or ``max_age`` passes,
+    and concurrent requests for a stale page wait on a single render, which also
+    builds the compressed variants in ``encodings`` that respond() serves.
+    """
+
+    def __init__(self, name: str, render, max_age: float):
+        self.name = name
+        self.max_age = max_age
+        self._render = render
+        self._body = None
+        self.etag = None
+        self.encodings = {}
+        self._rendered_at = 0.0
+        self._stale = True
+        self._lock = asyncio.Lock()
+
+    def invalidate(self):
+        """Mark the snapshot stale; safe to call from DB executor threads"""
+        self._stale = True
+
+    def _is_fresh(self) -> bool:
+        return (self._body is not None and not self._stale
+                and time.monotonic() - self._rendered_at < self.max_age)
+
+    async def get(self) -> bytes:
+        """Return the rendered page, rebuilding it first if it is stale"""
+        if self._is_fresh():
+            return self._body
+        async with self._lock:
+            if self._is_fresh():
+                return self._body
+            # Clear the flag before rendering so writes during the render re-mark it
+            self._stale = False
+            html = await self._render()
+            self._body = html.encode('utf-8')
+            self.etag = '"' + hashlib.sha256(self._body).hexdigest()[:32] + '"'
+            self.encodings = precompress(self._body)
+            self._rendered_at = time.monotonic()
+            web_logger.debug("🖼️  Rendered %s snapshot (%s bytes)", self.name, len(self._body))
+        return self._body
+
+    async def respond(self, request, content_type: str, charset: Optional[str] = None,
+                      headers: Optional[Dict] = None) -> web.Response:
+        """The snapshot in the best encoding the client accepts"""
+        body = await self.get()
+        return negotiated_response(request, body, self.encodings, content_type, charset, headers)
+
+
+PAGE_SNAPSHOT_MAX_AGE_SECONDS = 30
+stats_page_snapshot = PageSnapshot('stats', render_stats_page, PAGE_SNAPSHOT_MAX_AGE_SECONDS)
+suspended_page_snapshot = PageSnapshot('suspended', render_suspended_page, PAGE_SNAPSHOT_MAX_AGE_SECONDS)
+stats_api_snapshot = PageSnapshot('api/stats', render_stats_json, PAGE_SNAPSHOT_MAX_AGE_SECONDS)
+users_api_snapshot = PageSnapshot('api/users', render_users_json, PAGE_SNAPSHOT_MAX_AGE_SECONDS)
+rarity_api_snapshot = PageSnapshot('api/rarity', render_rarity_json, PAGE_SNAPSHOT_MAX_AGE_SECONDS)
+page_snapshots = [stats_page_snapshot, suspended_page_snapshot,
+                  stats_api_snapshot, users_api_snapshot, rarity_api_snapshot]
+
+
+def invalidate_page_snapshots():
+    """Mark the cached dashboard pages and API responses stale after a write"""
+    for snapshot in page_snapshots:
+        snapshot.invalidate()
+
+
+def etag_matches(request, etag: str) -> bool:
+    """True if the client's If-None-Match already names this ETag"""
+    if_none_match = request.headers.get('If-None-Match')
+    if not if_none_match or not etag:
+        return False
+    # If-None-Match uses weak comparison, so a compressed W/ variant still matches
+    candidates = [candidate.strip().removeprefix('W/') for candidate in if_none_match.split(',')]
+    return '*' in candidates or etag.removeprefix('W/') in candidates
+
+
+async def serve_api_snapshot(request, snapshot: PageSnapshot):
+    """Serve a JSON snapshot with its ETag, or 304 if the client already has it"""
+    if not check_auth(request):
+        logger.warning(f"⚠️  Unauthorized {snapshot.name} access attempt")
+        return get_auth_response()
+
+    body = await snapshot.get()
+    headers = {'ETag': snapshot.etag, 'Cache-Control': 'private, no-cache'}
+    if etag_matches(request, snapshot.etag):
+        return web.Response(status=304, headers=headers)
+    return negotiated_response(request, body, snapshot.encodings, 'application/json', headers=headers)
+
+
+SSE_KEEPALIVE_SECONDS = 15
+
+
+async def handle_api_events(request):
+    """Server-Sent Events stream of rolls, reminders and suspensions for the dashboard"""
+    if not check_auth(request):
+        logger.warning("⚠️  Unauthorized api/events access attempt")
+        return get_auth_response()
+
+    response = web.StreamResponse(headers={
+        'Content-Type': 'text/event-stream',
+        'Cache-Control': 'no-cache',
+        # Stop reverse proxies from buffering the stream
+        'X-Accel-Buffering': 'no'
+    })
+    await response.prepare(request)
+    client = event_broadcaster.subscribe()
+    web_logger.debug("📡 Live events viewer connected")
+    try:
+        await response.write(b"retry: 5000\n\n")
+        while True:
+            try:
+                frame = await asyncio.wait_for(client.get(), SSE_KEEPALIVE_SECONDS)
+            except asyncio.TimeoutError:
+                frame = b": keepalive\n\n"
+            await response.write(frame)
+    except ConnectionError:
+        pass
+    finally:
+        event_broadcaster.unsubscribe(client)
+        web_logger.debug("📡 Live events viewer disconnected")
+    return response
+
+
+async def handle_api_stats(request):
+    """Headline dashboard numbers as JSON"""
+    web_logger.debug("📊 /api/stats accessed")
+    return await serve_api_snapshot(request, stats_api_snapshot)
+
+
+async def handle_api_users(request):
+    """Upcoming rolls as JSON"""
+    web_logger.debug("👥 /api/users accessed")
+    return await serve_api_snapshot(request, users_api_snapshot)
+
+
+async def handle_api_rarity(request):
+    """Rarity distribution as JSON"""
+    web_logger.debug("🍎 /api/rarity accessed")
+    return await serve_api_snapshot(request, rarity_api_snapshot)
+
+
+async def handle_stats(request):
+    """Protected stats page"""
+    web_logger.debug("📊 Stats page accessed")
+    
+    if not check_auth(request):
+        logger.warning("⚠️  Unauthorized stats page access attempt")
+        return get_auth_response()
+
+    logger.info("✅ Stats page access authorized")
+
+    return await stats_page_snapshot.respond(request, 'text/html', 'utf-8')
 
 
 async def handle_suspended(request):
     """Protected suspended users page"""
-    logger.debug("🔒 Suspended users page accessed")
+    web_logger.debug("🔒 Suspended users page accessed")
     
     if not check_auth(request):
         logger.warning("⚠️  Unauthorized suspended page access attempt")
@@ -2190,68 +3700,74 @@ async def handle_suspended(request):
     logger.info("✅ Suspended page access authorized")
 
     try:
-        suspended_users = get_suspended_users()
-        
-        if suspended_users:
-            users_html = ""
-            for user in suspended_users:
-                last_roll = user['last_roll_time'].strftime('%Y-%m-%d %H:%M UTC') if user['last_roll_time'] else 'Never'
-                created = user['created_at'].strftime('%Y-%m-%d') if user['created_at'] else 'Unknown'
-                reason = user.get('suspension_reason', 'No reason provided')
-                
-                users_html += f"""
-                <div class="user-card">
-                    <div class="user-name">🔒 {user['username']}</div>
-                    <div class="user-id">User ID: {user['user_id']}</div>
-                    <div class="user-stats">
-                        Total Rolls: {user['total_rolls']} | Last Roll: {last_roll} | Joined: {created}
-                    </div>
-                    <div style="margin-top: 8px; color: #fbbf24; font-weight: bold;">
-                        Reason: {reason if reason else 'No reason provided'}
-                    </div>
-                </div>
-                """
-        else:
-            users_html = '<div class="empty">✅ No suspended users! All clear! 🎉</div>'
-        
-        html = SUSPENDED_PAGE.format(
-            suspended_count=len(suspended_users),
-            users_list=users_html
-        )
-        
-        return web.Response(text=html, content_type='text/html')
+        return await suspended_page_snapshot.respond(request, 'text/html', 'utf-8')
     except Exception as e:
         logger.error(f"❌ Error in handle_suspended: {e}")
         return web.Response(text=f"Error: {str(e)}", status=500)
 
 
+async def handle_metrics(request):
+    """Protected Prometheus metrics endpoint"""
+    web_logger.debug("📈 Metrics endpoint accessed")
+
+    if not check_auth(request):
+        logger.warning("⚠️  Unauthorized metrics access attempt")
+        return get_auth_response()
+
+    lag = loop_watchdog.percentiles()
+    for name, quantile in (('p50', '0.5'), ('p95', '0.95'), ('p99', '0.99')):
+        event_loop_lag_quantile.set(lag[name], quantile=quantile)
+    return web.Response(text=render_metrics(), content_type='text/plain', charset='utf-8')
+
+
+@web.middleware
+async def metrics_middleware(request, handler):
+    """Record every web request's latency, labelled by route rather than raw path"""
+    started = time.perf_counter()
+    status = 500
+    try:
+        response = await handler(request)
+        status = response.status
+        return response
+    except web.HTTPException as e:
+        status = e.status
+        raise
+    finally:
+        resource = request.match_info.route.resource
+        route = resource.canonical if resource is not None else 'unmatched'
+        web_latency.observe(time.perf_counter() - started, route=route, method=request.method, status=status)
+
+
 async def handle_root(request):
-    """Root redirects to health"""
-    logger.debug("🌐 Root endpoint accessed")
+    """Root serves the health page"""
     return await handle_health(request)
 
 
 async def handle_favicon(request):
-    """Handle favicon requests"""
-    import os.path
-    favicon_path = os.path.join(os.path.dirname(__file__), 'favicon.ico')
-
-    try:
-        if os.path.exists(favicon_path):
-            with open(favicon_path, 'rb') as f:
-                favicon_data = f.read()
-            return web.Response(
-                body=favicon_data,
-                content_type='image/x-icon',
-                headers={
-                    'Cache-Control': 'public, max-age=86400'  # Cache for 1 day
-                }
-            )
-        else:
-            return web.Response(status=404)
-    except Exception as e:
-        logger.error(f"Error serving favicon: {e}")
+    """Serve the favicon from memory"""
+    asset = static_assets.get('favicon.ico')
+    if asset is None:
         return web.Response(status=404)
+    return asset.response(request, FAVICON_CACHE_CONTROL)
+
+
+def create_web_app() -> web.Application:
+    """Build the aiohttp app with its middlewares and routes"""
+    app = web.Application(middlewares=[metrics_middleware, compression_middleware])
+    app.router.add_get('/', handle_root)
+    app.router.add_get('/health', handle_health)
+    app.router.add_get('/healthz', handle_healthz)
+    app.router.add_get('/readyz', handle_readyz)
+    app.router.add_get('/stats', handle_stats)
+    app.router.add_get('/suspended', handle_suspended)
+    app.router.add_get('/favicon.ico', handle_favicon)
+    app.router.add_get('/metrics', handle_metrics)
+    app.router.add_get('/static/{filename}', handle_static)
+    app.router.add_get('/api/stats', handle_api_stats)
+    app.router.add_get('/api/users', handle_api_users)
+    app.router.add_get('/api/rarity', handle_api_rarity)
+    app.router.add_get('/api/events', handle_api_events)
+    return app
 
 
 async def start_web_server():
@@ -2260,12 +3776,7 @@ async def start_web_server():
     logger.info("🌐 STARTING WEB SERVER")
     logger.info("=" * 80)
     
-    app = web.Application()
-    app.router.add_get('/', handle_root)
-    app.router.add_get('/health', handle_health)
-    app.router.add_get('/stats', handle_stats)
-    app.router.add_get('/suspended', handle_suspended)
-    app.router.add_get('/favicon.ico', handle_favicon)
+    app = create_web_app()
 
     port = int(os.getenv('PORT', 10000))
     runner = web.AppRunner(app)
@@ -2275,17 +3786,27 @@ async def start_web_server():
 
     logger.info(f"✅ Web server started successfully on 0.0.0.0:{port}")
     logger.info(f"🏥 Health check: http://0.0.0.0:{port}/")
+    logger.info(f"🚦 Readiness: http://0.0.0.0:{port}/readyz")
     logger.info(f"📊 Stats page: http://0.0.0.0:{port}/stats (Protected)")
     logger.info(f"🔒 Suspended page: http://0.0.0.0:{port}/suspended (Protected)")
+    logger.info(f"📈 Metrics: http://0.0.0.0:{port}/metrics (Protected)")
     logger.info("=" * 80)
 
 
 async def main():
     """Main function"""
     logger.info("🚀 MAIN FUNCTION STARTING...")
-    
+
+    loop_watchdog.start()
+    event_broadcaster.start()
+    health_page_refresher.start()
+    reminder_workers.start()
     await start_web_server()
 
+    # Pool and schema are set up once here, not on every (re)connect in on_ready
+    await run_db(init_database)
+    command_usage_buffer.start()
+
     TOKEN = os.getenv('DISCORD_TOKEN')
     if not TOKEN:
         logger.critical("❌ DISCORD_TOKEN not found in .env file!")
@@ -2295,8 +3816,14 @@ async def main():
     logger.info("✅ Discord token loaded from environment")
     logger.info("🔐 Connecting to Discord...")
 
-    async with bot:
-        await bot.start(TOKEN)
+    try:
+        async with bot:
+            await bot.start(TOKEN)
+    finally:
+        # Reminder workers were drained in bot.close(), before the HTTP session closed
+        await command_usage_buffer.close()
+        health_page_refresher.cancel()
+        loop_watchdog.stop()
 
 
 if __name__ == "__main__":
@@ -2311,6 +3838,8 @@ if __name__ == "__main__":
         logger.info("=" * 80)
         logger.info("🛑 Bot shutting down gracefully...")
     finally:
+        logger.info("🧵 Shutting down database executor...")
+        db_executor.shutdown(wait=True)
         if db_pool:
             logger.info("🔌 Closing database connection pool...")
             db_pool.closeall()
@@ -0,0 +1,198 @@
+// Snapshots of /api/stats, /api/users and /api/rarity with their ETags, embedded
+// by the page; each poll sends If-None-Match and only touches the DOM on a 200
+const state = JSON.parse(document.getElementById('initial-state').textContent);
+const rarityData = state.rarity.data;
+
+function formatUptime(startIso) {
+    if (!startIso) return 'Not started';
+    const minutes = Math.floor((Date.now() - new Date(startIso)) / 60000);
+    return Math.floor(minutes / 1440) + 'd ' + Math.floor(minutes % 1440 / 60) + 'h ' + (minutes % 60) + 'm';
+}
+
+function formatNextRoll(iso) {
+    if (!iso) return 'No upcoming roll';
+    const minutes = Math.round((new Date(iso) - Date.now()) / 60000);
+    if (minutes <= 0) return 'Ready now';
+    return 'in ' + (minutes >= 60 ? Math.floor(minutes / 60) + 'h ' : '') + (minutes % 60) + 'm';
+}
+
+function renderStats(data) {
+    document.getElementById('stat-uptime').textContent = formatUptime(data.bot_start_time);
+    document.getElementById('stat-total-rolls').textContent = data.total_rolls;
+    document.getElementById('stat-active-users').textContent = data.active_users;
+    document.getElementById('stat-guilds-count').textContent = data.guilds_count;
+    const cache = data.user_cache;
+    document.getElementById('cache-stats').textContent = 'User cache: ' + cache.hits + ' hits / ' +
+        cache.misses + ' misses (' + cache.hit_rate.toFixed(1) + '% hit rate, ' + cache.size + ' cached)';
+}
+
+function renderUsers(users) {
+    const list = document.getElementById('users-list');
+    list.replaceChildren();
+    if (!users.length) {
+        const empty = document.createElement('p');
+        empty.style.cssText = 'text-align: center; opacity: 0.7;';
+        empty.textContent = 'No users have logged rolls yet';
+        list.appendChild(empty);
+        return;
+    }
+    for (const user of users) {
+        const item = document.createElement('div');
+        item.className = 'user-item';
+        item.innerHTML = '<div class="user-info"><div class="user-name"></div><div class="user-stats"></div></div>' +
+            '<div class="next-roll"><div style="font-weight: bold;">Next Roll</div><div class="next-roll-time"></div></div>';
+        item.querySelector('.user-name').textContent = user.username;
+        item.querySelector('.user-stats').textContent = 'Last Roll: ' + (user.last_fruit || 'None') +
+            ' | Total: ' + user.total_rolls + ' | ' + (user.notifications_enabled ? '🔔 Enabled' : '🔕 Disabled');
+        item.querySelector('.next-roll-time').textContent = formatNextRoll(user.next_roll_time);
+        list.appendChild(item);
+    }
+}
+
+function renderRarity(data) {
+    rarityChart.data.labels = data.labels;
+    const dataset = rarityChart.data.datasets[0];
+    dataset.data = data.data;
+    dataset.backgroundColor = data.colors;
+    dataset.borderColor = data.borderColors;
+    rarityChart.update();
+}
+
+async function poll(key, path, render) {
+    const response = await fetch(path, {
+        headers: { 'If-None-Match': state[key].etag },
+        cache: 'no-store'
+    });
+    if (response.status !== 200) return false;
+    state[key] = { etag: response.headers.get('ETag'), data: await response.json() };
+    render(state[key].data);
+    return true;
+}
+
+async function refresh() {
+    try {
+        const changed = await Promise.all([
+            poll('stats', '/api/stats', renderStats),
+            poll('users', '/api/users', renderUsers),
+            poll('rarity', '/api/rarity', renderRarity)
+        ]);
+        if (changed.some(Boolean)) {
+            document.getElementById('last-updated').textContent = new Date().toLocaleString();
+        }
+    } catch (error) {
+        console.error('Stats refresh failed', error);
+    }
+}
+
+function byNextRoll(a, b) {
+    return new Date(a.next_roll_time) - new Date(b.next_roll_time);
+}
+
+function applyRoll(roll) {
+    state.stats.data.total_rolls = roll.bot_total_rolls;
+    renderStats(state.stats.data);
+
+    const users = state.users.data.filter(user => user.user_id !== roll.user_id);
+    users.push({
+        user_id: roll.user_id,
+        username: roll.username,
+        total_rolls: roll.total_rolls,
+        last_fruit: roll.fruit,
+        last_roll_time: roll.last_roll_time,
+        next_roll_time: roll.next_roll_time,
+        notifications_enabled: roll.notifications_enabled
+    });
+    state.users.data = users.sort(byNextRoll);
+    renderUsers(state.users.data);
+
+    const index = state.rarity.data.labels.findIndex(label => label.endsWith(' ' + roll.rarity));
+    if (index !== -1) {
+        state.rarity.data.data[index] += 1;
+        renderRarity(state.rarity.data);
+    }
+    document.getElementById('last-updated').textContent = new Date().toLocaleString();
+}
+
+function applyReminder(reminder) {
+    // Sending a reminder clears next_roll_time, which drops the user from the upcoming list
+    state.users.data = state.users.data.filter(user => user.user_id !== reminder.user_id);
+    renderUsers(state.users.data);
+}
+
+// Live events replace polling while the stream is open
+let live = false;
+if (window.EventSource) {
+    const events = new EventSource('/api/events');
+    events.onopen = function() {
+        live = true;
+        refresh();  // catch up on anything missed while disconnected
+    };
+    events.onerror = function() { live = false; };
+    events.addEventListener('roll', e => applyRoll(JSON.parse(e.data)));
+    events.addEventListener('reminder', e => applyReminder(JSON.parse(e.data)));
+    events.addEventListener('suspension', refresh);
+    events.addEventListener('resync', refresh);
+}
+
+const ctx = document.getElementById('rarityChart').getContext('2d');
+const rarityChart = new Chart(ctx, {
+    type: 'bar',
+    data: {
+        labels: rarityData.labels,
+        datasets: [{
+            label: 'Number of Rolls',
+            data: rarityData.data,
+            backgroundColor: rarityData.colors,
+            borderColor: rarityData.borderColors,
+            borderWidth: 2
+        }]
+    },
+    options: {
+        responsive: true,
+        maintainAspectRatio: false,
+        plugins: {
+            legend: {
+                display: false
+            },
+            tooltip: {
+                callbacks: {
+                    label: function(context) {
+                        let label = context.dataset.label || '';
+                        if (label) {
+                            label += ': ';
+                        }
+                        label += context.parsed.y + ' rolls';
+                        return label;
+                    }
+                }
+            }
+        },
+        scales: {
+            y: {
+                beginAtZero: true,
+                grid: { color: 'rgba(59, 130, 246, 0.1)' },
+                ticks: { 
+                    color: '#94a3b8',
+                    stepSize: 1
+                }
+            },
+            x: {
+                grid: { display: false },
+                ticks: { 
+                    color: '#94a3b8',
+                    font: { size: 14, weight: 'bold' }
+                }
+            }
+        }
+    }
+});
+
+renderUsers(state.users.data);
+setInterval(function() {
+    if (!live) refresh();
+}, 30000);
+// Relative times drift even when the data hasn't changed
+setInterval(function() {
+    renderStats(state.stats.data);
+    renderUsers(state.users.data);
+}, 60000);